@@ -16,6 +16,8 @@ my_stack = ServiceStack(
     get_stack_name(),
     env=Environment(account=os.environ.get('AWS_DEFAULT_ACCOUNT', account), region=os.environ.get('AWS_DEFAULT_REGION', region)),
     is_production=True if environment == 'production' else False,
+    crud_single_function=os.getenv('CRUD_SINGLE_FUNCTION', 'false') == 'true',  # one Lambda function routes every CRUD request
+    api_cache=os.getenv('API_CACHE', 'false') == 'true',  # stage cache of the GET routes, billed by the hour
 )
 
 app.synth()
@@ -9,7 +9,7 @@ class DynamoDalHandler(DbHandler):
     def __init__(self, table_name: str):
         self.table_name = table_name
 
-    def create_product(self, product: Product) -> None:
+    def create_product(self, product: Product, idempotent: bool = False) -> None:
         entry = ProductEntry(id=product.id, name=product.name, price=product.price, created_at=1697783194)
         dynamodb = boto3.resource('dynamodb')
         table = dynamodb.Table(self.table_name)
@@ -28,4 +28,3 @@ def test_internal_server_error(table_name: str) -> None:
 
     assert response['statusCode'] == HTTPStatus.INTERNAL_SERVER_ERROR
     stubber.deactivate()
-    DynamoDbHandler._instances = {}
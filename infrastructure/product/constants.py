@@ -2,23 +2,48 @@ SERVICE_ROLE_ARN = 'ServiceRoleArn'
 LAMBDA_BASIC_EXECUTION_ROLE = 'AWSLambdaBasicExecutionRole'
 CREATE_PRODUCT_ROLE = 'ServiceRole'
 DELETE_PRODUCT_ROLE = 'DeleteRole'
+UPDATE_PRODUCT_ROLE = 'UpdateRole'
 LIST_PRODUCTS_ROLE = 'ListRole'
 GET_PRODUCT_ROLE = 'GetRole'
+BATCH_GET_PRODUCTS_ROLE = 'BatchGetRole'
+BATCH_WRITE_PRODUCTS_ROLE = 'BatchWriteRole'
+PRODUCTS_STATS_ROLE = 'StatsRole'
+EXPORT_PRODUCTS_ROLE = 'ExportRole'
+CRUD_API_ROLE = 'CrudApiRole'
 CREATE_LAMBDA = 'CreateProduct'
 DELETE_LAMBDA = 'DeleteProduct'
+UPDATE_LAMBDA = 'UpdateProduct'
 GET_LAMBDA = 'GetProduct'
 LIST_LAMBDA = 'ListProducts'
+BATCH_GET_LAMBDA = 'BatchGetProducts'
+BATCH_WRITE_LAMBDA = 'BatchWriteProducts'
+PRODUCTS_STATS_LAMBDA = 'GetProductsStats'
+EXPORT_PRODUCTS_LAMBDA = 'ExportProducts'
+CRUD_API_LAMBDA = 'CrudApi'
+CURSOR_SIGNING_SECRET = 'CursorSigningSecret'
 TABLE_NAME = 'products'
+RECENCY_INDEX_NAME = 'created_at_index'
+RECENCY_BUCKET_ATTRIBUTE = 'recency_bucket'
 IDEMPOTENCY_TABLE_NAME = 'IdempotencyTable'
+CATALOG_TABLE_NAME = 'catalog'
 TABLE_NAME_OUTPUT = 'DbOutput'
 IDEMPOTENCY_TABLE_NAME_OUTPUT = 'IdempotencyDbOutput'
+CATALOG_TABLE_NAME_OUTPUT = 'CatalogDbOutput'
 APIGATEWAY = 'Apigateway'
 PRODUCT_RESOURCE = 'product'
 MONITORING_TOPIC = 'MonitoringTopic'
 PRODUCTS_RESOURCE = 'products'
+BATCH_GET_RESOURCE = 'batch-get'
+BATCH_WRITE_RESOURCE = 'batch-write'
+STATS_RESOURCE = 'stats'
+EXPORT_RESOURCE = 'export'
 LAMBDA_LAYER_NAME = 'common'
 API_HANDLER_LAMBDA_MEMORY_SIZE = 128  # MB
 API_HANDLER_LAMBDA_TIMEOUT = 10  # seconds
+API_CACHE_CLUSTER_SIZE = '0.5'  # GB, the smallest stage cache
+# the stage cache is never flushed, changes show up once the TTL expires, a product added after its cached 404 too
+GET_PRODUCT_CACHE_TTL = 10  # seconds
+LIST_PRODUCTS_CACHE_TTL = 10  # seconds
 POWERTOOLS_SERVICE_NAME = 'POWERTOOLS_SERVICE_NAME'
 SERVICE_NAME_TAG = 'service'
 METRICS_DIMENSION_KEY = 'service'
@@ -26,6 +51,9 @@ METRICS_NAMESPACE = 'products_kpi'
 SERVICE_NAME = 'Product'
 POWERTOOLS_TRACE_DISABLED = 'POWERTOOLS_TRACE_DISABLED'
 POWER_TOOLS_LOG_LEVEL = 'LOG_LEVEL'
+LOG_DEBUG_BUFFER = 'LOG_DEBUG_BUFFER'
+LOG_INFO_SAMPLE_RATE = 'LOG_INFO_SAMPLE_RATE'
+API_HANDLER_LOG_INFO_SAMPLE_RATE = '0.1'  # info logs of one request in ten, failing requests emit all of theirs
 BUILD_FOLDER = '.build/lambdas/'
 COMMON_LAYER_BUILD_FOLDER = '.build/common_layer'
 CRUD_CONSTRUCT_NAME = 'Crud'
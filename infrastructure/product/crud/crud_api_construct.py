@@ -2,6 +2,7 @@ from aws_cdk import CfnOutput, Duration, aws_apigateway
 from aws_cdk import aws_dynamodb as dynamodb
 from aws_cdk import aws_iam as iam
 from aws_cdk import aws_lambda as _lambda
+from aws_cdk import aws_secretsmanager as secrets
 from aws_cdk.aws_lambda_python_alpha import PythonLayerVersion
 from aws_cdk.aws_logs import RetentionDays
 from constructs import Construct
@@ -12,22 +13,82 @@ from infrastructure.product.crud.crud_monitoring import CrudMonitoring
 from infrastructure.product.crud.identity_provider_construct import IdentityProviderConstruct
 from infrastructure.product.crud.waf_construct import WafToApiGatewayConstruct
 
+# request headers the responses vary on, the compressed and conditional responses must not be served to other clients
+_CACHE_KEY_HEADERS = ['method.request.header.x-consistent-read', 'method.request.header.Accept-Encoding', 'method.request.header.If-None-Match']
+# cached GET routes of the stage, with their TTL in seconds and the request parameters keying their responses
+_CACHED_ROUTES: dict[str, tuple[int, list[str]]] = {
+    '/api/product/{product}/GET': (
+        constants.GET_PRODUCT_CACHE_TTL,
+        ['method.request.path.product', 'method.request.querystring.fields', *_CACHE_KEY_HEADERS],
+    ),
+    '/api/products/GET': (
+        constants.LIST_PRODUCTS_CACHE_TTL,
+        [
+            'method.request.querystring.limit',
+            'method.request.querystring.next_token',
+            'method.request.querystring.fields',
+            'method.request.querystring.sort',
+            *_CACHE_KEY_HEADERS,
+        ],
+    ),
+}
+
 
 class CrudApiConstruct(Construct):
-    def __init__(self, scope: Construct, id_: str, lambda_layer: PythonLayerVersion, is_production: bool) -> None:
+    def __init__(
+        self,
+        scope: Construct,
+        id_: str,
+        lambda_layer: PythonLayerVersion,
+        is_production: bool,
+        single_function: bool = False,
+        api_cache: bool = False,
+    ) -> None:
+        """CRUD REST API, each route is served by its own Lambda function unless `single_function` is set.
+
+        In single function mode one function routes every request, so rarely called routes share the warm containers
+        of the busy ones. Its role holds the union of the per route permissions, each still scoped to its table.
+
+        With `api_cache` the stage caches the product and list GET responses, a cache cluster is billed by the hour. The catalog is
+        the same for every authenticated caller, so cached responses are shared between callers and only expire on their short TTL.
+        """
         super().__init__(scope, id_)
         self.api_db = ApiDbConstruct(self, f'{id_}db')
         self.common_layer = lambda_layer
+        self.api_cache = api_cache
         self.idp = IdentityProviderConstruct(self, f'{id_}users', is_production)
         self.rest_api = self._build_api_gw()
         api_resource: aws_apigateway.Resource = self.rest_api.root.add_resource('api')
         product_resource = api_resource.add_resource(constants.PRODUCT_RESOURCE).add_resource('{product}')
-        authorizer = aws_apigateway.CognitoUserPoolsAuthorizer(self, 'ProductsAuthorizer', cognito_user_pools=[self.idp.user_pool])
-        self.create_prod_func = self._add_put_product_lambda_integration(product_resource, self.api_db.db, self.api_db.idempotency_db, authorizer)
-        self.delete_prod_func = self._add_delete_product_lambda_integration(product_resource, self.api_db.db, authorizer)
-        self.get_prod_func = self._add_get_product_lambda_integration(product_resource, self.api_db.db, authorizer)
         products_resource: aws_apigateway.Resource = api_resource.add_resource(constants.PRODUCTS_RESOURCE)
-        self.list_prods_func = self._add_list_products_lambda_integration(products_resource, self.api_db.db, authorizer)
+        batch_get_resource = products_resource.add_resource(constants.BATCH_GET_RESOURCE)
+        batch_write_resource = products_resource.add_resource(constants.BATCH_WRITE_RESOURCE)
+        stats_resource = products_resource.add_resource(constants.STATS_RESOURCE)
+        export_resource = products_resource.add_resource(constants.EXPORT_RESOURCE)
+        authorizer = aws_apigateway.CognitoUserPoolsAuthorizer(self, 'ProductsAuthorizer', cognito_user_pools=[self.idp.user_pool])
+        self.cursor_signing_secret = self._build_cursor_signing_secret()
+        functions: list[_lambda.Function]
+        if single_function:
+            self.crud_api_func = self._add_crud_api_lambda_integration(
+                routes={
+                    product_resource: ['PUT', 'DELETE', 'PATCH', 'GET'],
+                    products_resource: ['GET'],
+                    batch_get_resource: ['POST'],
+                    batch_write_resource: ['POST'],
+                    stats_resource: ['GET'],
+                    export_resource: ['GET'],
+                },
+                db=self.api_db.db,
+                idempotency_table=self.api_db.idempotency_db,
+                catalog_db=self.api_db.catalog_db,
+                auth=authorizer,
+                cursor_signing_secret=self.cursor_signing_secret,
+            )
+            functions = [self.crud_api_func]
+        else:
+            functions = self._add_route_lambda_integrations(
+                product_resource, products_resource, batch_get_resource, batch_write_resource, stats_resource, export_resource, authorizer
+            )
         # add CW dashboards
         self.dashboard = CrudMonitoring(
             self,
@@ -35,25 +96,118 @@ class CrudApiConstruct(Construct):
             crud_api=self.rest_api,
             db=self.api_db.db,
             idempotency_table=self.api_db.idempotency_db,
-            functions=[self.create_prod_func, self.delete_prod_func, self.get_prod_func, self.list_prods_func],
+            functions=functions,
         )
         if is_production:
             # add WAF
             self.waf = WafToApiGatewayConstruct(self, f'{id_}waf', self.rest_api)
 
+    def _add_route_lambda_integrations(
+        self,
+        product_resource: aws_apigateway.Resource,
+        products_resource: aws_apigateway.Resource,
+        batch_get_resource: aws_apigateway.Resource,
+        batch_write_resource: aws_apigateway.Resource,
+        stats_resource: aws_apigateway.Resource,
+        export_resource: aws_apigateway.Resource,
+        authorizer: aws_apigateway.CognitoUserPoolsAuthorizer,
+    ) -> list[_lambda.Function]:
+        self.create_prod_func = self._add_put_product_lambda_integration(product_resource, self.api_db.db, self.api_db.idempotency_db, authorizer)
+        self.delete_prod_func = self._add_delete_product_lambda_integration(product_resource, self.api_db.db, authorizer)
+        self.update_prod_func = self._add_update_product_lambda_integration(product_resource, self.api_db.db, authorizer)
+        self.get_prod_func = self._add_get_product_lambda_integration(product_resource, self.api_db.db, authorizer)
+        self.list_prods_func = self._add_list_products_lambda_integration(
+            products_resource, self.api_db.db, self.api_db.catalog_db, authorizer, self.cursor_signing_secret
+        )
+        self.batch_get_prods_func = self._add_batch_get_products_lambda_integration(batch_get_resource, self.api_db.db, authorizer)
+        self.batch_write_prods_func = self._add_batch_write_products_lambda_integration(batch_write_resource, self.api_db.db, authorizer)
+        self.stats_func = self._add_products_stats_lambda_integration(stats_resource, self.api_db.db, self.api_db.catalog_db, authorizer)
+        self.export_prods_func = self._add_export_products_lambda_integration(export_resource, self.api_db.db, authorizer, self.cursor_signing_secret)
+        return [
+            self.create_prod_func,
+            self.delete_prod_func,
+            self.update_prod_func,
+            self.get_prod_func,
+            self.list_prods_func,
+            self.batch_get_prods_func,
+            self.batch_write_prods_func,
+            self.stats_func,
+            self.export_prods_func,
+        ]
+
     def _build_api_gw(self) -> aws_apigateway.RestApi:
         rest_api: aws_apigateway.RestApi = aws_apigateway.RestApi(
             self,
             constants.REST_API_NAME,
             rest_api_name='Product CRUD Rest API',
             description='This service handles /api/product requests',
-            deploy_options=aws_apigateway.StageOptions(throttling_rate_limit=2, throttling_burst_limit=10),
+            deploy_options=self._build_stage_options(),
             cloud_watch_role=False,
+            binary_media_types=['*/*'],  # API Gateway decodes the base64 gzip bodies of compressed responses for every client
         )
 
         CfnOutput(self, id=constants.APIGATEWAY, value=rest_api.url).override_logical_id(constants.APIGATEWAY)
         return rest_api
 
+    def _build_stage_options(self) -> aws_apigateway.StageOptions:
+        if not self.api_cache:
+            return aws_apigateway.StageOptions(throttling_rate_limit=2, throttling_burst_limit=10)
+        return aws_apigateway.StageOptions(
+            throttling_rate_limit=2,
+            throttling_burst_limit=10,
+            cache_cluster_enabled=True,
+            cache_cluster_size=constants.API_CACHE_CLUSTER_SIZE,
+            method_options={
+                route: aws_apigateway.MethodDeploymentOptions(
+                    caching_enabled=True,
+                    cache_ttl=Duration.seconds(ttl),
+                    cache_data_encrypted=True,
+                    # method settings replace the stage defaults, the throttling is repeated
+                    throttling_rate_limit=2,
+                    throttling_burst_limit=10,
+                )
+                for route, (ttl, _) in _CACHED_ROUTES.items()
+            },
+        )
+
+    def _get_cache_key_parameters(self, resource: aws_apigateway.Resource, http_method: str) -> list[str]:
+        # empty for routes the stage doesn't cache
+        if not self.api_cache:
+            return []
+        return _CACHED_ROUTES.get(f'{resource.path}/{http_method}', (0, []))[1]
+
+    def _get_max_age_environment(self, **routes: str) -> dict[str, str]:
+        # Cache-Control max-age of the cached routes, named by their environment variable
+        if not self.api_cache:
+            return {}
+        return {env_var: str(_CACHED_ROUTES[route][0]) for env_var, route in routes.items()}
+
+    def _add_method(
+        self,
+        resource: aws_apigateway.Resource,
+        http_method: str,
+        lambda_function: _lambda.Function,
+        auth: aws_apigateway.CognitoUserPoolsAuthorizer,
+    ) -> None:
+        # cached methods declare the request parameters their integration keys the cache on
+        cache_key_parameters = self._get_cache_key_parameters(resource, http_method)
+        resource.add_method(
+            http_method=http_method,
+            integration=aws_apigateway.LambdaIntegration(handler=lambda_function, cache_key_parameters=cache_key_parameters or None),
+            authorization_type=aws_apigateway.AuthorizationType.COGNITO,
+            authorizer=auth,
+            request_parameters={parameter: parameter.startswith('method.request.path.') for parameter in cache_key_parameters} or None,
+        )
+
+    def _build_cursor_signing_secret(self) -> secrets.Secret:
+        # signs the list products pagination tokens so clients can't forge them
+        return secrets.Secret(
+            self,
+            constants.CURSOR_SIGNING_SECRET,
+            description='Signing key for the list products pagination tokens',
+            generate_secret_string=secrets.SecretStringGenerator(exclude_punctuation=True, include_space=False, password_length=32),
+        )
+
     def _build_create_product_lambda_role(self, db: dynamodb.Table, idempotency_table: dynamodb.Table) -> iam.Role:
         return iam.Role(
             self,
@@ -105,6 +259,27 @@ class CrudApiConstruct(Construct):
             ],
         )
 
+    def _build_update_product_lambda_role(self, db: dynamodb.Table) -> iam.Role:
+        return iam.Role(
+            self,
+            constants.UPDATE_PRODUCT_ROLE,
+            assumed_by=iam.ServicePrincipal('lambda.amazonaws.com'),
+            inline_policies={
+                'dynamodb_db': iam.PolicyDocument(
+                    statements=[
+                        iam.PolicyStatement(
+                            actions=['dynamodb:UpdateItem'],
+                            resources=[db.table_arn],
+                            effect=iam.Effect.ALLOW,
+                        )
+                    ]
+                ),
+            },
+            managed_policies=[
+                iam.ManagedPolicy.from_aws_managed_policy_name(managed_policy_name=(f'service-role/{constants.LAMBDA_BASIC_EXECUTION_ROLE}'))
+            ],
+        )
+
     def _build_get_product_lambda_role(self, db: dynamodb.Table) -> iam.Role:
         return iam.Role(
             self,
@@ -126,7 +301,91 @@ class CrudApiConstruct(Construct):
             ],
         )
 
-    def _build_list_products_lambda_role(self, db: dynamodb.Table) -> iam.Role:
+    def _build_batch_get_products_lambda_role(self, db: dynamodb.Table) -> iam.Role:
+        return iam.Role(
+            self,
+            constants.BATCH_GET_PRODUCTS_ROLE,
+            assumed_by=iam.ServicePrincipal('lambda.amazonaws.com'),
+            inline_policies={
+                'dynamodb_db': iam.PolicyDocument(
+                    statements=[
+                        iam.PolicyStatement(
+                            actions=['dynamodb:BatchGetItem'],
+                            resources=[db.table_arn],
+                            effect=iam.Effect.ALLOW,
+                        )
+                    ]
+                ),
+            },
+            managed_policies=[
+                iam.ManagedPolicy.from_aws_managed_policy_name(managed_policy_name=(f'service-role/{constants.LAMBDA_BASIC_EXECUTION_ROLE}'))
+            ],
+        )
+
+    def _build_batch_write_products_lambda_role(self, db: dynamodb.Table) -> iam.Role:
+        return iam.Role(
+            self,
+            constants.BATCH_WRITE_PRODUCTS_ROLE,
+            assumed_by=iam.ServicePrincipal('lambda.amazonaws.com'),
+            inline_policies={
+                'dynamodb_db': iam.PolicyDocument(
+                    statements=[
+                        iam.PolicyStatement(
+                            actions=['dynamodb:BatchWriteItem'],
+                            resources=[db.table_arn],
+                            effect=iam.Effect.ALLOW,
+                        )
+                    ]
+                ),
+            },
+            managed_policies=[
+                iam.ManagedPolicy.from_aws_managed_policy_name(managed_policy_name=(f'service-role/{constants.LAMBDA_BASIC_EXECUTION_ROLE}'))
+            ],
+        )
+
+    def _build_products_stats_lambda_role(self, catalog_db: dynamodb.Table) -> iam.Role:
+        return iam.Role(
+            self,
+            constants.PRODUCTS_STATS_ROLE,
+            assumed_by=iam.ServicePrincipal('lambda.amazonaws.com'),
+            inline_policies={
+                'dynamodb_db': iam.PolicyDocument(
+                    statements=[
+                        iam.PolicyStatement(
+                            actions=['dynamodb:GetItem'],
+                            resources=[catalog_db.table_arn],
+                            effect=iam.Effect.ALLOW,
+                        )
+                    ]
+                ),
+            },
+            managed_policies=[
+                iam.ManagedPolicy.from_aws_managed_policy_name(managed_policy_name=(f'service-role/{constants.LAMBDA_BASIC_EXECUTION_ROLE}'))
+            ],
+        )
+
+    def _build_export_products_lambda_role(self, db: dynamodb.Table) -> iam.Role:
+        return iam.Role(
+            self,
+            constants.EXPORT_PRODUCTS_ROLE,
+            assumed_by=iam.ServicePrincipal('lambda.amazonaws.com'),
+            inline_policies={
+                'dynamodb_db': iam.PolicyDocument(
+                    statements=[
+                        iam.PolicyStatement(
+                            actions=['dynamodb:Scan'],
+                            resources=[db.table_arn],
+                            effect=iam.Effect.ALLOW,
+                        )
+                    ]
+                ),
+            },
+            managed_policies=[
+                iam.ManagedPolicy.from_aws_managed_policy_name(managed_policy_name=(f'service-role/{constants.LAMBDA_BASIC_EXECUTION_ROLE}'))
+            ],
+        )
+
+    def _build_list_products_lambda_role(self, db: dynamodb.Table, catalog_db: dynamodb.Table) -> iam.Role:
         return iam.Role(
             self,
             constants.LIST_PRODUCTS_ROLE,
@@ -138,6 +397,65 @@ class CrudApiConstruct(Construct):
                             actions=['dynamodb:Scan'],
                             resources=[db.table_arn],
                             effect=iam.Effect.ALLOW,
+                        ),
+                        iam.PolicyStatement(
+                            actions=['dynamodb:Query'],
+                            resources=[f'{db.table_arn}/index/{constants.RECENCY_INDEX_NAME}'],
+                            effect=iam.Effect.ALLOW,
+                        ),
+                        iam.PolicyStatement(
+                            actions=['dynamodb:GetItem', 'dynamodb:BatchGetItem'],  # the catalog version validates list pages
+                            resources=[catalog_db.table_arn],
+                            effect=iam.Effect.ALLOW,
+                        ),
+                    ]
+                ),
+            },
+            managed_policies=[
+                iam.ManagedPolicy.from_aws_managed_policy_name(managed_policy_name=(f'service-role/{constants.LAMBDA_BASIC_EXECUTION_ROLE}'))
+            ],
+        )
+
+    def _build_crud_api_lambda_role(self, db: dynamodb.Table, idempotency_table: dynamodb.Table, catalog_db: dynamodb.Table) -> iam.Role:
+        # union of the per route roles
+        return iam.Role(
+            self,
+            constants.CRUD_API_ROLE,
+            assumed_by=iam.ServicePrincipal('lambda.amazonaws.com'),
+            inline_policies={
+                'dynamodb_db': iam.PolicyDocument(
+                    statements=[
+                        iam.PolicyStatement(
+                            actions=[
+                                'dynamodb:PutItem',
+                                'dynamodb:DeleteItem',
+                                'dynamodb:UpdateItem',
+                                'dynamodb:GetItem',
+                                'dynamodb:Scan',
+                                'dynamodb:BatchGetItem',
+                                'dynamodb:BatchWriteItem',
+                            ],
+                            resources=[db.table_arn],
+                            effect=iam.Effect.ALLOW,
+                        ),
+                        iam.PolicyStatement(
+                            actions=['dynamodb:Query'],
+                            resources=[f'{db.table_arn}/index/{constants.RECENCY_INDEX_NAME}'],
+                            effect=iam.Effect.ALLOW,
+                        ),
+                        iam.PolicyStatement(
+                            actions=['dynamodb:GetItem', 'dynamodb:BatchGetItem'],
+                            resources=[catalog_db.table_arn],
+                            effect=iam.Effect.ALLOW,
+                        ),
+                    ]
+                ),
+                'idempotency_table': iam.PolicyDocument(
+                    statements=[
+                        iam.PolicyStatement(
+                            actions=['dynamodb:PutItem', 'dynamodb:GetItem', 'dynamodb:UpdateItem', 'dynamodb:DeleteItem'],
+                            resources=[idempotency_table.table_arn],
+                            effect=iam.Effect.ALLOW,
                         )
                     ]
                 ),
@@ -163,7 +481,9 @@ class CrudApiConstruct(Construct):
             handler='product.crud.handlers.handle_create_product.lambda_handler',
             environment={
                 constants.POWERTOOLS_SERVICE_NAME: constants.SERVICE_NAME,  # for logger, tracer and metrics
-                constants.POWER_TOOLS_LOG_LEVEL: 'DEBUG',  # for logger
+                constants.POWER_TOOLS_LOG_LEVEL: 'INFO',  # for logger
+                constants.LOG_DEBUG_BUFFER: 'true',  # debug logs are only emitted by failing invocations
+                constants.LOG_INFO_SAMPLE_RATE: constants.API_HANDLER_LOG_INFO_SAMPLE_RATE,
                 'TABLE_NAME': db.table_name,
                 'IDEMPOTENCY_TABLE_NAME': idempotency_table.table_name,
             },
@@ -202,7 +522,9 @@ class CrudApiConstruct(Construct):
             handler='product.crud.handlers.handle_delete_product.lambda_handler',
             environment={
                 constants.POWERTOOLS_SERVICE_NAME: constants.SERVICE_NAME,  # for logger, tracer and metrics
-                constants.POWER_TOOLS_LOG_LEVEL: 'DEBUG',  # for logger
+                constants.POWER_TOOLS_LOG_LEVEL: 'INFO',  # for logger
+                constants.LOG_DEBUG_BUFFER: 'true',  # debug logs are only emitted by failing invocations
+                constants.LOG_INFO_SAMPLE_RATE: constants.API_HANDLER_LOG_INFO_SAMPLE_RATE,
                 'TABLE_NAME': db.table_name,
             },
             tracing=_lambda.Tracing.ACTIVE,
@@ -225,22 +547,24 @@ class CrudApiConstruct(Construct):
         )
         return lambda_function
 
-    def _add_get_product_lambda_integration(
+    def _add_update_product_lambda_integration(
         self,
         resource: aws_apigateway.Resource,
         db: dynamodb.Table,
         auth: aws_apigateway.CognitoUserPoolsAuthorizer,
     ) -> _lambda.Function:
-        role = self._build_get_product_lambda_role(db)
+        role = self._build_update_product_lambda_role(db)
         lambda_function = _lambda.Function(
             self,
-            constants.GET_LAMBDA,
+            constants.UPDATE_LAMBDA,
             runtime=_lambda.Runtime.PYTHON_3_13,
             code=_lambda.Code.from_asset(constants.BUILD_FOLDER),
-            handler='product.crud.handlers.handle_get_product.lambda_handler',
+            handler='product.crud.handlers.handle_update_product.lambda_handler',
             environment={
                 constants.POWERTOOLS_SERVICE_NAME: constants.SERVICE_NAME,  # for logger, tracer and metrics
-                constants.POWER_TOOLS_LOG_LEVEL: 'DEBUG',  # for logger
+                constants.POWER_TOOLS_LOG_LEVEL: 'INFO',  # for logger
+                constants.LOG_DEBUG_BUFFER: 'true',  # debug logs are only emitted by failing invocations
+                constants.LOG_INFO_SAMPLE_RATE: constants.API_HANDLER_LOG_INFO_SAMPLE_RATE,
                 'TABLE_NAME': db.table_name,
             },
             tracing=_lambda.Tracing.ACTIVE,
@@ -254,22 +578,62 @@ class CrudApiConstruct(Construct):
             system_log_level=_lambda.SystemLogLevel.INFO.value,
         )
 
-        # GET /api/product/{product}/
+        # PATCH /api/product/{product}/
         resource.add_method(
-            http_method='GET',
+            http_method='PATCH',
             integration=aws_apigateway.LambdaIntegration(handler=lambda_function),
             authorization_type=aws_apigateway.AuthorizationType.COGNITO,
             authorizer=auth,
         )
         return lambda_function
 
+    def _add_get_product_lambda_integration(
+        self,
+        resource: aws_apigateway.Resource,
+        db: dynamodb.Table,
+        auth: aws_apigateway.CognitoUserPoolsAuthorizer,
+    ) -> _lambda.Function:
+        role = self._build_get_product_lambda_role(db)
+        lambda_function = _lambda.Function(
+            self,
+            constants.GET_LAMBDA,
+            runtime=_lambda.Runtime.PYTHON_3_13,
+            code=_lambda.Code.from_asset(constants.BUILD_FOLDER),
+            handler='product.crud.handlers.handle_get_product.lambda_handler',
+            environment={
+                constants.POWERTOOLS_SERVICE_NAME: constants.SERVICE_NAME,  # for logger, tracer and metrics
+                constants.POWER_TOOLS_LOG_LEVEL: 'INFO',  # for logger
+                constants.LOG_DEBUG_BUFFER: 'true',  # debug logs are only emitted by failing invocations
+                constants.LOG_INFO_SAMPLE_RATE: constants.API_HANDLER_LOG_INFO_SAMPLE_RATE,
+                'TABLE_NAME': db.table_name,
+                'CONSISTENT_READ': 'false',  # product pages tolerate sub-second staleness, clients can send x-consistent-read: true
+                **self._get_max_age_environment(GET_PRODUCT_MAX_AGE_SECONDS='/api/product/{product}/GET'),
+            },
+            tracing=_lambda.Tracing.ACTIVE,
+            retry_attempts=0,
+            timeout=Duration.seconds(constants.API_HANDLER_LAMBDA_TIMEOUT),
+            memory_size=constants.API_HANDLER_LAMBDA_MEMORY_SIZE,
+            layers=[self.common_layer],
+            role=role,
+            log_retention=RetentionDays.ONE_DAY,
+            log_format=_lambda.LogFormat.JSON.value,
+            system_log_level=_lambda.SystemLogLevel.INFO.value,
+        )
+
+        # GET /api/product/{product}/
+        self._add_method(resource, 'GET', lambda_function, auth)
+        return lambda_function
+
     def _add_list_products_lambda_integration(
         self,
         api_resource: aws_apigateway.Resource,
         db: dynamodb.Table,
+        catalog_db: dynamodb.Table,
         auth: aws_apigateway.CognitoUserPoolsAuthorizer,
+        cursor_signing_secret: secrets.Secret,
     ) -> _lambda.Function:
-        role = self._build_list_products_lambda_role(db)
+        role = self._build_list_products_lambda_role(db, catalog_db)
+        cursor_signing_secret.grant_read(role)
         lambda_function = _lambda.Function(
             self,
             constants.LIST_LAMBDA,
@@ -278,8 +642,16 @@ class CrudApiConstruct(Construct):
             handler='product.crud.handlers.handle_list_products.lambda_handler',
             environment={
                 constants.POWERTOOLS_SERVICE_NAME: constants.SERVICE_NAME,  # for logger, tracer and metrics
-                constants.POWER_TOOLS_LOG_LEVEL: 'DEBUG',  # for logger
+                constants.POWER_TOOLS_LOG_LEVEL: 'INFO',  # for logger
+                constants.LOG_DEBUG_BUFFER: 'true',  # debug logs are only emitted by failing invocations
+                constants.LOG_INFO_SAMPLE_RATE: constants.API_HANDLER_LOG_INFO_SAMPLE_RATE,
                 'TABLE_NAME': db.table_name,
+                # the key is read once per container, it never shows in the template or the function configuration
+                'CURSOR_SIGNING_SECRET_ARN': cursor_signing_secret.secret_arn,
+                'PREFETCH_NEXT_PAGE': 'true',
+                'CONSISTENT_READ': 'false',  # catalog pages tolerate sub-second staleness, clients can send x-consistent-read: true
+                'CATALOG_TABLE_NAME': catalog_db.table_name,  # eventually consistent pages are served from the catalog snapshot
+                **self._get_max_age_environment(LIST_PRODUCTS_MAX_AGE_SECONDS='/api/products/GET'),
             },
             tracing=_lambda.Tracing.ACTIVE,
             retry_attempts=0,
@@ -293,11 +665,218 @@ class CrudApiConstruct(Construct):
         )
 
         # GET /api/products/
-        api_resource.add_method(
+        self._add_method(api_resource, 'GET', lambda_function, auth)
+
+        return lambda_function
+
+    def _add_batch_get_products_lambda_integration(
+        self,
+        resource: aws_apigateway.Resource,
+        db: dynamodb.Table,
+        auth: aws_apigateway.CognitoUserPoolsAuthorizer,
+    ) -> _lambda.Function:
+        role = self._build_batch_get_products_lambda_role(db)
+        lambda_function = _lambda.Function(
+            self,
+            constants.BATCH_GET_LAMBDA,
+            runtime=_lambda.Runtime.PYTHON_3_13,
+            code=_lambda.Code.from_asset(constants.BUILD_FOLDER),
+            handler='product.crud.handlers.handle_batch_get_products.lambda_handler',
+            environment={
+                constants.POWERTOOLS_SERVICE_NAME: constants.SERVICE_NAME,  # for logger, tracer and metrics
+                constants.POWER_TOOLS_LOG_LEVEL: 'INFO',  # for logger
+                constants.LOG_DEBUG_BUFFER: 'true',  # debug logs are only emitted by failing invocations
+                constants.LOG_INFO_SAMPLE_RATE: constants.API_HANDLER_LOG_INFO_SAMPLE_RATE,
+                'TABLE_NAME': db.table_name,
+            },
+            tracing=_lambda.Tracing.ACTIVE,
+            retry_attempts=0,
+            timeout=Duration.seconds(constants.API_HANDLER_LAMBDA_TIMEOUT),
+            memory_size=constants.API_HANDLER_LAMBDA_MEMORY_SIZE,
+            layers=[self.common_layer],
+            role=role,
+            log_retention=RetentionDays.ONE_DAY,
+            log_format=_lambda.LogFormat.JSON.value,
+            system_log_level=_lambda.SystemLogLevel.INFO.value,
+        )
+
+        # POST /api/products/batch-get/
+        resource.add_method(
+            http_method='POST',
+            integration=aws_apigateway.LambdaIntegration(handler=lambda_function),
+            authorization_type=aws_apigateway.AuthorizationType.COGNITO,
+            authorizer=auth,
+        )
+        return lambda_function
+
+    def _add_batch_write_products_lambda_integration(
+        self,
+        resource: aws_apigateway.Resource,
+        db: dynamodb.Table,
+        auth: aws_apigateway.CognitoUserPoolsAuthorizer,
+    ) -> _lambda.Function:
+        role = self._build_batch_write_products_lambda_role(db)
+        lambda_function = _lambda.Function(
+            self,
+            constants.BATCH_WRITE_LAMBDA,
+            runtime=_lambda.Runtime.PYTHON_3_13,
+            code=_lambda.Code.from_asset(constants.BUILD_FOLDER),
+            handler='product.crud.handlers.handle_batch_write_products.lambda_handler',
+            environment={
+                constants.POWERTOOLS_SERVICE_NAME: constants.SERVICE_NAME,  # for logger, tracer and metrics
+                constants.POWER_TOOLS_LOG_LEVEL: 'INFO',  # for logger
+                constants.LOG_DEBUG_BUFFER: 'true',  # debug logs are only emitted by failing invocations
+                constants.LOG_INFO_SAMPLE_RATE: constants.API_HANDLER_LOG_INFO_SAMPLE_RATE,
+                'TABLE_NAME': db.table_name,
+            },
+            tracing=_lambda.Tracing.ACTIVE,
+            retry_attempts=0,
+            timeout=Duration.seconds(constants.API_HANDLER_LAMBDA_TIMEOUT),
+            memory_size=constants.API_HANDLER_LAMBDA_MEMORY_SIZE,
+            layers=[self.common_layer],
+            role=role,
+            log_retention=RetentionDays.ONE_DAY,
+            log_format=_lambda.LogFormat.JSON.value,
+            system_log_level=_lambda.SystemLogLevel.INFO.value,
+        )
+
+        # POST /api/products/batch-write/
+        resource.add_method(
+            http_method='POST',
+            integration=aws_apigateway.LambdaIntegration(handler=lambda_function),
+            authorization_type=aws_apigateway.AuthorizationType.COGNITO,
+            authorizer=auth,
+        )
+        return lambda_function
+
+    def _add_products_stats_lambda_integration(
+        self,
+        resource: aws_apigateway.Resource,
+        db: dynamodb.Table,
+        catalog_db: dynamodb.Table,
+        auth: aws_apigateway.CognitoUserPoolsAuthorizer,
+    ) -> _lambda.Function:
+        role = self._build_products_stats_lambda_role(catalog_db)
+        lambda_function = _lambda.Function(
+            self,
+            constants.PRODUCTS_STATS_LAMBDA,
+            runtime=_lambda.Runtime.PYTHON_3_13,
+            code=_lambda.Code.from_asset(constants.BUILD_FOLDER),
+            handler='product.crud.handlers.handle_get_products_stats.lambda_handler',
+            environment={
+                constants.POWERTOOLS_SERVICE_NAME: constants.SERVICE_NAME,  # for logger, tracer and metrics
+                constants.POWER_TOOLS_LOG_LEVEL: 'INFO',  # for logger
+                constants.LOG_DEBUG_BUFFER: 'true',  # debug logs are only emitted by failing invocations
+                constants.LOG_INFO_SAMPLE_RATE: constants.API_HANDLER_LOG_INFO_SAMPLE_RATE,
+                'TABLE_NAME': db.table_name,
+                'CATALOG_TABLE_NAME': catalog_db.table_name,  # statistics are maintained by the stream processor
+            },
+            tracing=_lambda.Tracing.ACTIVE,
+            retry_attempts=0,
+            timeout=Duration.seconds(constants.API_HANDLER_LAMBDA_TIMEOUT),
+            memory_size=constants.API_HANDLER_LAMBDA_MEMORY_SIZE,
+            layers=[self.common_layer],
+            role=role,
+            log_retention=RetentionDays.ONE_DAY,
+            log_format=_lambda.LogFormat.JSON.value,
+            system_log_level=_lambda.SystemLogLevel.INFO.value,
+        )
+
+        # GET /api/products/stats/
+        resource.add_method(
             http_method='GET',
             integration=aws_apigateway.LambdaIntegration(handler=lambda_function),
             authorization_type=aws_apigateway.AuthorizationType.COGNITO,
             authorizer=auth,
         )
+        return lambda_function
+
+    def _add_export_products_lambda_integration(
+        self,
+        resource: aws_apigateway.Resource,
+        db: dynamodb.Table,
+        auth: aws_apigateway.CognitoUserPoolsAuthorizer,
+        cursor_signing_secret: secrets.Secret,
+    ) -> _lambda.Function:
+        role = self._build_export_products_lambda_role(db)
+        cursor_signing_secret.grant_read(role)
+        lambda_function = _lambda.Function(
+            self,
+            constants.EXPORT_PRODUCTS_LAMBDA,
+            runtime=_lambda.Runtime.PYTHON_3_13,
+            code=_lambda.Code.from_asset(constants.BUILD_FOLDER),
+            handler='product.crud.handlers.handle_export_products.lambda_handler',
+            environment={
+                constants.POWERTOOLS_SERVICE_NAME: constants.SERVICE_NAME,  # for logger, tracer and metrics
+                constants.POWER_TOOLS_LOG_LEVEL: 'INFO',  # for logger
+                constants.LOG_DEBUG_BUFFER: 'true',  # debug logs are only emitted by failing invocations
+                constants.LOG_INFO_SAMPLE_RATE: constants.API_HANDLER_LOG_INFO_SAMPLE_RATE,
+                'TABLE_NAME': db.table_name,
+                # the key is read once per container, it never shows in the template or the function configuration
+                'CURSOR_SIGNING_SECRET_ARN': cursor_signing_secret.secret_arn,
+                'CONSISTENT_READ': 'false',  # an export scans the whole table, eventually consistent reads cost half
+            },
+            tracing=_lambda.Tracing.ACTIVE,
+            retry_attempts=0,
+            timeout=Duration.seconds(constants.API_HANDLER_LAMBDA_TIMEOUT),
+            memory_size=constants.API_HANDLER_LAMBDA_MEMORY_SIZE,
+            layers=[self.common_layer],
+            role=role,
+            log_retention=RetentionDays.ONE_DAY,
+            log_format=_lambda.LogFormat.JSON.value,
+            system_log_level=_lambda.SystemLogLevel.INFO.value,
+        )
+
+        # GET /api/products/export/
+        self._add_method(resource, 'GET', lambda_function, auth)
+        return lambda_function
+
+    def _add_crud_api_lambda_integration(
+        self,
+        routes: dict[aws_apigateway.Resource, list[str]],
+        db: dynamodb.Table,
+        idempotency_table: dynamodb.Table,
+        catalog_db: dynamodb.Table,
+        auth: aws_apigateway.CognitoUserPoolsAuthorizer,
+        cursor_signing_secret: secrets.Secret,
+    ) -> _lambda.Function:
+        role = self._build_crud_api_lambda_role(db, idempotency_table, catalog_db)
+        cursor_signing_secret.grant_read(role)
+        lambda_function = _lambda.Function(
+            self,
+            constants.CRUD_API_LAMBDA,
+            runtime=_lambda.Runtime.PYTHON_3_13,
+            code=_lambda.Code.from_asset(constants.BUILD_FOLDER),
+            handler='product.crud.handlers.handle_crud_api.lambda_handler',
+            environment={
+                constants.POWERTOOLS_SERVICE_NAME: constants.SERVICE_NAME,  # for logger, tracer and metrics
+                constants.POWER_TOOLS_LOG_LEVEL: 'INFO',  # for logger
+                constants.LOG_DEBUG_BUFFER: 'true',  # debug logs are only emitted by failing invocations
+                constants.LOG_INFO_SAMPLE_RATE: constants.API_HANDLER_LOG_INFO_SAMPLE_RATE,
+                'TABLE_NAME': db.table_name,
+                'IDEMPOTENCY_TABLE_NAME': idempotency_table.table_name,
+                # the key is read once per container, it never shows in the template or the function configuration
+                'CURSOR_SIGNING_SECRET_ARN': cursor_signing_secret.secret_arn,
+                'PREFETCH_NEXT_PAGE': 'true',
+                'CONSISTENT_READ': 'false',  # product and catalog pages tolerate sub-second staleness, clients can send x-consistent-read: true
+                'CATALOG_TABLE_NAME': catalog_db.table_name,
+                **self._get_max_age_environment(
+                    GET_PRODUCT_MAX_AGE_SECONDS='/api/product/{product}/GET', LIST_PRODUCTS_MAX_AGE_SECONDS='/api/products/GET'
+                ),
+            },
+            tracing=_lambda.Tracing.ACTIVE,
+            retry_attempts=0,
+            timeout=Duration.seconds(constants.API_HANDLER_LAMBDA_TIMEOUT),
+            memory_size=constants.API_HANDLER_LAMBDA_MEMORY_SIZE,
+            layers=[self.common_layer],
+            role=role,
+            log_retention=RetentionDays.ONE_DAY,
+            log_format=_lambda.LogFormat.JSON.value,
+            system_log_level=_lambda.SystemLogLevel.INFO.value,
+        )
 
+        # every route of the API, the function routes requests by method and path
+        for resource, http_methods in routes.items():
+            for http_method in http_methods:
+                self._add_method(resource, http_method, lambda_function, auth)
         return lambda_function
@@ -11,6 +11,7 @@ class ApiDbConstruct(Construct):
 
         self.db: dynamodb.Table = self._build_db(id_)
         self.idempotency_db: dynamodb.Table = self._build_idempotency_table(id_)
+        self.catalog_db: dynamodb.Table = self._build_catalog_table(id_)
 
     def _build_idempotency_table(self, id_: str) -> dynamodb.Table:
         table_id = f'{id_}{constants.IDEMPOTENCY_TABLE_NAME}'
@@ -29,6 +30,23 @@ class ApiDbConstruct(Construct):
         )
         return table
 
+    def _build_catalog_table(self, id_: str) -> dynamodb.Table:
+        # catalog snapshot maintained by the stream processor, a fixed number of items holding every product.
+        # Markers of the stream batches applied to the statistics expire with the stream records
+        table_id = f'{id_}{constants.CATALOG_TABLE_NAME}'
+        table = dynamodb.Table(
+            self,
+            table_id,
+            table_name=table_id,
+            partition_key=dynamodb.Attribute(name='shard', type=dynamodb.AttributeType.NUMBER),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            removal_policy=RemovalPolicy.DESTROY,
+            time_to_live_attribute='expires_at',
+            point_in_time_recovery=True,
+        )
+        CfnOutput(self, id=constants.CATALOG_TABLE_NAME_OUTPUT, value=table.table_name).override_logical_id(constants.CATALOG_TABLE_NAME_OUTPUT)
+        return table
+
     def _build_db(self, id_prefix: str) -> dynamodb.Table:
         table_id = f'{id_prefix}{constants.TABLE_NAME}'
         table = dynamodb.Table(
@@ -41,5 +59,13 @@ class ApiDbConstruct(Construct):
             removal_policy=RemovalPolicy.DESTROY,
             stream=dynamodb.StreamViewType.NEW_AND_OLD_IMAGES,  # Enable stream and set stream type,
         )
+        # lists newest products first. The partition key is a small bucket number derived from the product id,
+        # so new product writes are spread over several index partitions instead of a single hot one
+        table.add_global_secondary_index(
+            index_name=constants.RECENCY_INDEX_NAME,
+            partition_key=dynamodb.Attribute(name=constants.RECENCY_BUCKET_ATTRIBUTE, type=dynamodb.AttributeType.NUMBER),
+            sort_key=dynamodb.Attribute(name='created_at', type=dynamodb.AttributeType.NUMBER),
+            projection_type=dynamodb.ProjectionType.ALL,
+        )
         CfnOutput(self, id=constants.TABLE_NAME_OUTPUT, value=table.table_name).override_logical_id(constants.TABLE_NAME_OUTPUT)
         return table
@@ -12,7 +12,7 @@ from infrastructure.product.stream_processor.stream_processor_testing.stream_pro
 
 
 class ServiceStack(Stack):
-    def __init__(self, scope: Construct, id: str, is_production: bool, **kwargs) -> None:
+    def __init__(self, scope: Construct, id: str, is_production: bool, crud_single_function: bool = False, api_cache: bool = False, **kwargs) -> None:
         super().__init__(scope, id, **kwargs)
         self._add_stack_tags()
         self.shared_layer = self._build_common_lambda_layer(id)
@@ -22,6 +22,8 @@ class ServiceStack(Stack):
             id_=get_construct_name(id, constants.CRUD_CONSTRUCT_NAME),
             lambda_layer=self.shared_layer,
             is_production=is_production,
+            single_function=crud_single_function,
+            api_cache=api_cache,
         )
 
         self.stream_processor = StreamProcessorConstruct(
@@ -29,6 +31,7 @@ class ServiceStack(Stack):
             id_=get_construct_name(id, constants.STREAM_PROCESSOR_CONSTRUCT_NAME),
             lambda_layer=self.shared_layer,
             dynamodb_table=self.api.api_db.db,
+            catalog_table=self.api.api_db.catalog_db,
         )
 
         # deploy testing construct only in non production accounts
@@ -13,20 +13,22 @@ import infrastructure.product.constants as constants
 
 
 class StreamProcessorConstruct(Construct):
-    def __init__(self, scope: Construct, id_: str, lambda_layer: PythonLayerVersion, dynamodb_table: dynamodb.Table) -> None:
+    def __init__(
+        self, scope: Construct, id_: str, lambda_layer: PythonLayerVersion, dynamodb_table: dynamodb.Table, catalog_table: dynamodb.Table
+    ) -> None:
         super().__init__(scope, id_)
         self.id_ = id_
         bus_name = f'{id_}{constants.STREAM_PROCESSOR_EVENT_BUS_NAME}'
         self.event_bus = events.EventBus(self, bus_name, event_bus_name=bus_name)
-        self.role = self._build_lambda_role(db=dynamodb_table, bus=self.event_bus)
-        self.lambda_function = self._build_stream_processor_lambda(self.role, lambda_layer, dynamodb_table, self.event_bus)
+        self.role = self._build_lambda_role(db=dynamodb_table, bus=self.event_bus, catalog_db=catalog_table)
+        self.lambda_function = self._build_stream_processor_lambda(self.role, lambda_layer, dynamodb_table, self.event_bus, catalog_table)
         self._add_monitoring_dashboard(self.lambda_function)
 
         CfnOutput(self, id=constants.STREAM_PROCESSOR_TEST_EVENT_BUS_NAME_OUTPUT, value=self.event_bus.event_bus_name).override_logical_id(
             constants.STREAM_PROCESSOR_TEST_EVENT_BUS_NAME_OUTPUT
         )
 
-    def _build_lambda_role(self, db: dynamodb.Table, bus: events.EventBus) -> iam.Role:
+    def _build_lambda_role(self, db: dynamodb.Table, bus: events.EventBus, catalog_db: dynamodb.Table) -> iam.Role:
         return iam.Role(
             self,
             id=constants.STREAM_PROCESSOR_LAMBDA_SERVICE_ROLE_ARN,
@@ -41,6 +43,15 @@ class StreamProcessorConstruct(Construct):
                         )
                     ]
                 ),
+                'catalog_db': iam.PolicyDocument(
+                    statements=[
+                        iam.PolicyStatement(
+                            actions=['dynamodb:UpdateItem', 'dynamodb:GetItem'],
+                            resources=[catalog_db.table_arn],
+                            effect=iam.Effect.ALLOW,
+                        )
+                    ]
+                ),
                 'event_bus': iam.PolicyDocument(
                     statements=[
                         iam.PolicyStatement(
@@ -57,7 +68,12 @@ class StreamProcessorConstruct(Construct):
         )
 
     def _build_stream_processor_lambda(
-        self, role: iam.Role, lambda_layer: PythonLayerVersion, dynamodb_table: dynamodb.Table, bus: events.EventBus
+        self,
+        role: iam.Role,
+        lambda_layer: PythonLayerVersion,
+        dynamodb_table: dynamodb.Table,
+        bus: events.EventBus,
+        catalog_table: dynamodb.Table,
     ) -> _lambda.Function:
         lambda_function = _lambda.Function(
             self,
@@ -67,9 +83,11 @@ class StreamProcessorConstruct(Construct):
             handler='product.stream_processor.handlers.process_stream.process_stream',
             environment={
                 constants.POWERTOOLS_SERVICE_NAME: constants.SERVICE_NAME,  # for logger, tracer and metrics
-                constants.POWER_TOOLS_LOG_LEVEL: 'DEBUG',  # for logger
+                constants.POWER_TOOLS_LOG_LEVEL: 'INFO',  # for logger
+                constants.LOG_DEBUG_BUFFER: 'true',  # debug logs, and the batch itself, are only emitted by failing batches
                 'EVENT_BUS': bus.event_bus_name,
                 'EVENT_SOURCE': constants.STREAM_PROCESSOR_EVENT_SOURCE_NAME,
+                'CATALOG_TABLE_NAME': catalog_table.table_name,
             },
             tracing=_lambda.Tracing.ACTIVE,
             retry_attempts=0,
@@ -103,7 +121,16 @@ class StreamProcessorConstruct(Construct):
             label='matched events',
             period=Duration.days(1),
         )
-        group = CustomMetricGroup(metrics=[event_bridge_events], title='Daily Streaming Stats')
+        # catalog snapshot items that ran out of space, lists read the table until the snapshot is rebuilt
+        catalog_shard_overflows = metric_factory.create_metric(
+            metric_name='CatalogShardOverflows',
+            namespace=constants.METRICS_NAMESPACE,
+            statistic=MetricStatistic.SUM,
+            dimensions_map={constants.METRICS_DIMENSION_KEY: constants.SERVICE_NAME},
+            label='catalog shard overflows',
+            period=Duration.days(1),
+        )
+        group = CustomMetricGroup(metrics=[event_bridge_events, catalog_shard_overflows], title='Daily Streaming Stats')
         low_level_facade.monitor_custom(
             metric_groups=[group], human_readable_name='Daily Streaming Stats', alarm_friendly_name='Daily Streaming Stats'
         )
@@ -0,0 +1,118 @@
+"""Registry of AWS clients shared by every module of a Lambda container.
+
+Clients are created once per container, all from a single boto3 session and with the same tuned botocore configuration.
+Call `prime_clients` at module level of a handler so the clients are created, and their first connection is opened,
+during the Lambda init phase instead of during the first invocation.
+"""
+
+import os
+import threading
+from typing import TYPE_CHECKING, Literal, Optional
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+
+from product.constants import (
+    AWS_CLIENT_CONNECT_TIMEOUT_SECONDS,
+    AWS_CLIENT_MAX_ATTEMPTS,
+    AWS_CLIENT_MAX_POOL_CONNECTIONS,
+    AWS_CLIENT_READ_TIMEOUT_SECONDS,
+    AWS_LAMBDA_FUNCTION_NAME_ENV,
+)
+from product.observability import logger
+
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb import DynamoDBServiceResource
+    from mypy_boto3_events import EventBridgeClient
+
+PrimedService = Literal['dynamodb', 'events']
+
+CLIENT_CONFIG = Config(
+    connect_timeout=AWS_CLIENT_CONNECT_TIMEOUT_SECONDS,
+    read_timeout=AWS_CLIENT_READ_TIMEOUT_SECONDS,
+    retries={'mode': 'standard', 'max_attempts': AWS_CLIENT_MAX_ATTEMPTS},
+    max_pool_connections=AWS_CLIENT_MAX_POOL_CONNECTIONS,
+    tcp_keepalive=True,  # connections are reused across invocations, keep idle ones alive while the container is frozen
+)
+
+# boto3 sessions are not thread safe, clients are created under a lock. Clients themselves are thread safe, resources are not
+_lock = threading.Lock()
+_session: Optional[boto3.session.Session] = None
+_dynamodb_resource: Optional['DynamoDBServiceResource'] = None
+_events_client: Optional['EventBridgeClient'] = None
+
+
+def _get_session() -> boto3.session.Session:
+    global _session
+    if _session is None:
+        _session = boto3.session.Session()
+    return _session
+
+
+def get_dynamodb_resource() -> 'DynamoDBServiceResource':
+    """Returns the container wide DynamoDB resource, to be used from the main thread only.
+
+    Returns
+    -------
+    DynamoDBServiceResource
+        DynamoDB boto3 resource created on first use
+    """
+    global _dynamodb_resource
+    with _lock:
+        if _dynamodb_resource is None:
+            logger.debug('creating dynamodb resource')
+            _dynamodb_resource = _get_session().resource('dynamodb', config=CLIENT_CONFIG)
+        return _dynamodb_resource
+
+
+def new_dynamodb_resource() -> 'DynamoDBServiceResource':
+    """Creates a DynamoDB resource for a worker thread, boto3 resources must not be shared between threads.
+
+    Returns
+    -------
+    DynamoDBServiceResource
+        New DynamoDB boto3 resource, it reuses the loaded service models of the shared session
+    """
+    with _lock:
+        logger.debug('creating thread dynamodb resource')
+        return _get_session().resource('dynamodb', config=CLIENT_CONFIG)
+
+
+def get_events_client() -> 'EventBridgeClient':
+    """Returns the container wide EventBridge client.
+
+    Returns
+    -------
+    EventBridgeClient
+        EventBridge boto3 client created on first use
+    """
+    global _events_client
+    with _lock:
+        if _events_client is None:
+            logger.debug('creating eventbridge client')
+            _events_client = _get_session().client('events', config=CLIENT_CONFIG)
+        return _events_client
+
+
+def prime_clients(*services: PrimedService) -> None:
+    """Creates the clients of the given services and sends each a cheap request, when running in Lambda.
+
+    The request opens the TLS connection and resolves credentials so the first invocation skips both. Its response
+    doesn't matter, an access denied error has already done the work, so errors are only logged.
+
+    Parameters
+    ----------
+    services : PrimedService
+        Services the Lambda function calls
+    """
+    if AWS_LAMBDA_FUNCTION_NAME_ENV not in os.environ:
+        return
+    for service in services:
+        try:
+            if service == 'dynamodb':
+                get_dynamodb_resource().meta.client.describe_endpoints()
+            else:
+                get_events_client().list_event_buses(Limit=1)
+        except (BotoCoreError, ClientError):
+            logger.debug('priming request failed', service=service)
@@ -0,0 +1,29 @@
+from functools import lru_cache
+
+from product.cache.base import CacheBackend
+
+_IN_MEMORY_URL_SCHEME = 'memory://'
+
+
+@lru_cache
+def get_cache_backend(cache_url: str) -> CacheBackend:
+    """Returns the container wide cache backend of a cache URL.
+
+    Parameters
+    ----------
+    cache_url : str
+        `redis://` or `rediss://` URL of a Redis protocol server, or `memory://` for a cache local to the container
+
+    Returns
+    -------
+    CacheBackend
+        Cache backend created on first use
+    """
+    # only the backend of the URL is imported
+    if cache_url.startswith(_IN_MEMORY_URL_SCHEME):
+        from product.cache.memory import InMemoryCacheBackend
+
+        return InMemoryCacheBackend()
+    from product.cache.redis import RedisCacheBackend
+
+    return RedisCacheBackend.from_url(cache_url)
@@ -0,0 +1,67 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class CacheBackend(ABC):
+    """ABC for a key value cache shared by all the containers of the service.
+
+    Values are strings, callers serialize their own models. Every entry expires on its own TTL,
+    deleting entries is only needed to drop them before they expire.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Reads a cached value.
+
+        Parameters
+        ----------
+        key : str
+            Cache key
+
+        Returns
+        -------
+        Optional[str]
+            Cached value, None when the key is not cached or has expired
+
+        Raises
+        ------
+        CacheBackendError
+            When the cache could not be read.
+        """
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl_seconds: Optional[int]) -> None:
+        """Caches a value, replacing the current value of the key.
+
+        Parameters
+        ----------
+        key : str
+            Cache key
+        value : str
+            Value to cache
+        ttl_seconds : Optional[int]
+            Seconds until the value expires, None keeps it until it is replaced or evicted
+
+        Raises
+        ------
+        CacheBackendError
+            When the value could not be cached.
+        """
+        ...
+
+    @abstractmethod
+    def delete(self, keys: list[str]) -> None:
+        """Drops cached values, keys that are not cached are ignored.
+
+        Parameters
+        ----------
+        keys : list[str]
+            Cache keys
+
+        Raises
+        ------
+        CacheBackendError
+            When the values could not be dropped.
+        """
+        ...
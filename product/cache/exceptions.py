@@ -0,0 +1,2 @@
+class CacheBackendError(Exception):
+    """Raised when the cache backend can't be reached or rejects a command, callers fall back to the database."""
@@ -0,0 +1,14 @@
+# keys are shared by the CRUD handlers that fill the cache and the stream processor that invalidates it
+
+_KEY_PREFIX = 'products:v1'  # bump when the cached value format changes
+
+PRODUCTS_GENERATION_KEY = f'{_KEY_PREFIX}:generation'
+"""Replaced on every product change, cached list pages are keyed by it so a change invalidates all of them at once."""
+
+
+def get_product_key(product_id: str) -> str:
+    return f'{_KEY_PREFIX}:product:{product_id}'
+
+
+def get_products_page_key(generation: str, page_request: str) -> str:
+    return f'{_KEY_PREFIX}:page:{generation}:{page_request}'
@@ -0,0 +1,41 @@
+import math
+import threading
+from typing import Optional
+
+from cachetools import TLRUCache
+
+from product.cache.base import CacheBackend
+from product.constants import IN_MEMORY_CACHE_MAX_SIZE
+
+
+class InMemoryCacheBackend(CacheBackend):
+    def __init__(self, max_size: int = IN_MEMORY_CACHE_MAX_SIZE):
+        """Cache Backend keeping entries in the memory of the current process.
+
+        It is a stand-in for a shared cache in tests and local runs, every container gets its own copy.
+
+        Parameters
+        ----------
+        max_size : int, optional
+            Maximum number of cached entries, least recently used entries are evicted first
+        """
+        # every entry is a (value, ttl_seconds) pair so each one expires on its own TTL
+        self._cache: TLRUCache = TLRUCache(
+            maxsize=max_size,
+            ttu=lambda _key, entry, now: now + entry[1] if entry[1] is not None else math.inf,
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._cache.get(key)
+        return entry[0] if entry is not None else None
+
+    def set(self, key: str, value: str, ttl_seconds: Optional[int]) -> None:
+        with self._lock:
+            self._cache[key] = (value, ttl_seconds)
+
+    def delete(self, keys: list[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._cache.pop(key, None)
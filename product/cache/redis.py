@@ -0,0 +1,165 @@
+import socket
+import threading
+from typing import Any, BinaryIO, Optional, Union
+from urllib.parse import unquote, urlsplit
+
+from product.cache.base import CacheBackend
+from product.cache.exceptions import CacheBackendError
+from product.constants import CACHE_CONNECT_TIMEOUT_SECONDS, CACHE_READ_TIMEOUT_SECONDS
+from product.observability import logger
+
+_Reply = Union[str, int, None, list[Any]]
+_CRLF = b'\r\n'
+_DEFAULT_PORT = 6379
+
+
+class _ErrorReply(Exception):
+    pass
+
+
+def _encode_command(*args: Union[str, int]) -> bytes:
+    # every command is sent as a RESP array of bulk strings
+    parts = [f'*{len(args)}'.encode()]
+    for arg in args:
+        data = str(arg).encode('utf-8')
+        parts.extend((f'${len(data)}'.encode(), data))
+    return _CRLF.join(parts) + _CRLF
+
+
+def _read_reply(reader: BinaryIO) -> _Reply:
+    line = reader.readline()
+    if not line.endswith(_CRLF):
+        raise ConnectionError('connection closed by the cache server')
+    prefix, payload = line[:1], line[1:-2].decode('utf-8')
+    if prefix == b'+':
+        return payload
+    if prefix == b'-':
+        raise _ErrorReply(payload)
+    if prefix == b':':
+        return int(payload)
+    if prefix == b'$':
+        # bulk string, a -1 length is a missing value
+        return None if int(payload) < 0 else reader.read(int(payload) + len(_CRLF))[:-2].decode('utf-8')
+    if prefix == b'*':
+        return None if int(payload) < 0 else [_read_reply(reader) for _ in range(int(payload))]
+    raise ConnectionError(f'unexpected reply from the cache server: {prefix!r}')
+
+
+class RedisCacheBackend(CacheBackend):
+    def __init__(
+        self,
+        host: str,
+        port: int = _DEFAULT_PORT,
+        db: int = 0,
+        password: Optional[str] = None,
+        username: Optional[str] = None,
+        use_tls: bool = False,
+    ):
+        """Cache Backend for any server speaking the Redis protocol (Redis, Valkey, ElastiCache, MemoryDB).
+
+        A single connection is opened on first use and kept for the container lifetime, commands are serialized on it.
+        Timeouts are short so an unavailable cache costs less than the database read it was meant to save.
+
+        Parameters
+        ----------
+        host : str
+            Cache server host name
+        port : int, optional
+            Cache server port, by default 6379
+        db : int, optional
+            Database number to select, by default 0
+        password : Optional[str], optional
+            Password to authenticate with, by default no authentication
+        username : Optional[str], optional
+            ACL user name to authenticate with, by default the default user
+        use_tls : bool, optional
+            Whether to encrypt the connection, required by servers with in-transit encryption
+        """
+        self.host = host
+        self.port = port
+        self.db = db
+        self.use_tls = use_tls
+        self._password = password
+        self._username = username
+        self._socket: Optional[socket.socket] = None
+        self._reader: Optional[BinaryIO] = None
+        self._lock = threading.Lock()  # one command at a time on the shared connection
+
+    @classmethod
+    def from_url(cls, url: str) -> 'RedisCacheBackend':
+        """Builds a backend from a `redis://[[user]:password@]host[:port][/db]` URL, `rediss://` for TLS."""
+        parts = urlsplit(url)
+        if parts.scheme not in ('redis', 'rediss') or not parts.hostname:
+            raise ValueError('cache URL must be a redis:// or rediss:// URL with a host name')
+        return cls(
+            host=parts.hostname,
+            port=parts.port or _DEFAULT_PORT,
+            db=int(parts.path.lstrip('/') or 0),
+            password=unquote(parts.password) if parts.password else None,
+            username=unquote(parts.username) if parts.username else None,
+            use_tls=parts.scheme == 'rediss',
+        )
+
+    def get(self, key: str) -> Optional[str]:
+        reply = self._execute('GET', key)
+        return reply if isinstance(reply, str) else None
+
+    def set(self, key: str, value: str, ttl_seconds: Optional[int]) -> None:
+        if ttl_seconds is None:
+            self._execute('SET', key, value)
+        else:
+            self._execute('SET', key, value, 'EX', ttl_seconds)
+
+    def delete(self, keys: list[str]) -> None:
+        if keys:
+            self._execute('DEL', *keys)
+
+    def _execute(self, *args: Union[str, int]) -> _Reply:
+        command = _encode_command(*args)
+        with self._lock:
+            # the server may have closed a connection left idle while the container was frozen, it is reopened once
+            for attempt in range(2):
+                try:
+                    return self._send(command)
+                except _ErrorReply as exc:
+                    raise CacheBackendError(f'cache server rejected {args[0]}: {exc}') from exc
+                except (OSError, ValueError) as exc:
+                    self._close()
+                    if attempt:
+                        raise CacheBackendError(f'cache server is unavailable: {exc}') from exc
+                    logger.debug('reconnecting to the cache server', host=self.host)
+        raise CacheBackendError('cache server is unavailable')  # pragma: no cover (the loop always returns or raises)
+
+    def _send(self, command: bytes) -> _Reply:
+        if self._socket is None or self._reader is None:
+            self._connect()
+        self._socket.sendall(command)  # type: ignore[union-attr]
+        return _read_reply(self._reader)  # type: ignore[arg-type]
+
+    def _connect(self) -> None:
+        logger.debug('opening connection to the cache server', host=self.host, port=self.port, tls=self.use_tls)
+        sock = socket.create_connection((self.host, self.port), timeout=CACHE_CONNECT_TIMEOUT_SECONDS)
+        if self.use_tls:
+            import ssl  # only loaded by TLS connections
+
+            sock = ssl.create_default_context().wrap_socket(sock, server_hostname=self.host)
+        sock.settimeout(CACHE_READ_TIMEOUT_SECONDS)
+        self._socket, self._reader = sock, sock.makefile('rb')
+        try:
+            if self._password is not None:
+                auth = ('AUTH', self._username, self._password) if self._username else ('AUTH', self._password)
+                self._send(_encode_command(*auth))
+            if self.db:
+                self._send(_encode_command('SELECT', self.db))
+        except _ErrorReply:
+            self._close()  # never keep a connection that isn't authenticated or is on the wrong database
+            raise
+
+    def _close(self) -> None:
+        for resource in (self._reader, self._socket):
+            try:
+                if resource is not None:
+                    resource.close()
+            except OSError:  # pragma: no cover
+                pass
+        self._socket, self._reader = None, None
@@ -1 +1,12 @@
 XRAY_TRACE_ID_ENV: str = '_X_AMZN_TRACE_ID'
+AWS_LAMBDA_FUNCTION_NAME_ENV: str = 'AWS_LAMBDA_FUNCTION_NAME'  # set by the Lambda runtime only
+AWS_CLIENT_CONNECT_TIMEOUT_SECONDS: int = 1
+AWS_CLIENT_READ_TIMEOUT_SECONDS: int = 5  # API handlers time out after 10 seconds, leaves room for a retry
+AWS_CLIENT_MAX_ATTEMPTS: int = 3
+AWS_CLIENT_MAX_POOL_CONNECTIONS: int = 32  # covers the parallel scan and batch write worker threads
+CACHE_CONNECT_TIMEOUT_SECONDS: float = 0.2  # a slow shared cache must not be slower than reading the table
+CACHE_READ_TIMEOUT_SECONDS: float = 0.2
+IN_MEMORY_CACHE_MAX_SIZE: int = 10_000
+LOG_DEBUG_BUFFER_ENV: str = 'LOG_DEBUG_BUFFER'  # 'true' buffers the records below LOG_LEVEL until an invocation fails
+LOG_INFO_SAMPLE_RATE_ENV: str = 'LOG_INFO_SAMPLE_RATE'  # share of invocations emitting their records below WARNING, 0 to 1
+LOG_BUFFER_MAX_RECORDS: int = 500  # oldest buffered records are dropped first, bounds the memory of a long invocation
@@ -0,0 +1,42 @@
+import argparse
+
+from product.crud.integration import get_db_handler
+from product.crud.integration.db_handler import DbHandler
+from product.observability import logger, tracer
+
+
+@tracer.capture_method(capture_response=False)
+def backfill_recency_buckets(table_name: str, total_segments: int) -> int:
+    """Adds the products written before the recency index existed to it, a one-off run after the index is deployed.
+
+    Every product is read with a parallel scan and gets its recency bucket unless it already has one, products written since
+    the index exists are left as is. Every backfilled product is a MODIFY record on the table stream: the stream processor
+    adds it to the catalog snapshot and drops it from the shared cache, but sends no product notification since the product
+    itself didn't change.
+
+    Parameters
+    ----------
+    table_name : str
+        Name of the products table
+    total_segments : int
+        Number of parallel scan segments, about one per 64 MB of table data, up to `MAX_SCAN_SEGMENTS` are read at once
+
+    Returns
+    -------
+    int
+        Number of backfilled products
+    """
+    logger.info('handling backfill recency buckets request')
+
+    dal_handler: DbHandler = get_db_handler(table_name)
+    backfilled = sum(dal_handler.set_recency_bucket(product.id) for product in dal_handler.scan_products(total_segments=total_segments))
+    logger.info('backfilled recency buckets successfully', backfilled=backfilled)
+    return backfilled
+
+
+if __name__ == '__main__':  # pragma: no cover
+    parser = argparse.ArgumentParser(description='Adds the products written before the recency index existed to it')
+    parser.add_argument('--table-name', required=True, help='name of the products table')
+    parser.add_argument('--total-segments', type=int, required=True, help='number of parallel scan segments, about one per 64 MB of table data')
+    args = parser.parse_args()
+    backfill_recency_buckets(table_name=args.table_name, total_segments=args.total_segments)
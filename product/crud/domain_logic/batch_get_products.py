@@ -0,0 +1,17 @@
+from product.crud.integration import get_db_handler
+from product.crud.integration.db_handler import DbHandler
+from product.crud.models.output import BatchGetProductsOutput
+from product.crud.models.product import ProductsBatch
+from product.observability import logger, tracer
+
+
+@tracer.capture_method(capture_response=False)
+def batch_get_products(product_ids: list[str], table_name: str) -> BatchGetProductsOutput:
+    logger.info('handling batch get products request')
+
+    dal_handler: DbHandler = get_db_handler(table_name)
+    batch: ProductsBatch = dal_handler.get_products(product_ids=product_ids)
+    # convert from db entry to output, they won't always be the same
+    products_output = [product.model_dump() for product in batch.products]
+    logger.info('got products successfully', found=len(batch.products), missing=len(batch.missing_ids))
+    return BatchGetProductsOutput.model_validate({'products': products_output, 'missing_ids': batch.missing_ids})
@@ -0,0 +1,28 @@
+from typing import Optional
+
+from product.crud.integration import get_db_handler
+from product.crud.integration.constants import PRODUCT_CACHE_MAX_SIZE
+from product.crud.integration.db_handler import DbHandler
+from product.crud.models.output import BatchWriteProductsOutput
+from product.crud.models.product import Product, ProductWriteResult
+from product.observability import logger, tracer
+
+
+@tracer.capture_method(capture_response=False)
+def batch_write_products(
+    puts: list[Product],
+    deletes: list[str],
+    table_name: str,
+    product_cache_size: int = PRODUCT_CACHE_MAX_SIZE,
+    cache_url: Optional[str] = None,
+) -> BatchWriteProductsOutput:
+    logger.info('handling batch write products request')
+
+    # the cache configuration of the reads, written products are dropped from the cache they read
+    dal_handler: DbHandler = get_db_handler(table_name, product_cache_size=product_cache_size, cache_url=cache_url)
+    write_results: list[ProductWriteResult] = dal_handler.write_products(puts=puts, deletes=deletes)
+    # convert from db write results to output, they won't always be the same
+    results = [{'id': result.id, 'operation': result.operation, 'status': 'SUCCEEDED' if result.succeeded else 'FAILED'} for result in write_results]
+    succeeded = sum(1 for result in write_results if result.succeeded)
+    logger.info('wrote products batch', succeeded=succeeded, failed=len(write_results) - succeeded)
+    return BatchWriteProductsOutput.model_validate({'results': results, 'succeeded': succeeded, 'failed': len(write_results) - succeeded})
@@ -1,32 +1,83 @@
+from collections import Counter
+from functools import lru_cache
+from typing import Callable, Optional
+
 from aws_lambda_env_modeler import get_environment_variables
-from aws_lambda_powertools.utilities.idempotency import DynamoDBPersistenceLayer, IdempotencyConfig, idempotent_function
-from aws_lambda_powertools.utilities.idempotency.serialization.pydantic import PydanticSerializer
+from aws_lambda_powertools.metrics import MetricUnit
 
 from product.crud.handlers.models.env_vars import Idempotency
 from product.crud.integration import get_db_handler
+from product.crud.integration.constants import IDEMPOTENCY_LOCAL_CACHE_MAX_ITEMS, PRODUCT_CACHE_MAX_SIZE
 from product.crud.integration.db_handler import DbHandler
 from product.crud.models.output import CreateProductOutput
 from product.crud.models.product import Product
-from product.observability import logger, tracer
+from product.observability import logger, metrics, tracer
+
+# creates that ran past the idempotency check, the other idempotent calls were answered from a stored record
+_create_executions: Counter[str] = Counter()
+
+
+@lru_cache
+def _get_idempotent_create() -> Callable[..., CreateProductOutput]:
+    # built on the first create, a container in single write mode never loads the idempotency utility or its client
+    from aws_lambda_powertools.utilities.idempotency import DynamoDBPersistenceLayer, IdempotencyConfig, idempotent_function
+    from aws_lambda_powertools.utilities.idempotency.serialization.pydantic import PydanticSerializer
 
-IDEMPOTENCY_LAYER = DynamoDBPersistenceLayer(table_name=get_environment_variables(model=Idempotency).IDEMPOTENCY_TABLE_NAME)
-IDEMPOTENCY_CONFIG = IdempotencyConfig(
-    expires_after_seconds=60,  # 1 minute
-)
+    from product.aws_clients import CLIENT_CONFIG
+
+    persistence_layer = DynamoDBPersistenceLayer(
+        table_name=get_environment_variables(model=Idempotency).IDEMPOTENCY_TABLE_NAME,
+        boto_config=CLIENT_CONFIG,  # same timeouts, retries and keep-alive as the registry clients
+    )
+    config = IdempotencyConfig(
+        expires_after_seconds=60,  # 1 minute
+        # retries of a completed create are answered from memory within the minute, without reading the idempotency table
+        use_local_cache=True,
+        local_cache_max_items=IDEMPOTENCY_LOCAL_CACHE_MAX_ITEMS,
+    )
+    return idempotent_function(
+        data_keyword_argument='product',
+        config=config,
+        persistence_store=persistence_layer,
+        output_serializer=PydanticSerializer,
+    )(_create_product)
 
 
-@idempotent_function(
-    data_keyword_argument='product',
-    config=IDEMPOTENCY_CONFIG,
-    persistence_store=IDEMPOTENCY_LAYER,
-    output_serializer=PydanticSerializer,
-)
 @tracer.capture_method(capture_response=False)
-def create_product(product: Product, table_name: str) -> CreateProductOutput:
+def create_product(
+    product: Product, table_name: str, product_cache_size: int = PRODUCT_CACHE_MAX_SIZE, cache_url: Optional[str] = None
+) -> CreateProductOutput:
+    executions = _create_executions['create']
+    output = _get_idempotent_create()(product=product, table_name=table_name, product_cache_size=product_cache_size, cache_url=cache_url)
+    # a call that didn't run the create was answered from its idempotency record, from the local cache when it holds it
+    cache_hit = _create_executions['create'] == executions
+    metrics.add_metric(name='IdempotencyCacheHits' if cache_hit else 'IdempotencyCacheMisses', unit=MetricUnit.Count, value=1)
+    return output
+
+
+def _create_product(product: Product, table_name: str, product_cache_size: int, cache_url: Optional[str]) -> CreateProductOutput:
     logger.info('handling create product request')
+    _create_executions['create'] += 1
 
-    db_handler: DbHandler = get_db_handler(table_name)
+    # the cache configuration of the reads, a negatively cached product is dropped from the cache they read
+    db_handler: DbHandler = get_db_handler(table_name, product_cache_size=product_cache_size, cache_url=cache_url)
     db_handler.create_product(product=product)
     # convert from db entry to output, they won't always be the same
     logger.info('created product successfully')
     return CreateProductOutput(id=product.id)
+
+
+@tracer.capture_method(capture_response=False)
+def create_product_single_write(
+    product: Product, table_name: str, product_cache_size: int = PRODUCT_CACHE_MAX_SIZE, cache_url: Optional[str] = None
+) -> CreateProductOutput:
+    """Creates a product with a single conditional write, the product ID is the idempotency key.
+
+    A retry finding the product already stored with the same attributes succeeds, without the idempotency table writes.
+    """
+    logger.info('handling create product request with a single write')
+
+    db_handler: DbHandler = get_db_handler(table_name, product_cache_size=product_cache_size, cache_url=cache_url)
+    db_handler.create_product(product=product, idempotent=True)
+    logger.info('created product successfully')
+    return CreateProductOutput(id=product.id)
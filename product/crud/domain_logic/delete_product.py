@@ -1,12 +1,16 @@
+from typing import Optional
+
 from product.crud.integration import get_db_handler
+from product.crud.integration.constants import PRODUCT_CACHE_MAX_SIZE
 from product.crud.integration.db_handler import DbHandler
 from product.observability import logger, tracer
 
 
 @tracer.capture_method(capture_response=False)
-def delete_product(product_id: str, table_name: str) -> None:
+def delete_product(product_id: str, table_name: str, product_cache_size: int = PRODUCT_CACHE_MAX_SIZE, cache_url: Optional[str] = None) -> None:
     logger.info('handling delete product request')
 
-    dal_handler: DbHandler = get_db_handler(table_name)
+    # the cache configuration of the reads, the deleted product is dropped from the cache they read
+    dal_handler: DbHandler = get_db_handler(table_name, product_cache_size=product_cache_size, cache_url=cache_url)
     dal_handler.delete_product(product_id=product_id)
     logger.info('deleted product successfully')
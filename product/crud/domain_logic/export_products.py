@@ -0,0 +1,74 @@
+from typing import Optional
+
+from product.crud.domain_logic.pagination import decode_next_token, encode_next_token
+from product.crud.integration import get_db_handler
+from product.crud.integration.db_handler import DbHandler
+from product.crud.models.exceptions import InvalidPaginationTokenException
+from product.crud.models.output import ExportProductsOutput
+from product.crud.models.product import ProductField
+from product.observability import logger, tracer
+
+
+@tracer.capture_method(capture_response=False)
+def export_products(
+    table_name: str,
+    cursor_signing_key: str,
+    max_bytes: int,
+    next_token: Optional[str] = None,
+    consistent_read: bool = True,
+    fields: Optional[list[ProductField]] = None,
+) -> ExportProductsOutput:
+    """Exports the next chunk of the catalog as newline delimited JSON, one product per line.
+
+    Products are encoded one at a time straight from the table scan, a chunk stops before it would exceed `max_bytes`
+    so memory stays flat however large the table is. Clients send the returned token to get the next chunk.
+
+    Parameters
+    ----------
+    table_name : str
+        Name of the products table
+    cursor_signing_key : str
+        Secret the export tokens are signed with
+    max_bytes : int
+        Upper bound of the chunk size, a chunk holds at least one product
+    next_token : Optional[str], optional
+        Token returned with the previous chunk, None for the first chunk
+    consistent_read : bool, optional
+        Whether to scan with strongly consistent reads, by default True
+    fields : Optional[list[ProductField]], optional
+        Sparse fieldset of the exported products, by default every field
+
+    Returns
+    -------
+    ExportProductsOutput
+        Chunk of products, with the token of the next chunk unless the export is complete
+
+    Raises
+    ------
+    InvalidPaginationTokenException
+        When the token is invalid or wasn't issued in table order
+    """
+    logger.info('handling export products request')
+    start_key = decode_next_token(next_token, cursor_signing_key)
+    if start_key is not None and set(start_key) != {'id'}:
+        raise InvalidPaginationTokenException('pagination token was issued for another sort order')
+
+    dal_handler: DbHandler = get_db_handler(table_name)
+    lines: list[str] = []
+    chunk_size = 0
+    last_id: Optional[str] = None
+    has_next_chunk = False
+    for product in dal_handler.iter_products(start_key=start_key, consistent_read=consistent_read, fields=fields):
+        line = product.model_dump_json(exclude_unset=True)
+        # counted in characters, names are short so the few multi-byte ones stay within the payload headroom
+        if lines and chunk_size + len(line) + 1 > max_bytes:
+            has_next_chunk = True
+            break
+        lines.append(line)
+        chunk_size += len(line) + 1
+        last_id = product.id
+
+    # the next chunk resumes the scan right after the last exported product
+    next_key = {'id': last_id} if has_next_chunk else None
+    logger.info('exported products chunk successfully', products=len(lines), chunk_size=chunk_size, has_next_chunk=has_next_chunk)
+    return ExportProductsOutput(products=''.join(f'{line}\n' for line in lines), next_token=encode_next_token(next_key, cursor_signing_key))
@@ -0,0 +1,19 @@
+from typing import Optional
+
+from product.crud.models.product import ProductField
+
+
+def get_fields_to_include(fields: Optional[list[ProductField]]) -> Optional[set[str]]:
+    """Maps a sparse fieldset to the product attributes to include in the response, the id is always included.
+
+    Parameters
+    ----------
+    fields : Optional[list[ProductField]]
+        Fields selected by the client, None when the client wants the full product
+
+    Returns
+    -------
+    Optional[set[str]]
+        Attributes to include, None to include all of them
+    """
+    return None if fields is None else {'id', *fields}
@@ -0,0 +1,21 @@
+from typing import Optional
+
+from product.crud.integration import get_db_handler
+from product.crud.integration.constants import PRODUCT_CACHE_MAX_SIZE
+from product.crud.integration.db_handler import DbHandler
+from product.observability import logger, tracer
+
+
+@tracer.capture_method(capture_response=False)
+def get_catalog_version(
+    table_name: str, catalog_table_name: str, product_cache_size: int = PRODUCT_CACHE_MAX_SIZE, cache_url: Optional[str] = None
+) -> int:
+    """Returns the catalog version, a cheap validator of the catalog lists and statistics.
+
+    The stream processor increments it with every batch of product changes it applies, so it lags product writes by the
+    stream delay, like the eventually consistent responses it validates.
+    """
+    logger.info('handling get catalog version request')
+
+    dal_handler: DbHandler = get_db_handler(table_name, product_cache_size=product_cache_size, cache_url=cache_url)
+    return dal_handler.get_catalog_version(catalog_table_name=catalog_table_name)
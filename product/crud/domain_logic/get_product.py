@@ -1,16 +1,27 @@
+from typing import Optional, Union
+
+from product.crud.domain_logic.fields import get_fields_to_include
 from product.crud.integration import get_db_handler
 from product.crud.integration.db_handler import DbHandler
 from product.crud.models.output import GetProductOutput
-from product.crud.models.product import Product
+from product.crud.models.product import Product, ProductField, ProductProjection
 from product.observability import logger, tracer
 
 
 @tracer.capture_method(capture_response=False)
-def get_product(product_id: str, table_name: str) -> GetProductOutput:
+def get_product(
+    product_id: str,
+    table_name: str,
+    product_cache_size: int,
+    consistent_read: bool = True,
+    fields: Optional[list[ProductField]] = None,
+    cache_url: Optional[str] = None,
+) -> GetProductOutput:
     logger.info('handling get product request')
 
-    dal_handler: DbHandler = get_db_handler(table_name)
-    product: Product = dal_handler.get_product(product_id=product_id)
+    dal_handler: DbHandler = get_db_handler(table_name, product_cache_size=product_cache_size, cache_url=cache_url)
+    product: Union[Product, ProductProjection] = dal_handler.get_product(product_id=product_id, consistent_read=consistent_read, fields=fields)
     # convert from db entry to output, they won't always be the same
     logger.info('got product successfully')
-    return GetProductOutput(id=product.id, price=product.price, name=product.name)
+    # only the requested fields are set on the output, cached products are read with all of them
+    return GetProductOutput.model_validate({**product.model_dump(include=get_fields_to_include(fields)), 'updated_at': product.updated_at})
@@ -0,0 +1,26 @@
+from product.crud.integration import get_db_handler
+from product.crud.integration.db_handler import DbHandler
+from product.crud.models.output import ProductsStatsOutput
+from product.models.products.catalog import CatalogStatsEntry
+from product.observability import logger, tracer
+
+
+@tracer.capture_method(capture_response=False)
+def get_products_stats(table_name: str, catalog_table_name: str) -> ProductsStatsOutput:
+    logger.info('handling get products stats request')
+
+    dal_handler: DbHandler = get_db_handler(table_name)
+    stats: CatalogStatsEntry = dal_handler.get_catalog_stats(catalog_table_name=catalog_table_name)
+    # prices no product has anymore may be read with a count of 0 until the stream processor removes them
+    prices = [price for price, count in stats.price_counts.items() if count > 0]
+    logger.info('got products stats successfully', product_count=stats.product_count)
+    return ProductsStatsOutput(
+        product_count=stats.product_count,
+        price_sum=stats.price_sum,
+        price_min=min(prices, default=None),
+        price_max=max(prices, default=None),
+        price_average=stats.price_sum / stats.product_count if stats.product_count > 0 else None,
+        added_per_day=stats.added_per_day,
+        removed_per_day=stats.removed_per_day,
+        version=stats.version,
+    )
@@ -1,19 +1,80 @@
-from typing import List
+from typing import Any, Optional
 
+from product.crud.domain_logic.fields import get_fields_to_include
+from product.crud.domain_logic.pagination import decode_next_token, encode_next_token
 from product.crud.integration import get_db_handler
+from product.crud.integration.constants import PRODUCT_CACHE_MAX_SIZE
 from product.crud.integration.db_handler import DbHandler
+from product.crud.models.exceptions import CatalogSnapshotIncompleteException, InvalidPaginationTokenException
 from product.crud.models.output import ListProductsOutput
-from product.crud.models.product import Product
+from product.crud.models.product import ProductField, ProductsPage, ProductsSort
 from product.observability import logger, tracer
 
 
 @tracer.capture_method(capture_response=False)
-def list_products(table_name: str) -> ListProductsOutput:
+def list_products(
+    table_name: str,
+    limit: int,
+    cursor_signing_key: str,
+    next_token: Optional[str] = None,
+    prefetch_next_page: bool = False,
+    consistent_read: bool = True,
+    fields: Optional[list[ProductField]] = None,
+    sort: Optional[ProductsSort] = None,
+    catalog_table_name: Optional[str] = None,
+    product_cache_size: int = PRODUCT_CACHE_MAX_SIZE,
+    cache_url: Optional[str] = None,
+) -> ListProductsOutput:
     logger.info('handling list products request')
 
-    dal_handler: DbHandler = get_db_handler(table_name)
-    products: List[Product] = dal_handler.list_products()
+    start_key = decode_next_token(next_token, cursor_signing_key)
+    # the catalog snapshot serves eventually consistent lists in product id order, strongly consistent lists still scan the table.
+    # A table cursor of an eventually consistent list comes from an incomplete snapshot, the listing stays on the table
+    from_catalog = catalog_table_name is not None and sort is None and not consistent_read
+    from_catalog = from_catalog and (start_key is None or _get_cursor_order(start_key) != 'table')
+    expected_order = 'newest' if sort == 'newest' else ('catalog' if from_catalog else 'table')
+    if start_key is not None and _get_cursor_order(start_key) != expected_order:
+        raise InvalidPaginationTokenException('pagination token was issued for another sort order')
+
+    dal_handler: DbHandler = get_db_handler(table_name, product_cache_size=product_cache_size, cache_url=cache_url)
+    page: ProductsPage
+    if sort == 'newest':
+        # served from the recency index, which is always eventually consistent
+        page = dal_handler.list_products_by_recency(limit=limit, cursor=start_key, fields=fields)
+    elif from_catalog and catalog_table_name is not None:
+        page = _list_products_from_catalog(dal_handler, catalog_table_name, limit, start_key, prefetch_next_page, fields)
+    else:
+        page = dal_handler.list_products(
+            limit=limit, start_key=start_key, prefetch_next=prefetch_next_page, consistent_read=consistent_read, fields=fields
+        )
     # convert from db entry to output, they won't always be the same
-    list_output = [product.model_dump() for product in products]
-    logger.info('listed products successfully')
-    return ListProductsOutput.model_validate({'products': list_output})
+    list_output = [product.model_dump(include=get_fields_to_include(fields)) for product in page.products]
+    logger.info('listed products successfully', has_next_page=page.last_key is not None)
+    return ListProductsOutput.model_validate(
+        {'products': list_output, 'next_token': encode_next_token(page.last_key, cursor_signing_key)},
+    )
+
+
+def _list_products_from_catalog(
+    dal_handler: DbHandler,
+    catalog_table_name: str,
+    limit: int,
+    start_key: Optional[dict[str, Any]],
+    prefetch_next_page: bool,
+    fields: Optional[list[ProductField]],
+) -> ProductsPage:
+    try:
+        return dal_handler.list_products_from_catalog(catalog_table_name=catalog_table_name, limit=limit, cursor=start_key, fields=fields)
+    except CatalogSnapshotIncompleteException as exc:
+        if start_key is not None:
+            # a snapshot cursor doesn't point into the table scan, the listing has to start over
+            raise InvalidPaginationTokenException('pagination token was issued by an incomplete catalog snapshot') from exc
+        logger.warning('catalog snapshot is incomplete, listing products from the table', exc_info=True)
+        return dal_handler.list_products(limit=limit, prefetch_next=prefetch_next_page, consistent_read=False, fields=fields)
+
+
+def _get_cursor_order(start_key: dict[str, Any]) -> str:
+    # a recency cursor holds a start key per index bucket, a catalog cursor the last product id, a table cursor a table key
+    if 'buckets' in start_key:
+        return 'newest'
+    return 'catalog' if 'after_id' in start_key else 'table'
@@ -0,0 +1,85 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+from decimal import Decimal
+from typing import Any, Optional
+
+from product.crud.models.exceptions import InvalidPaginationTokenException
+
+_TOKEN_SEPARATOR = '.'
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode('ascii').rstrip('=')
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + '=' * (-len(data) % 4))
+
+
+def _json_default(value: Any) -> Any:
+    # boto3 returns DynamoDB numbers as Decimal, our keys only hold integers
+    if isinstance(value, Decimal):
+        return int(value)
+    raise TypeError(f'unsupported key value type {type(value)}')  # pragma: no cover
+
+
+def _sign(payload: str, signing_key: str) -> str:
+    return _b64encode(hmac.new(signing_key.encode('utf-8'), payload.encode('utf-8'), hashlib.sha256).digest())
+
+
+def encode_next_token(last_key: Optional[dict[str, Any]], signing_key: str) -> Optional[str]:
+    """Wraps the key of the last evaluated product in an opaque, signed pagination token.
+
+    Parameters
+    ----------
+    last_key : Optional[dict[str, Any]]
+        Key of the last product evaluated in the current page, None when there are no more pages
+    signing_key : str
+        Secret used to sign the token (HMAC-SHA256) so clients can't forge or alter it
+
+    Returns
+    -------
+    Optional[str]
+        URL safe pagination token, None when there are no more pages
+    """
+    if not last_key:
+        return None
+    payload = _b64encode(json.dumps(last_key, default=_json_default, separators=(',', ':'), sort_keys=True).encode('utf-8'))
+    return f'{payload}{_TOKEN_SEPARATOR}{_sign(payload, signing_key)}'
+
+
+def decode_next_token(next_token: Optional[str], signing_key: str) -> Optional[dict[str, Any]]:
+    """Verifies a pagination token signature and extracts the key to start the next page from.
+
+    Parameters
+    ----------
+    next_token : Optional[str]
+        Pagination token returned by a previous list request, None for the first page
+    signing_key : str
+        Secret the token was signed with
+
+    Returns
+    -------
+    Optional[dict[str, Any]]
+        Exclusive start key of the requested page, None for the first page
+
+    Raises
+    ------
+    InvalidPaginationTokenException
+        When the token is malformed or its signature does not match its payload
+    """
+    if next_token is None:
+        return None
+    payload, _, signature = next_token.partition(_TOKEN_SEPARATOR)
+    if not payload or not signature or not hmac.compare_digest(signature, _sign(payload, signing_key)):
+        raise InvalidPaginationTokenException('pagination token signature is invalid')
+    try:
+        start_key = json.loads(_b64decode(payload))
+    except (binascii.Error, ValueError) as exc:  # pragma: no cover (signed tokens are always well formed)
+        raise InvalidPaginationTokenException('pagination token is malformed') from exc
+    if not isinstance(start_key, dict):  # pragma: no cover
+        raise InvalidPaginationTokenException('pagination token is malformed')
+    return start_key
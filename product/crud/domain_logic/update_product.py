@@ -0,0 +1,26 @@
+from typing import Optional
+
+from product.crud.integration import get_db_handler
+from product.crud.integration.constants import PRODUCT_CACHE_MAX_SIZE
+from product.crud.integration.db_handler import DbHandler
+from product.crud.models.output import UpdateProductOutput
+from product.crud.models.product import ProductUpdate
+from product.observability import logger, tracer
+
+
+@tracer.capture_method(capture_response=False)
+def update_product(
+    product_id: str,
+    update: ProductUpdate,
+    table_name: str,
+    product_cache_size: int = PRODUCT_CACHE_MAX_SIZE,
+    cache_url: Optional[str] = None,
+) -> UpdateProductOutput:
+    logger.info('handling update product request')
+
+    # the cache configuration of the reads, the updated product is put in the cache they read
+    db_handler: DbHandler = get_db_handler(table_name, product_cache_size=product_cache_size, cache_url=cache_url)
+    product = db_handler.update_product(product_id=product_id, update=update)
+    # convert from db entry to output, they won't always be the same
+    logger.info('updated product successfully')
+    return UpdateProductOutput(id=product.id, name=product.name, price=product.price)
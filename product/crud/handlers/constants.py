@@ -1,2 +1,14 @@
 PRODUCT_PATH = '/api/product/<product_id>'
 PRODUCTS_PATH = '/api/products'
+PRODUCTS_BATCH_GET_PATH = '/api/products/batch-get'
+PRODUCTS_BATCH_WRITE_PATH = '/api/products/batch-write'
+PRODUCTS_STATS_PATH = '/api/products/stats'
+PRODUCTS_EXPORT_PATH = '/api/products/export'
+CONSISTENT_READ_HEADER = 'x-consistent-read'  # 'true' or 'false', overrides the route read consistency mode
+DEFAULT_PAGE_SIZE = 20
+COMPRESSION_MIN_BYTES = 1024  # smaller bodies are sent as is, gzip would barely shrink them
+COMPRESSION_LEVEL = 6  # gzip level, the higher levels cost much more CPU for a few more bytes
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+EXPORT_NEXT_TOKEN_HEADER = 'x-next-token'  # set while the export has more chunks, sent back as ?next_token=
+EXPORT_CHUNK_MAX_BYTES = 3 * 1024 * 1024  # escaped again in the Lambda response, a chunk stays under the 6 MB payload limit
+CURSOR_SIGNING_KEY_MAX_AGE_SECONDS = 300  # the key is read from Secrets Manager once per container, a rotated key shows up within 5 minutes
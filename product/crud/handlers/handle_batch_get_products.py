@@ -0,0 +1,41 @@
+from aws_lambda_env_modeler import get_environment_variables, init_environment_variables
+from aws_lambda_powertools.event_handler import Response
+from aws_lambda_powertools.logging import correlation_paths
+from aws_lambda_powertools.metrics import MetricUnit
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+from product.crud.domain_logic.batch_get_products import batch_get_products
+from product.crud.handlers.constants import PRODUCTS_BATCH_GET_PATH
+from product.crud.handlers.models.env_vars import BatchGetVars
+from product.crud.handlers.utils.json_response import json_response
+from product.crud.handlers.utils.rest_api_resolver import app
+from product.crud.models.input import BatchGetProductsRequest
+from product.crud.models.output import BatchGetProductsOutput
+from product.log_buffer import lazy
+from product.observability import log_handler, logger, metrics, tracer
+
+
+@app.post(PRODUCTS_BATCH_GET_PATH)
+def handle_batch_get_products() -> Response[str]:
+    env_vars: BatchGetVars = get_environment_variables(model=BatchGetVars)
+    logger.debug('environment variables', env_vars=lazy(env_vars.model_dump))
+
+    # we want to extract and parse the HTTP body from the api gw envelope
+    batch_input: BatchGetProductsRequest = BatchGetProductsRequest.model_validate(app.current_event.raw_event)
+    logger.info('got a batch get products request', requested=len(batch_input.body.ids))
+    metrics.add_metric(name='BatchGetProductsEvents', unit=MetricUnit.Count, value=1)
+    metrics.add_metric(name='BatchGetProductsRequestedIds', unit=MetricUnit.Count, value=len(batch_input.body.ids))
+
+    response: BatchGetProductsOutput = batch_get_products(product_ids=batch_input.body.ids, table_name=env_vars.TABLE_NAME)
+
+    logger.info('finished handling batch get products request', missing=len(response.missing_ids))
+    return json_response(response)
+
+
+@init_environment_variables(model=BatchGetVars)
+@log_handler.buffer_invocation
+@logger.inject_lambda_context(correlation_id_path=correlation_paths.API_GATEWAY_REST)
+@metrics.log_metrics
+@tracer.capture_lambda_handler(capture_response=False)
+def lambda_handler(event: dict, context: LambdaContext) -> dict:
+    return app.resolve(event, context)
@@ -0,0 +1,55 @@
+from aws_lambda_env_modeler import get_environment_variables, init_environment_variables
+from aws_lambda_powertools.event_handler import Response
+from aws_lambda_powertools.logging import correlation_paths
+from aws_lambda_powertools.metrics import MetricUnit
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+from product.crud.domain_logic.batch_write_products import batch_write_products
+from product.crud.handlers.constants import PRODUCTS_BATCH_WRITE_PATH
+from product.crud.handlers.models.env_vars import BatchWriteVars
+from product.crud.handlers.utils.json_response import json_response
+from product.crud.handlers.utils.rest_api_resolver import app
+from product.crud.models.input import BatchWriteProductsRequest
+from product.crud.models.output import BatchWriteProductsOutput
+from product.crud.models.product import Product
+from product.log_buffer import lazy
+from product.observability import log_handler, logger, metrics, tracer
+
+
+@app.post(
+    PRODUCTS_BATCH_WRITE_PATH,
+    summary='Upserts and deletes products in a single batch',
+    description=(
+        'Puts are upserts: a product that already exists is replaced, creation time included, unlike the create product route that rejects it.'
+    ),
+)
+def handle_batch_write_products() -> Response[str]:
+    env_vars: BatchWriteVars = get_environment_variables(model=BatchWriteVars)
+    logger.debug('environment variables', env_vars=lazy(env_vars.model_dump))
+
+    # we want to extract and parse the HTTP body from the api gw envelope
+    batch_input: BatchWriteProductsRequest = BatchWriteProductsRequest.model_validate(app.current_event.raw_event)
+    logger.info('got a batch write products request', puts=len(batch_input.body.puts), deletes=len(batch_input.body.deletes))
+    metrics.add_metric(name='BatchWriteProductsEvents', unit=MetricUnit.Count, value=1)
+
+    response: BatchWriteProductsOutput = batch_write_products(
+        puts=[Product(id=product.id, name=product.name, price=product.price) for product in batch_input.body.puts],
+        deletes=batch_input.body.deletes,
+        table_name=env_vars.TABLE_NAME,
+        product_cache_size=env_vars.PRODUCT_CACHE_MAX_SIZE,
+        cache_url=env_vars.CACHE_URL.get_secret_value() if env_vars.CACHE_URL else None,
+    )
+
+    metrics.add_metric(name='BatchWriteProductsSucceeded', unit=MetricUnit.Count, value=response.succeeded)
+    metrics.add_metric(name='BatchWriteProductsFailed', unit=MetricUnit.Count, value=response.failed)
+    logger.info('finished handling batch write products request', succeeded=response.succeeded, failed=response.failed)
+    return json_response(response)
+
+
+@init_environment_variables(model=BatchWriteVars)
+@log_handler.buffer_invocation
+@logger.inject_lambda_context(correlation_id_path=correlation_paths.API_GATEWAY_REST)
+@metrics.log_metrics
+@tracer.capture_lambda_handler(capture_response=False)
+def lambda_handler(event: dict, context: LambdaContext) -> dict:
+    return app.resolve(event, context)
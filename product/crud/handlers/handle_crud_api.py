@@ -0,0 +1,29 @@
+from aws_lambda_env_modeler import init_environment_variables
+from aws_lambda_powertools.logging import correlation_paths
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+# importing the route modules registers every CRUD route on the shared resolver
+from product.crud.handlers import (  # noqa: F401
+    handle_batch_get_products,
+    handle_batch_write_products,
+    handle_create_product,
+    handle_delete_product,
+    handle_export_products,
+    handle_get_product,
+    handle_get_products_stats,
+    handle_list_products,
+    handle_update_product,
+)
+from product.crud.handlers.models.env_vars import CrudApiVars
+from product.crud.handlers.utils.rest_api_resolver import app
+from product.observability import log_handler, logger, metrics, tracer
+
+
+@init_environment_variables(model=CrudApiVars)
+@log_handler.buffer_invocation
+@logger.inject_lambda_context(correlation_id_path=correlation_paths.API_GATEWAY_REST)
+@metrics.log_metrics
+@tracer.capture_lambda_handler(capture_response=False)
+def lambda_handler(event: dict, context: LambdaContext) -> dict:
+    # single function router mode, all the routes share one warm pool of containers
+    return app.resolve(event, context)
@@ -10,13 +10,14 @@ from product.crud.handlers.constants import PRODUCT_PATH
 from product.crud.handlers.models.env_vars import DeleteVars
 from product.crud.handlers.utils.rest_api_resolver import app
 from product.crud.models.input import DeleteProductRequest
-from product.observability import logger, metrics, tracer
+from product.log_buffer import lazy
+from product.observability import log_handler, logger, metrics, tracer
 
 
 @app.delete(PRODUCT_PATH)
 def handle_delete_product(product_id: str) -> tuple[None, HTTPStatus]:
     env_vars: DeleteVars = get_environment_variables(model=DeleteVars)
-    logger.debug('environment variables', env_vars=env_vars.model_dump())
+    logger.debug('environment variables', env_vars=lazy(env_vars.model_dump))
 
     DeleteProductRequest.model_validate(app.current_event.raw_event)
 
@@ -24,13 +25,19 @@ def handle_delete_product(product_id: str) -> tuple[None, HTTPStatus]:
     logger.info('got a delete product request')
     metrics.add_metric(name='DeleteProductEvents', unit=MetricUnit.Count, value=1)
 
-    delete_product(product_id=product_id, table_name=env_vars.TABLE_NAME)
+    delete_product(
+        product_id=product_id,
+        table_name=env_vars.TABLE_NAME,
+        product_cache_size=env_vars.PRODUCT_CACHE_MAX_SIZE,
+        cache_url=env_vars.CACHE_URL.get_secret_value() if env_vars.CACHE_URL else None,
+    )
 
     logger.info('finished handling delete product request')
     return None, HTTPStatus.NO_CONTENT
 
 
 @init_environment_variables(model=DeleteVars)
+@log_handler.buffer_invocation
 @logger.inject_lambda_context(correlation_id_path=correlation_paths.API_GATEWAY_REST)
 @metrics.log_metrics
 @tracer.capture_lambda_handler(capture_response=False)
@@ -0,0 +1,52 @@
+from http import HTTPStatus
+
+from aws_lambda_env_modeler import get_environment_variables, init_environment_variables
+from aws_lambda_powertools.event_handler import Response
+from aws_lambda_powertools.logging import correlation_paths
+from aws_lambda_powertools.metrics import MetricUnit
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+from product.crud.domain_logic.export_products import export_products
+from product.crud.handlers.constants import EXPORT_CHUNK_MAX_BYTES, EXPORT_NEXT_TOKEN_HEADER, NDJSON_CONTENT_TYPE, PRODUCTS_EXPORT_PATH
+from product.crud.handlers.models.env_vars import ExportVars
+from product.crud.handlers.utils.cursor_signing_key import get_cursor_signing_key
+from product.crud.handlers.utils.read_consistency import resolve_consistent_read
+from product.crud.handlers.utils.rest_api_resolver import app
+from product.crud.models.input import ExportProductsQueryParams, ExportProductsRequest
+from product.crud.models.output import ExportProductsOutput
+from product.log_buffer import lazy
+from product.observability import log_handler, logger, metrics, tracer
+
+
+@app.get(PRODUCTS_EXPORT_PATH)
+def handle_export_products() -> Response[str]:
+    env_vars: ExportVars = get_environment_variables(model=ExportVars)
+    logger.debug('environment variables', env_vars=lazy(env_vars.model_dump))
+
+    export_input: ExportProductsRequest = ExportProductsRequest.model_validate(app.current_event.raw_event)
+    query_params: ExportProductsQueryParams = export_input.queryStringParameters or ExportProductsQueryParams()
+    logger.info('got an export products request', first_chunk=query_params.next_token is None)
+    metrics.add_metric(name='ExportProductsEvents', unit=MetricUnit.Count, value=1)
+
+    response: ExportProductsOutput = export_products(
+        table_name=env_vars.TABLE_NAME,
+        cursor_signing_key=get_cursor_signing_key(env_vars),
+        max_bytes=EXPORT_CHUNK_MAX_BYTES,
+        next_token=query_params.next_token,
+        consistent_read=resolve_consistent_read(env_vars.CONSISTENT_READ),
+        fields=query_params.fields,
+    )
+
+    logger.info('finished handling export products request')
+    # the body is the chunk itself, one product per line, the continuation token travels in a header
+    headers = {EXPORT_NEXT_TOKEN_HEADER: response.next_token} if response.next_token else None
+    return Response(status_code=HTTPStatus.OK, content_type=NDJSON_CONTENT_TYPE, body=response.products, headers=headers)
+
+
+@init_environment_variables(model=ExportVars)
+@log_handler.buffer_invocation
+@logger.inject_lambda_context(correlation_id_path=correlation_paths.API_GATEWAY_REST)
+@metrics.log_metrics
+@tracer.capture_lambda_handler(capture_response=False)
+def lambda_handler(event: dict, context: LambdaContext) -> dict:
+    return app.resolve(event, context)
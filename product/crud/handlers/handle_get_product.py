@@ -1,6 +1,5 @@
-from typing import Any
-
 from aws_lambda_env_modeler import get_environment_variables, init_environment_variables
+from aws_lambda_powertools.event_handler import Response
 from aws_lambda_powertools.logging import correlation_paths
 from aws_lambda_powertools.metrics import MetricUnit
 from aws_lambda_powertools.utilities.typing import LambdaContext
@@ -8,30 +7,49 @@ from aws_lambda_powertools.utilities.typing import LambdaContext
 from product.crud.domain_logic.get_product import get_product
 from product.crud.handlers.constants import PRODUCT_PATH
 from product.crud.handlers.models.env_vars import GetVars
+from product.crud.handlers.utils.conditional_get import get_etag, is_not_modified
+from product.crud.handlers.utils.json_response import json_response, not_modified_response
+from product.crud.handlers.utils.read_consistency import resolve_consistent_read
 from product.crud.handlers.utils.rest_api_resolver import app
-from product.crud.models.input import GetProductRequest
+from product.crud.models.input import GetProductQueryParams, GetProductRequest
 from product.crud.models.output import GetProductOutput
-from product.observability import logger, metrics, tracer
+from product.log_buffer import lazy
+from product.observability import log_handler, logger, metrics, tracer
 
 
 @app.get(PRODUCT_PATH)
-def handle_get_product(product_id: str) -> dict[str, Any]:
+def handle_get_product(product_id: str) -> Response[str]:
     env_vars: GetVars = get_environment_variables(model=GetVars)
-    logger.debug('environment variables', env_vars=env_vars.model_dump())
+    logger.debug('environment variables', env_vars=lazy(env_vars.model_dump))
 
-    GetProductRequest.model_validate(app.current_event.raw_event)
+    get_input: GetProductRequest = GetProductRequest.model_validate(app.current_event.raw_event)
+    query_params: GetProductQueryParams = get_input.queryStringParameters or GetProductQueryParams()
 
     logger.append_keys(product_id=product_id)
     logger.info('got a get product request')
     metrics.add_metric(name='GetProductEvents', unit=MetricUnit.Count, value=1)
 
-    response: GetProductOutput = get_product(product_id=product_id, table_name=env_vars.TABLE_NAME)
+    response: GetProductOutput = get_product(
+        product_id=product_id,
+        table_name=env_vars.TABLE_NAME,
+        product_cache_size=env_vars.PRODUCT_CACHE_MAX_SIZE,
+        consistent_read=resolve_consistent_read(env_vars.CONSISTENT_READ),
+        fields=query_params.fields,
+        cache_url=env_vars.CACHE_URL.get_secret_value() if env_vars.CACHE_URL else None,
+    )
+
+    # the product item is as small as its validator, the write time read with it is checked before the body is built
+    etag = get_etag(product_id, response.updated_at, query_params.fields) if response.updated_at is not None else None
+    if etag is not None and is_not_modified(app.current_event, etag):
+        logger.info('finished handling get product request, product was not modified')
+        return not_modified_response(etag, max_age_seconds=env_vars.GET_PRODUCT_MAX_AGE_SECONDS)
 
-    logger.info('finished handling get product request, product was not found')
-    return response.model_dump()
+    logger.info('finished handling get product request')
+    return json_response(response, exclude_unset=True, max_age_seconds=env_vars.GET_PRODUCT_MAX_AGE_SECONDS, etag=etag)
 
 
 @init_environment_variables(model=GetVars)
+@log_handler.buffer_invocation
 @logger.inject_lambda_context(correlation_id_path=correlation_paths.API_GATEWAY_REST)
 @metrics.log_metrics
 @tracer.capture_lambda_handler(capture_response=False)
@@ -0,0 +1,46 @@
+from aws_lambda_env_modeler import get_environment_variables, init_environment_variables
+from aws_lambda_powertools.event_handler import Response
+from aws_lambda_powertools.logging import correlation_paths
+from aws_lambda_powertools.metrics import MetricUnit
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+from product.crud.domain_logic.get_catalog_version import get_catalog_version
+from product.crud.domain_logic.get_products_stats import get_products_stats
+from product.crud.handlers.constants import PRODUCTS_STATS_PATH
+from product.crud.handlers.models.env_vars import StatsVars
+from product.crud.handlers.utils.conditional_get import get_etag, is_not_modified
+from product.crud.handlers.utils.json_response import json_response, not_modified_response
+from product.crud.handlers.utils.rest_api_resolver import app
+from product.crud.models.output import ProductsStatsOutput
+from product.log_buffer import lazy
+from product.observability import log_handler, logger, metrics, tracer
+
+
+@app.get(PRODUCTS_STATS_PATH)
+def handle_get_products_stats() -> Response[str]:
+    env_vars: StatsVars = get_environment_variables(model=StatsVars)
+    logger.debug('environment variables', env_vars=lazy(env_vars.model_dump))
+
+    logger.info('got a get products stats request')
+    metrics.add_metric(name='GetProductsStatsEvents', unit=MetricUnit.Count, value=1)
+
+    # the catalog version is read before the statistics, which are only read and built when the client doesn't hold them yet
+    version = get_catalog_version(table_name=env_vars.TABLE_NAME, catalog_table_name=env_vars.CATALOG_TABLE_NAME)
+    if is_not_modified(app.current_event, get_etag(version)):
+        logger.info('finished handling get products stats request, statistics were not modified')
+        return not_modified_response(get_etag(version))
+
+    response: ProductsStatsOutput = get_products_stats(table_name=env_vars.TABLE_NAME, catalog_table_name=env_vars.CATALOG_TABLE_NAME)
+
+    logger.info('finished handling get products stats request')
+    # tagged with the version of the statistics read, they may be newer than the version checked above
+    return json_response(response, etag=get_etag(response.version))
+
+
+@init_environment_variables(model=StatsVars)
+@log_handler.buffer_invocation
+@logger.inject_lambda_context(correlation_id_path=correlation_paths.API_GATEWAY_REST)
+@metrics.log_metrics
+@tracer.capture_lambda_handler(capture_response=False)
+def lambda_handler(event: dict, context: LambdaContext) -> dict:
+    return app.resolve(event, context)
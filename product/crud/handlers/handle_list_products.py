@@ -1,30 +1,74 @@
-from typing import Any
+from typing import Optional
 
 from aws_lambda_env_modeler import get_environment_variables, init_environment_variables
+from aws_lambda_powertools.event_handler import Response
 from aws_lambda_powertools.logging import correlation_paths
 from aws_lambda_powertools.metrics import MetricUnit
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
+from product.crud.domain_logic.get_catalog_version import get_catalog_version
 from product.crud.domain_logic.list_products import list_products
-from product.crud.handlers.constants import PRODUCTS_PATH
+from product.crud.handlers.constants import DEFAULT_PAGE_SIZE, PRODUCTS_PATH
 from product.crud.handlers.models.env_vars import ListVars
+from product.crud.handlers.utils.conditional_get import get_etag, is_not_modified
+from product.crud.handlers.utils.cursor_signing_key import get_cursor_signing_key
+from product.crud.handlers.utils.json_response import json_response, not_modified_response
+from product.crud.handlers.utils.read_consistency import resolve_consistent_read
 from product.crud.handlers.utils.rest_api_resolver import app
+from product.crud.models.input import ListProductsQueryParams, ListProductsRequest
 from product.crud.models.output import ListProductsOutput
-from product.observability import logger, metrics, tracer
+from product.log_buffer import lazy
+from product.observability import log_handler, logger, metrics, tracer
 
 
 @app.get(PRODUCTS_PATH)
-def handle_list_products() -> dict[str, Any]:
+def handle_list_products() -> Response[str]:
     env_vars: ListVars = get_environment_variables(model=ListVars)
-    logger.debug('environment variables', env_vars=env_vars.model_dump())
+    logger.debug('environment variables', env_vars=lazy(env_vars.model_dump))
+
+    list_input: ListProductsRequest = ListProductsRequest.model_validate(app.current_event.raw_event)
+    query_params: ListProductsQueryParams = list_input.queryStringParameters or ListProductsQueryParams()
+    logger.info('got a list products request', limit=query_params.limit, sort=query_params.sort, first_page=query_params.next_token is None)
     metrics.add_metric(name='ListProductsEvents', unit=MetricUnit.Count, value=1)
 
-    response: ListProductsOutput = list_products(table_name=env_vars.TABLE_NAME)
+    consistent_read = resolve_consistent_read(env_vars.CONSISTENT_READ)
+    etag = _get_page_etag(env_vars, query_params, consistent_read)
+    if etag is not None and is_not_modified(app.current_event, etag):
+        logger.info('finished handling list products request, page was not modified')
+        return not_modified_response(etag, max_age_seconds=env_vars.LIST_PRODUCTS_MAX_AGE_SECONDS)
+
+    response: ListProductsOutput = list_products(
+        table_name=env_vars.TABLE_NAME,
+        limit=query_params.limit or DEFAULT_PAGE_SIZE,
+        cursor_signing_key=get_cursor_signing_key(env_vars),
+        next_token=query_params.next_token,
+        prefetch_next_page=env_vars.PREFETCH_NEXT_PAGE,
+        consistent_read=consistent_read,
+        fields=query_params.fields,
+        sort=query_params.sort,
+        catalog_table_name=env_vars.CATALOG_TABLE_NAME,
+        product_cache_size=env_vars.PRODUCT_CACHE_MAX_SIZE,
+        cache_url=env_vars.CACHE_URL.get_secret_value() if env_vars.CACHE_URL else None,
+    )
     logger.info('finished handling list products request')
-    return response.model_dump()
+    return json_response(response, exclude_unset=True, max_age_seconds=env_vars.LIST_PRODUCTS_MAX_AGE_SECONDS, etag=etag)
+
+
+def _get_page_etag(env_vars: ListVars, query_params: ListProductsQueryParams, consistent_read: bool) -> Optional[str]:
+    # the catalog version validates eventually consistent pages before any of them is read, consistent pages are never tagged
+    if consistent_read or env_vars.CATALOG_TABLE_NAME is None:
+        return None
+    version = get_catalog_version(
+        table_name=env_vars.TABLE_NAME,
+        catalog_table_name=env_vars.CATALOG_TABLE_NAME,
+        product_cache_size=env_vars.PRODUCT_CACHE_MAX_SIZE,
+        cache_url=env_vars.CACHE_URL.get_secret_value() if env_vars.CACHE_URL else None,
+    )
+    return get_etag(version, query_params.limit, query_params.next_token, query_params.fields, query_params.sort)
 
 
 @init_environment_variables(model=ListVars)
+@log_handler.buffer_invocation
 @logger.inject_lambda_context(correlation_id_path=correlation_paths.API_GATEWAY_REST)
 @metrics.log_metrics
 @tracer.capture_lambda_handler(capture_response=False)
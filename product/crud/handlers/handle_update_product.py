@@ -0,0 +1,49 @@
+from aws_lambda_env_modeler import get_environment_variables, init_environment_variables
+from aws_lambda_powertools.event_handler import Response
+from aws_lambda_powertools.logging import correlation_paths
+from aws_lambda_powertools.metrics import MetricUnit
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+from product.crud.domain_logic.update_product import update_product
+from product.crud.handlers.constants import PRODUCT_PATH
+from product.crud.handlers.models.env_vars import UpdateVars
+from product.crud.handlers.utils.json_response import json_response
+from product.crud.handlers.utils.rest_api_resolver import app
+from product.crud.models.input import UpdateProductInput
+from product.crud.models.output import UpdateProductOutput
+from product.crud.models.product import ProductUpdate
+from product.log_buffer import lazy
+from product.observability import log_handler, logger, metrics, tracer
+
+
+@app.patch(PRODUCT_PATH)
+def handle_update_product(product_id: str) -> Response[str]:
+    env_vars: UpdateVars = get_environment_variables(model=UpdateVars)
+    logger.debug('environment variables', env_vars=lazy(env_vars.model_dump))
+
+    # we want to extract and parse the HTTP body from the api gw envelope
+    update_input: UpdateProductInput = UpdateProductInput.model_validate(app.current_event.raw_event)
+    logger.append_keys(product_id=product_id)
+
+    logger.info('got a valid update product request', update=update_input.body.model_dump(exclude_none=True))
+    metrics.add_metric(name='UpdateProductEvents', unit=MetricUnit.Count, value=1)
+
+    response: UpdateProductOutput = update_product(
+        product_id=product_id,
+        update=ProductUpdate(name=update_input.body.name, price=update_input.body.price),
+        table_name=env_vars.TABLE_NAME,
+        product_cache_size=env_vars.PRODUCT_CACHE_MAX_SIZE,
+        cache_url=env_vars.CACHE_URL.get_secret_value() if env_vars.CACHE_URL else None,
+    )
+
+    logger.info('finished handling update product request')
+    return json_response(response)
+
+
+@init_environment_variables(model=UpdateVars)
+@log_handler.buffer_invocation
+@logger.inject_lambda_context(correlation_id_path=correlation_paths.API_GATEWAY_REST)
+@metrics.log_metrics
+@tracer.capture_lambda_handler(capture_response=False)
+def lambda_handler(event: dict, context: LambdaContext) -> dict:
+    return app.resolve(event, context)
@@ -1,28 +1,95 @@
-from typing import Annotated, Literal
+from typing import Annotated, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SecretStr, model_validator
 
+from product.crud.integration.constants import PRODUCT_CACHE_MAX_SIZE
 
-class Observability(BaseModel):
+
+# built when a handler first reads its variables, not when the handler module is imported
+class Observability(BaseModel, defer_build=True):
     POWERTOOLS_SERVICE_NAME: Annotated[str, Field(min_length=1)]
     LOG_LEVEL: Literal['DEBUG', 'INFO', 'ERROR', 'CRITICAL', 'WARNING', 'EXCEPTION']
+    # read by the log handler when the logger is created, declared here so invalid values fail the invocation
+    LOG_DEBUG_BUFFER: bool = False  # records below LOG_LEVEL are buffered and only emitted when the invocation fails
+    LOG_INFO_SAMPLE_RATE: Annotated[float, Field(ge=0, le=1)] = 1.0  # share of invocations emitting their records below WARNING
 
 
-class Idempotency(BaseModel):
+class Idempotency(BaseModel, defer_build=True):
     IDEMPOTENCY_TABLE_NAME: Annotated[str, Field(min_length=1)]
 
 
-class CreateVars(Observability, Idempotency):
+class Pagination(BaseModel, defer_build=True):
+    # deployed functions read the key from Secrets Manager, it never shows in the template or the function configuration
+    CURSOR_SIGNING_SECRET_ARN: Optional[Annotated[str, Field(min_length=1)]] = None
+    CURSOR_SIGNING_KEY: Optional[Annotated[SecretStr, Field(min_length=16)]] = None  # the key itself, for local runs and tests
+    PREFETCH_NEXT_PAGE: bool = False
+
+    @model_validator(mode='after')
+    def check_cursor_signing_key(self) -> 'Pagination':
+        if self.CURSOR_SIGNING_SECRET_ARN is None and self.CURSOR_SIGNING_KEY is None:
+            raise ValueError('CURSOR_SIGNING_SECRET_ARN or CURSOR_SIGNING_KEY must be set')
+        return self
+
+
+class ProductCache(BaseModel, defer_build=True):
+    PRODUCT_CACHE_MAX_SIZE: Annotated[int, Field(ge=0, le=100_000)] = PRODUCT_CACHE_MAX_SIZE  # 0 disables the cache
+
+
+class SharedCache(BaseModel, defer_build=True):
+    # redis:// or rediss:// URL of a Redis protocol server, memory:// for a per container stand-in. Disabled when not set
+    CACHE_URL: Optional[SecretStr] = None  # secret, the URL may hold a password
+
+
+class ReadConsistency(BaseModel, defer_build=True):
+    CONSISTENT_READ: bool = True  # strongly consistent reads unless the route or the request opts out
+
+
+class CatalogSnapshot(BaseModel, defer_build=True):
+    CATALOG_TABLE_NAME: Optional[Annotated[str, Field(min_length=1)]] = None  # eventually consistent lists read the snapshot when set
+
+
+# handlers writing products share the cache configuration of the reads, their container wide handler drops what they changed
+class CreateVars(Observability, Idempotency, ProductCache, SharedCache, defer_build=True):
+    TABLE_NAME: Annotated[str, Field(min_length=1)]
+    # 'single_write' makes a create retry idempotent through the product ID alone, without the idempotency table
+    CREATE_IDEMPOTENCY_MODE: Literal['idempotency_table', 'single_write'] = 'idempotency_table'
+
+
+class GetVars(Observability, ProductCache, ReadConsistency, SharedCache, defer_build=True):
     TABLE_NAME: Annotated[str, Field(min_length=1)]
+    GET_PRODUCT_MAX_AGE_SECONDS: Annotated[int, Field(ge=0)] = 0  # Cache-Control max-age of product responses, 0 sends none
 
 
-class GetVars(Observability):
+class DeleteVars(Observability, ProductCache, SharedCache, defer_build=True):
     TABLE_NAME: Annotated[str, Field(min_length=1)]
 
 
-class DeleteVars(Observability):
+class UpdateVars(Observability, ProductCache, SharedCache, defer_build=True):
     TABLE_NAME: Annotated[str, Field(min_length=1)]
 
 
-class ListVars(Observability):
+class ListVars(Observability, Pagination, ProductCache, ReadConsistency, CatalogSnapshot, SharedCache, defer_build=True):
     TABLE_NAME: Annotated[str, Field(min_length=1)]
+    LIST_PRODUCTS_MAX_AGE_SECONDS: Annotated[int, Field(ge=0)] = 0  # Cache-Control max-age of list pages, 0 sends none
+
+
+class ExportVars(Observability, Pagination, ReadConsistency, defer_build=True):
+    TABLE_NAME: Annotated[str, Field(min_length=1)]
+
+
+class BatchGetVars(Observability, defer_build=True):
+    TABLE_NAME: Annotated[str, Field(min_length=1)]
+
+
+class BatchWriteVars(Observability, ProductCache, SharedCache, defer_build=True):
+    TABLE_NAME: Annotated[str, Field(min_length=1)]
+
+
+class StatsVars(Observability, defer_build=True):
+    TABLE_NAME: Annotated[str, Field(min_length=1)]
+    CATALOG_TABLE_NAME: Annotated[str, Field(min_length=1)]
+
+
+class CrudApiVars(CreateVars, GetVars, DeleteVars, UpdateVars, ListVars, ExportVars, BatchGetVars, BatchWriteVars, StatsVars, defer_build=True):
+    # a single function serving every route needs the variables of all of them
+    CATALOG_TABLE_NAME: Annotated[str, Field(min_length=1)]
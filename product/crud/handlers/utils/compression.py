@@ -0,0 +1,60 @@
+import base64
+import gzip
+
+from aws_lambda_powertools.event_handler import APIGatewayRestResolver, Response
+from aws_lambda_powertools.event_handler.middlewares import NextMiddleware
+from aws_lambda_powertools.metrics import MetricUnit
+
+from product.crud.handlers.constants import COMPRESSION_LEVEL, COMPRESSION_MIN_BYTES
+from product.observability import logger, metrics
+
+_GZIP = 'gzip'
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    # e.g. 'br;q=1.0, gzip;q=0.8, *;q=0.1', a zero quality value refuses the encoding
+    qualities: dict[str, str] = {}
+    for encoding in accept_encoding.split(','):
+        coding, _, params = encoding.strip().partition(';')
+        qualities.setdefault(coding.strip().lower(), params.strip().removeprefix('q='))
+    # an explicit gzip entry takes precedence over the wildcard, whatever their order
+    quality = qualities.get(_GZIP, qualities.get('*'))
+    if quality is None:
+        return False
+    try:
+        return not quality or float(quality) > 0
+    except ValueError:
+        return False
+
+
+def compress_response(app: APIGatewayRestResolver, next_middleware: NextMiddleware) -> Response:
+    """Resolver middleware compressing response bodies with gzip when the client accepts it.
+
+    Bodies under COMPRESSION_MIN_BYTES are sent as is. A compressed body is sent base64 encoded, API Gateway decodes it
+    for the client. Error responses built by the exception handlers are never compressed.
+    """
+    response = next_middleware(app)
+    body = response.body
+    if not isinstance(body, (str, bytes)) or 'Content-Encoding' in response.headers:
+        return response
+    raw_body = body.encode('utf-8') if isinstance(body, str) else body
+    if len(raw_body) < COMPRESSION_MIN_BYTES:
+        return response
+
+    response.headers['Vary'] = 'Accept-Encoding'  # caches must not serve a compressed body to a client that didn't ask for it
+    accept_encoding = app.current_event.get_header_value(name='accept-encoding', default_value='', case_sensitive=False)
+    if not _accepts_gzip(accept_encoding):
+        return response
+
+    compressed_body = gzip.compress(raw_body, compresslevel=COMPRESSION_LEVEL)
+    metrics.add_metric(name='UncompressedResponseBytes', unit=MetricUnit.Bytes, value=len(raw_body))
+    metrics.add_metric(name='CompressedResponseBytes', unit=MetricUnit.Bytes, value=len(compressed_body))
+    logger.debug('compressed response body', uncompressed_bytes=len(raw_body), compressed_bytes=len(compressed_body))
+    # encoded here, the resolver would run a JSON body that isn't a string through its serializer
+    response.body = base64.b64encode(compressed_body).decode('ascii')
+    response.base64_encoded = True
+    response.headers['Content-Encoding'] = _GZIP
+    etag = response.headers.get('ETag')
+    if isinstance(etag, str) and not etag.startswith('W/'):
+        response.headers['ETag'] = f'W/{etag}'  # the compressed bytes differ, the tag of the uncompressed representation is weak for them
+    return response
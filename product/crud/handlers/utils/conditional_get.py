@@ -0,0 +1,54 @@
+import hashlib
+
+from aws_lambda_powertools.metrics import MetricUnit
+from aws_lambda_powertools.utilities.data_classes.common import BaseProxyEvent
+
+from product.observability import logger, metrics
+
+_WEAK_PREFIX = 'W/'
+
+
+def get_etag(*validators: object) -> str:
+    """Builds a strong ETag from cheap validators of a representation, without building the representation itself.
+
+    Parameters
+    ----------
+    validators : object
+        A version of the resource that changes with every write of it, and the request parameters shaping the response
+
+    Returns
+    -------
+    str
+        Quoted entity tag, it changes with any of the validators
+    """
+    return f'"{hashlib.sha256(repr(validators).encode("utf-8")).hexdigest()[:32]}"'
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses the weak comparison, a weak tag of the same representation matches
+    if if_none_match.strip() == '*':
+        return True
+    return any(tag.strip().removeprefix(_WEAK_PREFIX) == etag for tag in if_none_match.split(','))
+
+
+def is_not_modified(event: BaseProxyEvent, etag: str) -> bool:
+    """Whether the client already holds the representation of an ETag, checked before the representation is read or built.
+
+    Parameters
+    ----------
+    event : BaseProxyEvent
+        Current API Gateway event, its If-None-Match header lists the tags the client holds
+    etag : str
+        ETag of the current representation, see `get_etag`
+
+    Returns
+    -------
+    bool
+        True when a 304 Not Modified answers the request
+    """
+    if_none_match = event.get_header_value(name='if-none-match', default_value='', case_sensitive=False)
+    if not if_none_match or not _matches(if_none_match, etag):
+        return False
+    logger.debug('resource not modified, sending 304', etag=etag)
+    metrics.add_metric(name='NotModifiedResponses', unit=MetricUnit.Count, value=1)
+    return True
@@ -0,0 +1,23 @@
+from product.crud.handlers.constants import CURSOR_SIGNING_KEY_MAX_AGE_SECONDS
+from product.crud.handlers.models.env_vars import Pagination
+
+
+def get_cursor_signing_key(env_vars: Pagination) -> str:
+    """Returns the key signing the pagination tokens of the current request.
+
+    Parameters
+    ----------
+    env_vars : Pagination
+        Pagination environment variables, `CURSOR_SIGNING_KEY` wins over `CURSOR_SIGNING_SECRET_ARN`
+
+    Returns
+    -------
+    str
+        Cursor signing key, cached by the container for `CURSOR_SIGNING_KEY_MAX_AGE_SECONDS`
+    """
+    if env_vars.CURSOR_SIGNING_KEY is not None:
+        return env_vars.CURSOR_SIGNING_KEY.get_secret_value()
+    # only loaded by the routes issuing pagination tokens
+    from aws_lambda_powertools.utilities import parameters
+
+    return str(parameters.get_secret(str(env_vars.CURSOR_SIGNING_SECRET_ARN), max_age=CURSOR_SIGNING_KEY_MAX_AGE_SECONDS))
@@ -0,0 +1,70 @@
+from http import HTTPStatus
+from typing import Optional, Union
+
+from aws_lambda_powertools.event_handler import Response, content_types
+from pydantic import BaseModel
+
+
+def _get_cache_headers(max_age_seconds: int, etag: Optional[str]) -> Optional[dict[str, Union[str, list[str]]]]:
+    headers: dict[str, Union[str, list[str]]] = {}
+    if max_age_seconds > 0:
+        # public, the catalog is the same for every authenticated caller and the stage cache, keyed without the caller, serves it to all of them
+        headers['Cache-Control'] = f'public, max-age={max_age_seconds}'
+    if etag is not None:
+        headers['ETag'] = etag
+    return headers or None
+
+
+def json_response(
+    output: BaseModel,
+    exclude_unset: bool = False,
+    status_code: HTTPStatus = HTTPStatus.OK,
+    max_age_seconds: int = 0,
+    etag: Optional[str] = None,
+) -> Response[str]:
+    """Builds a JSON response encoded straight from the output model.
+
+    Pydantic encodes the model in a single pass, a returned dict would be dumped and then encoded again by the resolver.
+
+    Parameters
+    ----------
+    output : BaseModel
+        Output model of the route
+    exclude_unset : bool, optional
+        Whether to leave out the fields that were not set, by default False
+    status_code : HTTPStatus, optional
+        Response status code, by default 200
+    max_age_seconds : int, optional
+        Seconds clients may reuse the response for, sent as `Cache-Control: public, max-age`, by default 0 sends no header
+    etag : Optional[str], optional
+        ETag of the output, see `get_etag`, by default None sends no header
+
+    Returns
+    -------
+    Response[str]
+        Response with the encoded output as its body
+    """
+    return Response(
+        status_code=status_code,
+        content_type=content_types.APPLICATION_JSON,
+        body=output.model_dump_json(exclude_unset=exclude_unset),
+        headers=_get_cache_headers(max_age_seconds, etag),
+    )
+
+
+def not_modified_response(etag: str, max_age_seconds: int = 0) -> Response[str]:
+    """Builds a 304 Not Modified response, it refreshes the response the client holds and carries the same caching policy.
+
+    Parameters
+    ----------
+    etag : str
+        ETag the client holds
+    max_age_seconds : int, optional
+        Seconds clients may reuse the response for, by default 0 sends no Cache-Control header
+
+    Returns
+    -------
+    Response[str]
+        Response without a body
+    """
+    return Response(status_code=HTTPStatus.NOT_MODIFIED, headers=_get_cache_headers(max_age_seconds, etag))
@@ -0,0 +1,33 @@
+from aws_lambda_powertools.metrics import MetricUnit
+from pydantic import TypeAdapter
+
+from product.crud.handlers.constants import CONSISTENT_READ_HEADER
+from product.crud.handlers.utils.rest_api_resolver import app
+from product.observability import logger, metrics
+
+_HEADER_ADAPTER = TypeAdapter(bool)
+
+
+def resolve_consistent_read(route_default: bool) -> bool:
+    """Resolves the read consistency mode of the current request, the request header wins over the route default.
+
+    Parameters
+    ----------
+    route_default : bool
+        Read consistency mode configured for the route
+
+    Returns
+    -------
+    bool
+        True for a strongly consistent read, False for an eventually consistent read
+
+    Raises
+    ------
+    ValidationError
+        When the header value is not a boolean
+    """
+    header_value = app.current_event.get_header_value(name=CONSISTENT_READ_HEADER, case_sensitive=False)
+    consistent_read = route_default if header_value is None else _HEADER_ADAPTER.validate_python(header_value)
+    logger.debug('resolved read consistency mode', consistent_read=consistent_read, overridden=header_value is not None)
+    metrics.add_metric(name='ConsistentReads' if consistent_read else 'EventuallyConsistentReads', unit=MetricUnit.Count, value=1)
+    return consistent_read
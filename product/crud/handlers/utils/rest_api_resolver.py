@@ -4,10 +4,25 @@ from http import HTTPStatus
 from aws_lambda_powertools.event_handler import APIGatewayRestResolver, Response, content_types
 from pydantic import ValidationError
 
-from product.crud.models.exceptions import InternalServerException, ProductAlreadyExistsException, ProductNotFoundException
+from product.crud.handlers.utils.compression import compress_response
+from product.crud.models.exceptions import (
+    InternalServerException,
+    InvalidPaginationTokenException,
+    ProductAlreadyExistsException,
+    ProductNotFoundException,
+)
 from product.observability import logger
 
 app = APIGatewayRestResolver()
+# gzip for large bodies when the client accepts it, the GET routes tag their responses before they are compressed
+app.use(middlewares=[compress_response])
+
+# error bodies never change, they are encoded once per container
+_PRODUCT_NOT_FOUND_BODY = json.dumps({'error': 'product was not found'})
+_INVALID_INPUT_BODY = json.dumps({'error': 'invalid input'})
+_INTERNAL_SERVER_ERROR_BODY = json.dumps({'error': 'internal server error'})
+_PRODUCT_ALREADY_EXISTS_BODY = json.dumps({'error': 'product already exists'})
+_INVALID_PAGINATION_TOKEN_BODY = json.dumps({'error': 'invalid pagination token'})
 
 
 @app.exception_handler(ProductNotFoundException)
@@ -16,7 +31,7 @@ def handle_product_not_found_exception(ex: ProductNotFoundException):  # receive
     return Response(
         status_code=HTTPStatus.NOT_FOUND,
         content_type=content_types.APPLICATION_JSON,
-        body=json.dumps({'error': 'product was not found'}),
+        body=_PRODUCT_NOT_FOUND_BODY,
     )
 
 
@@ -26,7 +41,7 @@ def handle_input_validation_error(ex: ValidationError):  # receives exception ra
     return Response(
         status_code=HTTPStatus.BAD_REQUEST,
         content_type=content_types.APPLICATION_JSON,
-        body=json.dumps({'error': 'invalid input'}),  # readiness: change pydantic error to a user friendly error
+        body=_INVALID_INPUT_BODY,  # readiness: change pydantic error to a user friendly error
     )
 
 
@@ -36,7 +51,7 @@ def handle_internal_server_error(ex: InternalServerException):  # receives excep
     return Response(
         status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
         content_type=content_types.APPLICATION_JSON,
-        body=json.dumps({'error': 'internal server error'}),
+        body=_INTERNAL_SERVER_ERROR_BODY,
     )
 
 
@@ -46,5 +61,15 @@ def handle_product_already_exists_exception(ex: ProductAlreadyExistsException):
     return Response(
         status_code=HTTPStatus.BAD_REQUEST,
         content_type=content_types.APPLICATION_JSON,
-        body=json.dumps({'error': 'product already exists'}),
+        body=_PRODUCT_ALREADY_EXISTS_BODY,
+    )
+
+
+@app.exception_handler(InvalidPaginationTokenException)
+def handle_invalid_pagination_token_exception(ex: InvalidPaginationTokenException):  # receives exception raised
+    logger.exception('finished handling request with an error, pagination token is invalid')
+    return Response(
+        status_code=HTTPStatus.BAD_REQUEST,
+        content_type=content_types.APPLICATION_JSON,
+        body=_INVALID_PAGINATION_TOKEN_BODY,
     )
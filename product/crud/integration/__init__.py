@@ -1,9 +1,33 @@
 from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
+from product.aws_clients import prime_clients
+from product.crud.integration.constants import PRODUCT_CACHE_MAX_SIZE
 from product.crud.integration.db_handler import DbHandler
 from product.crud.integration.dynamo_db_handler import DynamoDbHandler
 
+if TYPE_CHECKING:
+    from product.cache.base import CacheBackend
+
+# imported by every CRUD handler, the client is created and connected during the Lambda init phase
+prime_clients('dynamodb')
+
+
+def get_db_handler(table_name: str, product_cache_size: int = PRODUCT_CACHE_MAX_SIZE, cache_url: Optional[str] = None) -> DbHandler:
+    """Returns the container wide handler of a table and cache configuration, one handler per configuration."""
+    # positional arguments, the memoization key doesn't depend on how the caller passed them
+    return _build_db_handler(table_name, product_cache_size, cache_url)
+
 
 @lru_cache
-def get_db_handler(table_name: str) -> DbHandler:
-    return DynamoDbHandler(table_name)
+def _build_db_handler(table_name: str, product_cache_size: int, cache_url: Optional[str]) -> DbHandler:
+    return DynamoDbHandler(table_name, product_cache_size=product_cache_size, cache_backend=_get_cache_backend(cache_url))
+
+
+def _get_cache_backend(cache_url: Optional[str]) -> Optional['CacheBackend']:
+    if not cache_url:
+        return None
+    # the cache backends are only imported by containers with a shared cache
+    from product.cache import get_cache_backend
+
+    return get_cache_backend(cache_url)
@@ -0,0 +1,21 @@
+PREFETCH_PAGES_CACHE_SIZE = 8
+PREFETCH_PAGES_TTL_SECONDS = 30  # a prefetched page is only served if it was read in the last 30 seconds
+MAX_SCAN_SEGMENTS = 16  # upper bound of parallel scan workers in a single container
+EXPORT_SCAN_PAGE_SIZE = 200  # products read per export scan page, only one page is held in memory at a time
+BATCH_GET_MAX_KEYS = 100  # BatchGetItem limit per request
+BATCH_GET_MAX_CONCURRENCY = 5  # BatchGetItem chunks read in parallel, all of a 500 ids batch
+CATALOG_MAX_SHARDS_PER_READ = 64  # snapshot items a list page reads at once, doubled from 1 until the page is full
+BATCH_MAX_ATTEMPTS = 5  # attempts to complete unprocessed keys or items before failing
+BATCH_RETRY_BASE_DELAY_SECONDS = 0.05  # exponential backoff with full jitter, 50ms, 100ms, 200ms...
+BATCH_WRITE_MAX_ITEMS = 25  # BatchWriteItem limit per request
+BATCH_WRITE_MAX_CONCURRENCY = 8  # BatchWriteItem chunks written in parallel
+PRODUCT_CACHE_MAX_SIZE = 1024  # default number of products cached in a single container
+PRODUCT_CACHE_TTL_SECONDS = 10  # found products may be served up to 10 seconds stale
+PRODUCT_CACHE_NEGATIVE_TTL_SECONDS = 2  # not found products are cached briefly so new products show up quickly
+SHARED_CACHE_PRODUCT_TTL_SECONDS = 60  # the stream processor drops changed products, the TTL bounds the staleness it misses
+SHARED_CACHE_PAGE_TTL_SECONDS = 30
+RECENCY_INDEX_NAME = 'created_at_index'  # GSI, partition key recency_bucket, sort key created_at
+RECENCY_BUCKET_ATTRIBUTE = 'recency_bucket'
+UPDATED_AT_ATTRIBUTE = 'updated_at'  # unix time in milliseconds of the last write, the validator of conditional product reads
+RECENCY_BUCKETS = 4  # spreads new product writes over 4 index partitions, every recency page queries all of them
+IDEMPOTENCY_LOCAL_CACHE_MAX_ITEMS = 1024  # completed create records kept per container until they expire
@@ -1,27 +1,64 @@
-from abc import ABC, ABCMeta, abstractmethod
-from typing import List
+from abc import ABC, abstractmethod
+from typing import Any, Iterator, Optional, Union
 
-from product.crud.models.product import Product
+from product.crud.models.product import Product, ProductField, ProductProjection, ProductsBatch, ProductsPage, ProductUpdate, ProductWriteResult
+from product.models.products.catalog import CatalogStatsEntry
 
 
-class _SingletonMeta(ABCMeta):
-    _instances: dict = {}
-
-    def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super(_SingletonMeta, cls).__call__(*args, **kwargs)
-        return cls._instances[cls]
+class DbHandler(ABC):
+    @abstractmethod
+    def create_product(self, product: Product, idempotent: bool = False) -> None: ...  # pragma: no cover
 
+    @abstractmethod
+    def get_product(
+        self, product_id: str, consistent_read: bool = True, fields: Optional[list[ProductField]] = None
+    ) -> Union[Product, ProductProjection]: ...  # pragma: no cover
 
-class DbHandler(ABC, metaclass=_SingletonMeta):
     @abstractmethod
-    def create_product(self, product: Product) -> None: ...  # pragma: no cover
+    def get_products(self, product_ids: list[str]) -> ProductsBatch: ...  # pragma: no cover
 
     @abstractmethod
-    def get_product(self, product_id: str) -> Product: ...  # pragma: no cover
+    def update_product(self, product_id: str, update: ProductUpdate) -> Product: ...  # pragma: no cover
 
     @abstractmethod
     def delete_product(self, product_id: str) -> None: ...  # pragma: no cover
 
     @abstractmethod
-    def list_products(self) -> List[Product]: ...  # pragma: no cover
+    def set_recency_bucket(self, product_id: str) -> bool: ...  # pragma: no cover
+
+    @abstractmethod
+    def write_products(self, puts: list[Product], deletes: list[str]) -> list[ProductWriteResult]: ...  # pragma: no cover
+
+    @abstractmethod
+    def list_products(
+        self,
+        limit: Optional[int] = None,
+        start_key: Optional[dict[str, Any]] = None,
+        prefetch_next: bool = False,
+        consistent_read: bool = True,
+        fields: Optional[list[ProductField]] = None,
+    ) -> ProductsPage: ...  # pragma: no cover
+
+    @abstractmethod
+    def list_products_by_recency(
+        self, limit: int, cursor: Optional[dict[str, Any]] = None, fields: Optional[list[ProductField]] = None
+    ) -> ProductsPage: ...  # pragma: no cover
+
+    @abstractmethod
+    def list_products_from_catalog(
+        self, catalog_table_name: str, limit: int, cursor: Optional[dict[str, Any]] = None, fields: Optional[list[ProductField]] = None
+    ) -> ProductsPage: ...  # pragma: no cover
+
+    @abstractmethod
+    def get_catalog_stats(self, catalog_table_name: str) -> CatalogStatsEntry: ...  # pragma: no cover
+
+    @abstractmethod
+    def get_catalog_version(self, catalog_table_name: str) -> int: ...  # pragma: no cover
+
+    @abstractmethod
+    def scan_products(self, total_segments: int) -> Iterator[Product]: ...  # pragma: no cover
+
+    @abstractmethod
+    def iter_products(
+        self, start_key: Optional[dict[str, Any]] = None, consistent_read: bool = True, fields: Optional[list[ProductField]] = None
+    ) -> Iterator[Union[Product, ProductProjection]]: ...  # pragma: no cover
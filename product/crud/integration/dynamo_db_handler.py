@@ -1,38 +1,122 @@
+import heapq
+import json
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import List
+from itertools import islice
+from queue import Full, Queue
+from typing import TYPE_CHECKING, Any, Iterator, Literal, Optional, Union
 
-import boto3
+from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeDeserializer
 from botocore.exceptions import ClientError
-from cachetools import TTLCache, cached
-from mypy_boto3_dynamodb import DynamoDBServiceResource
-from mypy_boto3_dynamodb.service_resource import Table
+from cachetools import TTLCache
 from pydantic import ValidationError
 
+from product.aws_clients import get_dynamodb_resource, new_dynamodb_resource
+from product.cache.base import CacheBackend
+from product.crud.integration.constants import (
+    BATCH_GET_MAX_CONCURRENCY,
+    BATCH_GET_MAX_KEYS,
+    BATCH_MAX_ATTEMPTS,
+    BATCH_RETRY_BASE_DELAY_SECONDS,
+    BATCH_WRITE_MAX_CONCURRENCY,
+    BATCH_WRITE_MAX_ITEMS,
+    CATALOG_MAX_SHARDS_PER_READ,
+    EXPORT_SCAN_PAGE_SIZE,
+    MAX_SCAN_SEGMENTS,
+    PREFETCH_PAGES_CACHE_SIZE,
+    PREFETCH_PAGES_TTL_SECONDS,
+    PRODUCT_CACHE_MAX_SIZE,
+    PRODUCT_CACHE_NEGATIVE_TTL_SECONDS,
+    PRODUCT_CACHE_TTL_SECONDS,
+    RECENCY_BUCKET_ATTRIBUTE,
+    RECENCY_BUCKETS,
+    RECENCY_INDEX_NAME,
+    SHARED_CACHE_PAGE_TTL_SECONDS,
+    SHARED_CACHE_PRODUCT_TTL_SECONDS,
+    UPDATED_AT_ATTRIBUTE,
+)
 from product.crud.integration.db_handler import DbHandler
-from product.crud.integration.models.db import ProductEntries
-from product.crud.models.exceptions import InternalServerException, ProductAlreadyExistsException, ProductNotFoundException
-from product.crud.models.product import Product
+from product.crud.integration.models.db import ProductEntries, ProductProjectionEntries
+from product.crud.integration.product_cache import ProductCache
+from product.crud.integration.shared_cache import SharedCache
+from product.crud.models.exceptions import (
+    CatalogSnapshotIncompleteException,
+    InternalServerException,
+    ProductAlreadyExistsException,
+    ProductNotFoundException,
+)
+from product.crud.models.product import Product, ProductField, ProductProjection, ProductsBatch, ProductsPage, ProductUpdate, ProductWriteResult
+from product.models.products.catalog import (
+    CATALOG_SHARD_ATTRIBUTE,
+    CATALOG_SHARDS,
+    CATALOG_STATS_SHARD,
+    CATALOG_VERSION_ATTRIBUTE,
+    CatalogShard,
+    CatalogStatsEntry,
+    get_catalog_shard,
+)
 from product.models.products.product import ProductEntry
 from product.observability import logger, tracer
 
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb import DynamoDBServiceResource
+    from mypy_boto3_dynamodb.service_resource import Table
+
+_SEGMENT_DONE = None  # queued by a scan segment worker once it read its last page
+_SegmentResult = Union[list[Product], Exception, None]
+_WriteRequest = tuple[str, Literal['UPSERT', 'DELETE'], dict[str, Any]]  # product id, operation, BatchWriteItem request
+_TYPE_DESERIALIZER = TypeDeserializer()
+_RECENCY_KEY_ATTRIBUTES = ('id', 'created_at', RECENCY_BUCKET_ATTRIBUTE)  # recency index key, also its exclusive start key
+
 
 class DynamoDbHandler(DbHandler):
-    def __init__(self, table_name: str):
+    def __init__(self, table_name: str, product_cache_size: int = PRODUCT_CACHE_MAX_SIZE, cache_backend: Optional[CacheBackend] = None):
         self.table_name = table_name
+        # read-through cache of single product reads, lives as long as the container
+        self._product_cache = ProductCache(
+            max_size=product_cache_size, ttl_seconds=PRODUCT_CACHE_TTL_SECONDS, negative_ttl_seconds=PRODUCT_CACHE_NEGATIVE_TTL_SECONDS
+        )
+        # second level cache shared by all the containers, eventually consistent reads missing the container cache try it first
+        self._shared_cache = SharedCache(
+            backend=cache_backend, product_ttl_seconds=SHARED_CACHE_PRODUCT_TTL_SECONDS, page_ttl_seconds=SHARED_CACHE_PAGE_TTL_SECONDS
+        )
+        # pages read ahead in the background, keyed by the list request they answer
+        self._prefetched_pages: TTLCache = TTLCache(maxsize=PREFETCH_PAGES_CACHE_SIZE, ttl=PREFETCH_PAGES_TTL_SECONDS)
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='products_prefetch')
+        # kept for the container lifetime so the worker threads reuse their boto3 sessions across invocations
+        self._scan_executor = ThreadPoolExecutor(max_workers=MAX_SCAN_SEGMENTS, thread_name_prefix='products_scan')
+        self._batch_get_executor = ThreadPoolExecutor(max_workers=BATCH_GET_MAX_CONCURRENCY, thread_name_prefix='products_get')
+        self._batch_write_executor = ThreadPoolExecutor(max_workers=BATCH_WRITE_MAX_CONCURRENCY, thread_name_prefix='products_write')
+        self._thread_local = threading.local()
+
+    def _get_table(self, table_name: str) -> 'Table':
+        # tables are cheap to build, the resource and its connections are shared by the whole container
+        return get_dynamodb_resource().Table(table_name)
 
-    # cache dynamodb connection data for no longer than 5 minutes
-    @cached(cache=TTLCache(maxsize=1, ttl=300))
-    def _get_table(self, table_name: str) -> Table:
-        logger.debug('opening connection to dynamodb table', table_name=table_name)
-        dynamodb: DynamoDBServiceResource = boto3.resource('dynamodb')
-        return dynamodb.Table(table_name)
+    def _get_thread_table(self) -> 'Table':
+        # boto3 resources are not thread safe, every background thread gets its own resource and table
+        table: Optional['Table'] = getattr(self._thread_local, 'table', None)
+        if table is None:
+            logger.debug('opening thread connection to dynamodb table', table_name=self.table_name)
+            dynamodb: 'DynamoDBServiceResource' = new_dynamodb_resource()
+            table = dynamodb.Table(self.table_name)
+            self._thread_local.table = table
+        return table
 
     def _get_unix_time(self) -> int:
         return int(datetime.utcnow().timestamp())
 
+    def _get_unix_time_ms(self) -> int:
+        return time.time_ns() // 1_000_000
+
     @tracer.capture_method(capture_response=False)
-    def create_product(self, product: Product) -> None:
-        logger.info('trying to create a product')
+    def create_product(self, product: Product, idempotent: bool = False) -> None:
+        logger.info('trying to create a product', idempotent=idempotent)
         entry = ProductEntry(
             id=product.id,
             name=product.name,
@@ -41,13 +125,21 @@ class DynamoDbHandler(DbHandler):
         )
         try:
             table = self._get_table(self.table_name)
-            table.put_item(Item=entry.model_dump(), ConditionExpression='attribute_not_exists(id)')
+            table.put_item(
+                Item=self._to_item(entry, updated_at=self._get_unix_time_ms()),
+                ConditionExpression='attribute_not_exists(id)',
+                # the existing product comes back with the failed condition, no extra read to compare it with the request
+                ReturnValuesOnConditionCheckFailure='ALL_OLD' if idempotent else 'NONE',
+            )
         except ValidationError as exc:  # pragma: no cover
             error_msg = 'failed to turn input into db entry'
             logger.exception(error_msg)
             raise InternalServerException(error_msg) from exc
         except ClientError as exc:  # pragma: no cover
             if exc.response.get('Error', {}).get('Code') == 'ConditionalCheckFailedException':  # condition attribute_not_exists
+                if idempotent and self._is_same_product(exc.response.get('Item'), product):
+                    logger.info('product already exists with the same attributes, treating the create as a retry')
+                    return
                 error_msg = f'failed to create product, product {product.id} already exists'
                 logger.exception(error_msg)
                 raise ProductAlreadyExistsException(error_msg) from exc
@@ -55,59 +147,359 @@ class DynamoDbHandler(DbHandler):
             logger.exception(error_msg)
             raise InternalServerException(error_msg) from exc
 
+        # drop a cached 'not found' result so the new product is served right away
+        self._product_cache.invalidate(product.id)
         logger.info('finished create product')
 
+    @staticmethod
+    def _is_same_product(existing_item: Optional[dict[str, Any]], product: Product) -> bool:
+        # error responses are not deserialized by the table resource, the item holds DynamoDB typed values
+        if not existing_item:
+            return False
+        existing = {name: _TYPE_DESERIALIZER.deserialize(value) for name, value in existing_item.items()}
+        return existing.get('name') == product.name and existing.get('price') == product.price
+
+    @staticmethod
+    def _to_item(entry: ProductEntry, updated_at: int) -> dict[str, Any]:
+        # the recency bucket places the product in one of the partitions of the recency index
+        return {**entry.model_dump(), RECENCY_BUCKET_ATTRIBUTE: DynamoDbHandler._get_recency_bucket(entry.id), UPDATED_AT_ATTRIBUTE: updated_at}
+
+    @staticmethod
+    def _get_recency_bucket(product_id: str) -> int:
+        return int(product_id.replace('-', ''), 16) % RECENCY_BUCKETS
+
     @tracer.capture_method(capture_response=False)
-    def get_product(self, product_id: str) -> Product:
-        logger.info('trying to get a product')
+    def get_product(
+        self, product_id: str, consistent_read: bool = True, fields: Optional[list[ProductField]] = None
+    ) -> Union[Product, ProductProjection]:
+        logger.info('trying to get a product', consistent_read=consistent_read, fields=fields)
+        # the cache may be a few seconds stale, only reads that tolerate staleness are served from it
+        hit, cached_product = (False, None) if consistent_read else self._product_cache.get(product_id)
+        if hit:
+            if cached_product is None:
+                logger.info('product is not found in cache', product_id=product_id)  # not a service error
+                raise ProductNotFoundException('product is not found in table')
+            logger.info('got product from cache')
+            return cached_product  # a full product, the caller shapes it to the requested fields
+        shared_product = None if consistent_read else self._shared_cache.get_product(product_id)
+        if shared_product is not None:
+            logger.info('got product from shared cache')
+            self._product_cache.put(product_id, shared_product)
+            return shared_product
+
         try:
-            table: Table = self._get_table(self.table_name)
+            table: 'Table' = self._get_table(self.table_name)
             response = table.get_item(
                 Key={'id': product_id},
-                ConsistentRead=True,
+                ConsistentRead=consistent_read,
+                # the write time is always read, it validates conditional requests of the product
+                **self._get_projection(fields, key_attributes=('id', UPDATED_AT_ATTRIBUTE)),
             )
             if response.get('Item') is None:  # pragma: no cover (covered in integration test)
                 error_str = 'product is not found in table'
                 logger.info(error_str, product_id=product_id)  # not a service error
+                self._product_cache.put(product_id, None)
                 raise ProductNotFoundException(error_str)
         except ClientError as exc:  # pragma: no cover (covered in integration test)
             error_msg = 'failed to get product from db'
             logger.exception(error_msg)
             raise InternalServerException(error_msg) from exc
 
+        if fields is not None:
+            # partial products are not cached, the cache only holds full products
+            return self._parse_projection(response['Item'])
+
         # parse to pydantic schema
         try:
-            db_entry = ProductEntry.model_validate(response.get('Item', {}))
+            item = response.get('Item', {})
+            db_entry = ProductEntry.model_validate(item)
             logger.info('got item successfully')
-            ret_prod = Product(id=db_entry.id, name=db_entry.name, price=db_entry.price)
+            ret_prod = Product.model_validate({**db_entry.model_dump(), UPDATED_AT_ATTRIBUTE: item.get(UPDATED_AT_ATTRIBUTE)})
         except ValidationError as exc:  # pragma: no cover
             # rare use case where items in DB don't match the schema
             error_msg = 'failed to parse product'
             logger.exception(error_msg)
             raise InternalServerException(error_msg) from exc
 
+        self._product_cache.put(product_id, ret_prod)
+        self._shared_cache.put_product(ret_prod)
         return ret_prod
 
+    @staticmethod
+    def _get_projection(fields: Optional[list[ProductField]], key_attributes: tuple[str, ...] = ('id',)) -> dict[str, Any]:
+        if fields is None:
+            return {}
+        # 'name' is a DynamoDB reserved word, every attribute goes through a placeholder. The key is always read.
+        attributes = list(dict.fromkeys([*key_attributes, *fields]))
+        return {
+            'ProjectionExpression': ', '.join(f'#{attribute}' for attribute in attributes),
+            'ExpressionAttributeNames': {f'#{attribute}': attribute for attribute in attributes},
+        }
+
+    @staticmethod
+    def _parse_projection(item: dict[str, Any]) -> ProductProjection:
+        try:
+            return ProductProjection.model_validate(item)
+        except ValidationError as exc:  # pragma: no cover
+            # rare use case where items in DB don't match the schema
+            error_msg = 'failed to parse product'
+            logger.exception(error_msg)
+            raise InternalServerException(error_msg) from exc
+
+    @tracer.capture_method(capture_response=False)
+    def get_products(self, product_ids: list[str]) -> ProductsBatch:
+        logger.info('trying to get products', requested=len(product_ids))
+        # BatchGetItem rejects requests with duplicate keys
+        unique_ids = list(dict.fromkeys(product_ids))
+        chunks = [
+            [{'id': product_id} for product_id in unique_ids[idx : idx + BATCH_GET_MAX_KEYS]] for idx in range(0, len(unique_ids), BATCH_GET_MAX_KEYS)
+        ]
+        items: list[dict[str, Any]] = []
+        if len(chunks) == 1:
+            items = self._batch_get_items(self._get_table(self.table_name), chunks[0])
+        else:
+            # the chunks of a large batch are read in parallel instead of one after another
+            futures = [self._batch_get_executor.submit(self._batch_get_thread_items, chunk) for chunk in chunks]
+            for future in futures:
+                items.extend(future.result())
+
+        # parse to pydantic schema
+        try:
+            db_entries = [ProductEntry.model_validate(item) for item in items]
+        except ValidationError as exc:  # pragma: no cover
+            # rare use case where items in DB don't match the schema
+            error_msg = 'failed to parse product'
+            logger.exception(error_msg)
+            raise InternalServerException(error_msg) from exc
+
+        found = {entry.id: Product(id=entry.id, name=entry.name, price=entry.price) for entry in db_entries}
+        logger.info('got products successfully', found=len(found))
+        return ProductsBatch(
+            products=[found[product_id] for product_id in unique_ids if product_id in found],
+            missing_ids=[product_id for product_id in unique_ids if product_id not in found],
+        )
+
+    def _batch_get_thread_items(self, keys: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        # runs on a batch get worker thread, it must not share the main thread table
+        return self._batch_get_items(self._get_thread_table(), keys)
+
+    def _batch_get_items(
+        self, table: 'Table', keys: list[dict[str, Any]], table_name: Optional[str] = None, consistent_read: bool = True
+    ) -> list[dict[str, Any]]:
+        # table_name reads another table, e.g. the catalog snapshot, through the products table client
+        table_name = table_name or self.table_name
+        items: list[dict[str, Any]] = []
+        request_items: dict[str, Any] = {table_name: {'Keys': keys, 'ConsistentRead': consistent_read}}
+        for attempt in range(BATCH_MAX_ATTEMPTS):
+            if attempt:
+                logger.debug('retrying unprocessed keys', attempt=attempt)
+                self._backoff(attempt)
+            try:
+                # the table client (de)serializes DynamoDB types just like the table resource does
+                response = table.meta.client.batch_get_item(RequestItems=request_items)
+            except ClientError as exc:  # pragma: no cover (covered in integration test)
+                error_msg = 'failed to get products from db'
+                logger.exception(error_msg)
+                raise InternalServerException(error_msg) from exc
+
+            items.extend(response.get('Responses', {}).get(table_name, []))
+            request_items = response.get('UnprocessedKeys', {})
+            if not request_items:
+                return items
+
+        error_msg = 'failed to get products from db, keys left unprocessed'
+        logger.error(error_msg, attempts=BATCH_MAX_ATTEMPTS)
+        raise InternalServerException(error_msg)
+
+    @staticmethod
+    def _backoff(attempt: int) -> None:
+        # exponential backoff with full jitter, spreads retries of throttled batches
+        time.sleep(random.uniform(0, BATCH_RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1)))
+
+    @tracer.capture_method(capture_response=False)
+    def update_product(self, product_id: str, update: ProductUpdate) -> Product:
+        attributes = update.model_dump(exclude_none=True)
+        logger.info('trying to update a product', attributes=list(attributes))
+        attributes[UPDATED_AT_ATTRIBUTE] = self._get_unix_time_ms()
+        try:
+            table: 'Table' = self._get_table(self.table_name)
+            # a single write that only touches the given attributes, the product is never missing in between
+            response = table.update_item(
+                Key={'id': product_id},
+                UpdateExpression=f'SET {", ".join(f"#{name} = :{name}" for name in attributes)}',
+                ConditionExpression='attribute_exists(id)',
+                ExpressionAttributeNames={f'#{name}': name for name in attributes},  # 'name' is a reserved word
+                ExpressionAttributeValues={f':{name}': value for name, value in attributes.items()},
+                ReturnValues='ALL_NEW',
+            )
+        except ClientError as exc:  # pragma: no cover (covered in integration test)
+            if exc.response.get('Error', {}).get('Code') == 'ConditionalCheckFailedException':  # condition attribute_exists
+                logger.info('product is not found in table', product_id=product_id)  # not a service error
+                raise ProductNotFoundException('product is not found in table') from exc
+            error_msg = 'failed to update product'
+            logger.exception(error_msg)
+            raise InternalServerException(error_msg) from exc
+
+        try:
+            db_entry = ProductEntry.model_validate(response['Attributes'])
+            updated_product = Product.model_validate(
+                {**db_entry.model_dump(), UPDATED_AT_ATTRIBUTE: response['Attributes'].get(UPDATED_AT_ATTRIBUTE)}
+            )
+        except ValidationError as exc:  # pragma: no cover
+            error_msg = 'failed to parse updated product'
+            logger.exception(error_msg)
+            raise InternalServerException(error_msg) from exc
+
+        # the updated product is already at hand, replace the stale cached product with it
+        self._product_cache.put(product_id, updated_product)
+        logger.info('updated product successfully')
+        return updated_product
+
     @tracer.capture_method(capture_response=False)
     def delete_product(self, product_id: str) -> None:
         logger.info('trying to delete a product')
         try:
-            table: Table = self._get_table(self.table_name)
+            table: 'Table' = self._get_table(self.table_name)
             table.delete_item(Key={'id': product_id})
         except ClientError as exc:  # pragma: no cover (covered in integration test)
             error_msg = 'failed to delete product from db'
             logger.exception(error_msg)
             raise InternalServerException(error_msg) from exc
 
+        self._product_cache.invalidate(product_id)
         logger.info('deleted product successfully')
 
     @tracer.capture_method(capture_response=False)
-    def list_products(self) -> List[Product]:
-        logger.info('trying to list all products')
+    def set_recency_bucket(self, product_id: str) -> bool:
+        logger.debug('trying to set product recency bucket', product_id=product_id)
+        try:
+            # products deleted since they were read are not written back, products already in the recency index are left as is
+            self._get_table(self.table_name).update_item(
+                Key={'id': product_id},
+                UpdateExpression='SET #bucket = :bucket',
+                ConditionExpression='attribute_exists(id) AND attribute_not_exists(#bucket)',
+                ExpressionAttributeNames={'#bucket': RECENCY_BUCKET_ATTRIBUTE},
+                ExpressionAttributeValues={':bucket': self._get_recency_bucket(product_id)},
+            )
+        except ClientError as exc:  # pragma: no cover (covered in integration test)
+            if exc.response.get('Error', {}).get('Code') == 'ConditionalCheckFailedException':
+                return False
+            error_msg = 'failed to set product recency bucket'
+            logger.exception(error_msg)
+            raise InternalServerException(error_msg) from exc
+        return True
+
+    @tracer.capture_method(capture_response=False)
+    def write_products(self, puts: list[Product], deletes: list[str]) -> list[ProductWriteResult]:
+        logger.info('trying to write products', puts=len(puts), deletes=len(deletes))
+        created_at, updated_at = self._get_unix_time(), self._get_unix_time_ms()
+        try:
+            write_requests: list[_WriteRequest] = [
+                (
+                    product.id,
+                    'UPSERT',  # BatchWriteItem has no condition expressions, an existing product is replaced
+                    {
+                        'PutRequest': {
+                            'Item': self._to_item(
+                                ProductEntry(id=product.id, name=product.name, price=product.price, created_at=created_at), updated_at=updated_at
+                            )
+                        }
+                    },
+                )
+                for product in puts
+            ]
+        except ValidationError as exc:  # pragma: no cover
+            error_msg = 'failed to turn input into db entry'
+            logger.exception(error_msg)
+            raise InternalServerException(error_msg) from exc
+        write_requests.extend((product_id, 'DELETE', {'DeleteRequest': {'Key': {'id': product_id}}}) for product_id in deletes)
+
+        chunks = [write_requests[idx : idx + BATCH_WRITE_MAX_ITEMS] for idx in range(0, len(write_requests), BATCH_WRITE_MAX_ITEMS)]
+        futures = [self._batch_write_executor.submit(self._batch_write_chunk, chunk) for chunk in chunks]
+        results: list[ProductWriteResult] = []
+        for future in futures:
+            results.extend(future.result())
+        # failed writes may still have been applied, invalidate every written product
+        for product_id, _, _ in write_requests:
+            self._product_cache.invalidate(product_id)
+
+        failed = sum(1 for result in results if not result.succeeded)
+        logger.info('finished writing products', succeeded=len(results) - failed, failed=failed)
+        return results
+
+    def _batch_write_chunk(self, chunk: list[_WriteRequest]) -> list[ProductWriteResult]:
+        # runs on a batch write worker thread, it must not share the main thread table
+        table = self._get_thread_table()
+        pending_requests = [request for _, _, request in chunk]
+        for attempt in range(BATCH_MAX_ATTEMPTS):
+            if attempt:
+                logger.debug('retrying unprocessed items', attempt=attempt, unprocessed=len(pending_requests))
+                self._backoff(attempt)
+            try:
+                # the table client (de)serializes DynamoDB types just like the table resource does
+                response = table.meta.client.batch_write_item(RequestItems={self.table_name: pending_requests})  # type: ignore[dict-item]
+            except ClientError:
+                # report the chunk items as failed instead of failing the whole batch
+                logger.exception('failed to write products chunk to db')
+                break
+            pending_requests = response.get('UnprocessedItems', {}).get(self.table_name, [])  # type: ignore[assignment]
+            if not pending_requests:
+                break
+
+        failed_ids = {self._get_write_request_product_id(request) for request in pending_requests}
+        return [ProductWriteResult(id=product_id, operation=operation, succeeded=product_id not in failed_ids) for product_id, operation, _ in chunk]
+
+    @staticmethod
+    def _get_write_request_product_id(request: dict[str, Any]) -> str:
+        if 'PutRequest' in request:
+            return request['PutRequest']['Item']['id']
+        return request['DeleteRequest']['Key']['id']
+
+    @tracer.capture_method(capture_response=False)
+    def list_products(
+        self,
+        limit: Optional[int] = None,
+        start_key: Optional[dict[str, Any]] = None,
+        prefetch_next: bool = False,
+        consistent_read: bool = True,
+        fields: Optional[list[ProductField]] = None,
+    ) -> ProductsPage:
+        logger.info('trying to list products', limit=limit, consistent_read=consistent_read, fields=fields)
+        # only eventually consistent pages may be served from the shared cache
+        page_key = None if consistent_read else self._shared_cache.get_page_key(limit, start_key, fields)
+        page = self._get_prefetched_page(limit, start_key, consistent_read, fields)
+        if page is None and page_key is not None:
+            page = self._shared_cache.get_page(page_key, fields)
+        if page is None:
+            page = self._scan_page(self._get_table(self.table_name), limit, start_key, consistent_read=consistent_read, fields=fields)
+            if page_key is not None:
+                self._shared_cache.put_page(page_key, page)
+
+        if prefetch_next and page.last_key is not None:
+            # read page N+1 while page N is serialized and returned, the next list request for it is served from memory
+            self._prefetch_page(limit, page.last_key, consistent_read, fields)
+
+        logger.info('got products successfully')
+        return page
+
+    def _scan_page(
+        self,
+        table: 'Table',
+        limit: Optional[int],
+        start_key: Optional[dict[str, Any]],
+        segment: Optional[tuple[int, int]] = None,
+        consistent_read: bool = True,
+        fields: Optional[list[ProductField]] = None,
+    ) -> ProductsPage:
+        scan_input: dict[str, Any] = {'ConsistentRead': consistent_read, **self._get_projection(fields)}
+        if limit is not None:
+            scan_input['Limit'] = limit
+        if start_key is not None:
+            scan_input['ExclusiveStartKey'] = start_key
+        if segment is not None:
+            scan_input['Segment'], scan_input['TotalSegments'] = segment
         try:
-            table: Table = self._get_table(self.table_name)
-            # production readiness : add pagination support
-            response = table.scan(ConsistentRead=True)
+            response = table.scan(**scan_input)
         except ClientError as exc:  # pragma: no cover (covered in integration test)
             error_msg = 'failed to get product from db'
             logger.exception(error_msg)
@@ -115,6 +507,9 @@ class DynamoDbHandler(DbHandler):
 
         # parse to pydantic schema
         try:
+            if fields is not None:
+                projections = ProductProjectionEntries.model_validate(response)
+                return ProductsPage(products=projections.Items, last_key=projections.LastEvaluatedKey)
             db_entries = ProductEntries.model_validate(response)
         except ValidationError as exc:  # pragma: no cover
             # rare use case where items in DB don't match the schema
@@ -122,9 +517,267 @@ class DynamoDbHandler(DbHandler):
             logger.exception(error_msg)
             raise InternalServerException(error_msg) from exc
 
-        logger.info('got products successfully')
         # convert from DB entry to product model
-        entries = []
-        for entry in db_entries.Items:
-            entries.append(Product(id=entry.id, name=entry.name, price=entry.price))
-        return entries
+        products = [Product(id=entry.id, name=entry.name, price=entry.price) for entry in db_entries.Items]
+        return ProductsPage(products=products, last_key=db_entries.LastEvaluatedKey)
+
+    @staticmethod
+    def _page_cache_key(
+        limit: Optional[int], start_key: Optional[dict[str, Any]], consistent_read: bool, fields: Optional[list[ProductField]]
+    ) -> str:
+        # a page read eventually consistent or with fewer fields must not answer a request for more
+        page_request = {'limit': limit, 'start_key': start_key, 'consistent_read': consistent_read, 'fields': fields}
+        return json.dumps(page_request, sort_keys=True, default=str)
+
+    def _get_prefetched_page(
+        self, limit: Optional[int], start_key: Optional[dict[str, Any]], consistent_read: bool, fields: Optional[list[ProductField]]
+    ) -> Optional[ProductsPage]:
+        cache_key = self._page_cache_key(limit, start_key, consistent_read, fields)
+        future: Optional[Future[ProductsPage]] = self._prefetched_pages.pop(cache_key, None)
+        if future is None:
+            return None
+        try:
+            page = future.result()
+        except InternalServerException:
+            logger.warning('failed to prefetch products page, reading it again')
+            return None
+        logger.debug('serving prefetched products page')
+        return page
+
+    def _prefetch_page(self, limit: Optional[int], start_key: dict[str, Any], consistent_read: bool, fields: Optional[list[ProductField]]) -> None:
+        cache_key = self._page_cache_key(limit, start_key, consistent_read, fields)
+        if cache_key in self._prefetched_pages:
+            return
+        logger.debug('prefetching next products page')
+        self._prefetched_pages[cache_key] = self._prefetch_executor.submit(self._scan_thread_page, limit, start_key, consistent_read, fields)
+
+    def _scan_thread_page(
+        self, limit: Optional[int], start_key: Optional[dict[str, Any]], consistent_read: bool, fields: Optional[list[ProductField]]
+    ) -> ProductsPage:
+        # runs on a background thread, it must not share the main thread table
+        return self._scan_page(self._get_thread_table(), limit, start_key, consistent_read=consistent_read, fields=fields)
+
+    @tracer.capture_method(capture_response=False)
+    def list_products_by_recency(
+        self, limit: int, cursor: Optional[dict[str, Any]] = None, fields: Optional[list[ProductField]] = None
+    ) -> ProductsPage:
+        logger.info('trying to list products by recency', limit=limit, fields=fields)
+        # bucket -> exclusive start key (None to start from its newest product), exhausted buckets are left out of the cursor
+        start_keys: dict[int, Optional[dict[str, Any]]] = (
+            dict.fromkeys(range(RECENCY_BUCKETS)) if cursor is None else {int(bucket): key for bucket, key in cursor['buckets'].items()}
+        )
+        # every bucket is sorted newest first, the page is the newest 'limit' products across all of them
+        futures = {
+            bucket: self._scan_executor.submit(self._query_recency_bucket, bucket, limit, start_key, fields)
+            for bucket, start_key in start_keys.items()
+        }
+        bucket_pages = {bucket: future.result() for bucket, future in futures.items()}
+        merged = heapq.merge(
+            *([(bucket, item) for item in items] for bucket, (items, _) in bucket_pages.items()),
+            key=lambda bucket_item: bucket_item[1]['created_at'],
+            reverse=True,
+        )
+        page_items = list(islice(merged, limit))
+
+        # resume every bucket right after the last product this page took from it
+        taken = Counter(bucket for bucket, _ in page_items)
+        next_start_keys: dict[str, Optional[dict[str, Any]]] = {}
+        for bucket, (items, last_key) in bucket_pages.items():
+            if taken[bucket] < len(items):
+                last_item = items[taken[bucket] - 1] if taken[bucket] else None
+                next_start_keys[str(bucket)] = start_keys[bucket] if last_item is None else {key: last_item[key] for key in _RECENCY_KEY_ATTRIBUTES}
+            elif last_key is not None:
+                next_start_keys[str(bucket)] = last_key
+
+        items = [item for _, item in page_items]
+        try:
+            if fields is not None:
+                products: list[Any] = ProductProjectionEntries.model_validate({'Items': items}).Items
+            else:
+                products = [
+                    Product(id=entry.id, name=entry.name, price=entry.price) for entry in ProductEntries.model_validate({'Items': items}).Items
+                ]
+        except ValidationError as exc:  # pragma: no cover
+            # rare use case where items in DB don't match the schema
+            error_msg = 'failed to parse product'
+            logger.exception(error_msg)
+            raise InternalServerException(error_msg) from exc
+
+        logger.info('got products by recency successfully', buckets=len(start_keys))
+        return ProductsPage(products=products, last_key={'buckets': next_start_keys} if next_start_keys else None)
+
+    def _query_recency_bucket(
+        self, bucket: int, limit: int, start_key: Optional[dict[str, Any]], fields: Optional[list[ProductField]]
+    ) -> tuple[list[dict[str, Any]], Optional[dict[str, Any]]]:
+        # runs on a scan worker thread, it must not share the main thread table
+        query_input: dict[str, Any] = {
+            'IndexName': RECENCY_INDEX_NAME,
+            'KeyConditionExpression': Key(RECENCY_BUCKET_ATTRIBUTE).eq(bucket),
+            'ScanIndexForward': False,  # newest first
+            'Limit': limit,
+            # the index key attributes are needed to merge the buckets and to resume them
+            **self._get_projection(fields, key_attributes=_RECENCY_KEY_ATTRIBUTES),
+        }
+        if start_key is not None:
+            query_input['ExclusiveStartKey'] = start_key
+        try:
+            response = self._get_thread_table().query(**query_input)
+        except ClientError as exc:  # pragma: no cover (covered in integration test)
+            error_msg = 'failed to query products by recency from db'
+            logger.exception(error_msg)
+            raise InternalServerException(error_msg) from exc
+        return response['Items'], response.get('LastEvaluatedKey')
+
+    @tracer.capture_method(capture_response=False)
+    def list_products_from_catalog(
+        self, catalog_table_name: str, limit: int, cursor: Optional[dict[str, Any]] = None, fields: Optional[list[ProductField]] = None
+    ) -> ProductsPage:
+        logger.info('trying to list products from the catalog snapshot', limit=limit, fields=fields)
+        # items hold consecutive product id ranges, the page is read from the item of its cursor on until it is full
+        after_id: str = cursor['after_id'] if cursor is not None else ''
+        next_shard = get_catalog_shard(after_id) if after_id else 0
+        shards_per_read = 1
+        entries: list[ProductEntry] = []
+        versions: dict[int, int] = {}
+        while len(entries) <= limit and next_shard < CATALOG_SHARDS:
+            shard_range = range(next_shard, min(next_shard + shards_per_read, CATALOG_SHARDS))
+            for shard in self._get_catalog_shards(catalog_table_name, shard_range):
+                versions[shard.shard] = shard.version
+                # entries of another item were written before the snapshot was sharded by id range
+                shard_entries = (entry for entry in shard.products.values() if entry.id > after_id and get_catalog_shard(entry.id) == shard.shard)
+                entries.extend(sorted(shard_entries, key=lambda entry: entry.id))
+            next_shard = shard_range.stop
+            shards_per_read = min(shards_per_read * 2, CATALOG_MAX_SHARDS_PER_READ)
+
+        page_entries = entries[:limit]
+        products: list[Any] = [
+            ProductProjection.model_validate(entry.model_dump(include={'id', *fields}))
+            if fields is not None
+            else Product(id=entry.id, name=entry.name, price=entry.price)
+            for entry in page_entries
+        ]
+
+        logger.info('got products from the catalog snapshot successfully', versions=versions)
+        return ProductsPage(products=products, last_key={'after_id': page_entries[-1].id} if len(entries) > limit else None)
+
+    def _get_catalog_shards(self, catalog_table_name: str, shard_range: range) -> list[CatalogShard]:
+        keys = [{CATALOG_SHARD_ATTRIBUTE: shard} for shard in shard_range]
+        items = self._batch_get_items(self._get_table(self.table_name), keys, table_name=catalog_table_name, consistent_read=False)
+        try:
+            shards = sorted((CatalogShard.model_validate(item) for item in items), key=lambda shard: shard.shard)
+        except ValidationError as exc:  # pragma: no cover
+            # rare use case where items in DB don't match the schema
+            error_msg = 'failed to parse catalog snapshot'
+            logger.exception(error_msg)
+            raise InternalServerException(error_msg) from exc
+        incomplete_shards = [shard.shard for shard in shards if shard.incomplete]
+        if incomplete_shards:
+            raise CatalogSnapshotIncompleteException(f'catalog snapshot shards {incomplete_shards} are incomplete')
+        return shards
+
+    @tracer.capture_method(capture_response=False)
+    def get_catalog_stats(self, catalog_table_name: str) -> CatalogStatsEntry:
+        logger.info('trying to get catalog statistics')
+        try:
+            # a single eventually consistent read, the statistics are maintained by the stream processor
+            response = self._get_table(catalog_table_name).get_item(Key={CATALOG_SHARD_ATTRIBUTE: CATALOG_STATS_SHARD})
+            stats = CatalogStatsEntry.model_validate(response.get('Item', {}))
+        except ClientError as exc:  # pragma: no cover (covered in integration test)
+            error_msg = 'failed to get catalog statistics from db'
+            logger.exception(error_msg)
+            raise InternalServerException(error_msg) from exc
+        except ValidationError as exc:  # pragma: no cover
+            # rare use case where items in DB don't match the schema
+            error_msg = 'failed to parse catalog statistics'
+            logger.exception(error_msg)
+            raise InternalServerException(error_msg) from exc
+
+        logger.info('got catalog statistics successfully', version=stats.version)
+        return stats
+
+    @tracer.capture_method(capture_response=False)
+    def get_catalog_version(self, catalog_table_name: str) -> int:
+        logger.info('trying to get catalog version')
+        try:
+            # the statistics item version is incremented by every batch of product changes the stream processor applies
+            response = self._get_table(catalog_table_name).get_item(
+                Key={CATALOG_SHARD_ATTRIBUTE: CATALOG_STATS_SHARD},
+                ProjectionExpression='#version',
+                ExpressionAttributeNames={'#version': CATALOG_VERSION_ATTRIBUTE},
+            )
+        except ClientError as exc:  # pragma: no cover (covered in integration test)
+            error_msg = 'failed to get catalog version from db'
+            logger.exception(error_msg)
+            raise InternalServerException(error_msg) from exc
+
+        version = int(response.get('Item', {}).get(CATALOG_VERSION_ATTRIBUTE, 0))  # type: ignore[arg-type]
+        logger.info('got catalog version successfully', version=version)
+        return version
+
+    @tracer.capture_method(capture_response=False)
+    def scan_products(self, total_segments: int) -> Iterator[Product]:
+        # no segment would be read and the scan would silently return nothing
+        if total_segments < 1:
+            raise ValueError(f'total_segments must be at least 1, got {total_segments}')
+        logger.info('trying to scan all products', total_segments=total_segments)
+
+        # bounded so memory stays flat when the caller consumes products slower than the segments are read
+        pages: Queue[_SegmentResult] = Queue(maxsize=total_segments * 2)
+        stop = threading.Event()
+        for segment in range(total_segments):
+            self._scan_executor.submit(self._scan_segment, segment, total_segments, pages, stop)
+
+        try:
+            remaining_segments = total_segments
+            while remaining_segments:
+                page = pages.get()
+                if page is _SEGMENT_DONE:
+                    remaining_segments -= 1
+                elif isinstance(page, Exception):
+                    raise page
+                else:
+                    yield from page
+        finally:
+            # releases workers blocked on a full queue when the caller stops early or a segment failed
+            stop.set()
+
+        logger.info('scanned all products successfully')
+
+    def iter_products(
+        self, start_key: Optional[dict[str, Any]] = None, consistent_read: bool = True, fields: Optional[list[ProductField]] = None
+    ) -> Iterator[Union[Product, ProductProjection]]:
+        # a single sequential scan in table order, the caller can resume after any product with {'id': product.id}
+        logger.info('trying to iterate over products', resumed=start_key is not None, consistent_read=consistent_read, fields=fields)
+        table = self._get_table(self.table_name)
+        while True:
+            page = self._scan_page(table, EXPORT_SCAN_PAGE_SIZE, start_key, consistent_read=consistent_read, fields=fields)
+            yield from page.products
+            start_key = page.last_key
+            if start_key is None:
+                break
+        logger.info('iterated over all products successfully')
+
+    def _scan_segment(self, segment: int, total_segments: int, pages: 'Queue[_SegmentResult]', stop: threading.Event) -> None:
+        # runs on a scan worker thread, it must not share the main thread table
+        try:
+            table = self._get_thread_table()
+            start_key: Optional[dict[str, Any]] = None
+            while not stop.is_set():
+                page = self._scan_page(table, None, start_key, segment=(segment, total_segments))
+                self._put_segment_result(pages, page.products, stop)
+                start_key = page.last_key
+                if start_key is None:
+                    break
+        except Exception as exc:
+            self._put_segment_result(pages, exc, stop)
+        finally:
+            self._put_segment_result(pages, _SEGMENT_DONE, stop)
+
+    @staticmethod
+    def _put_segment_result(pages: 'Queue[_SegmentResult]', result: _SegmentResult, stop: threading.Event) -> None:
+        while not stop.is_set():
+            try:
+                pages.put(result, timeout=0.1)
+                return
+            except Full:
+                continue
@@ -1,9 +1,16 @@
-from typing import List
+from typing import Any, List, Optional
 
 from pydantic import BaseModel
 
+from product.crud.models.product import ProductProjection
 from product.models.products.product import ProductEntry
 
 
 class ProductEntries(BaseModel):
     Items: List[ProductEntry]
+    LastEvaluatedKey: Optional[dict[str, Any]] = None
+
+
+class ProductProjectionEntries(BaseModel):
+    Items: List[ProductProjection]
+    LastEvaluatedKey: Optional[dict[str, Any]] = None
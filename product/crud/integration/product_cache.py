@@ -0,0 +1,63 @@
+from typing import Any, Optional
+
+from aws_lambda_powertools.metrics import MetricUnit
+from cachetools import TLRUCache
+
+from product.crud.models.product import Product
+from product.observability import logger, metrics
+
+_NOT_FOUND = None  # cached for products that don't exist in the table
+_MISSING = object()
+
+
+class _EvictionCountingCache(TLRUCache):
+    # popitem is only called when the cache is full, expired entries are dropped without it
+    def popitem(self) -> tuple[Any, Any]:
+        key, value = super().popitem()
+        metrics.add_metric(name='ProductCacheEvictions', unit=MetricUnit.Count, value=1)
+        return key, value
+
+
+class ProductCache:
+    """Bounded, per container LRU cache of products with separate TTLs for found and not found products.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum number of cached products, 0 disables the cache
+    ttl_seconds : int
+        Seconds a found product is served from the cache
+    negative_ttl_seconds : int
+        Seconds a not found product is served from the cache, kept short so new products show up quickly
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int, negative_ttl_seconds: int):
+        self.max_size = max_size
+        self._cache = _EvictionCountingCache(
+            maxsize=max_size,
+            ttu=lambda _key, value, now: now + (ttl_seconds if value is not _NOT_FOUND else negative_ttl_seconds),
+        )
+
+    def get(self, product_id: str) -> tuple[bool, Optional[Product]]:
+        """Looks up a product in the cache.
+
+        Returns
+        -------
+        tuple[bool, Optional[Product]]
+            Whether the product was found in the cache, and the cached product, None when it is cached as not found
+        """
+        if not self.max_size:
+            return False, None
+        cached_product = self._cache.get(product_id, _MISSING)
+        hit = cached_product is not _MISSING
+        metrics.add_metric(name='ProductCacheHits' if hit else 'ProductCacheMisses', unit=MetricUnit.Count, value=1)
+        logger.debug('product cache lookup', product_id=product_id, hit=hit)
+        return (True, cached_product) if hit else (False, None)
+
+    def put(self, product_id: str, product: Optional[Product]) -> None:
+        # a None product marks the product as not found
+        if self.max_size:
+            self._cache[product_id] = product
+
+    def invalidate(self, product_id: str) -> None:
+        self._cache.pop(product_id, None)
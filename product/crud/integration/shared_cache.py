@@ -0,0 +1,106 @@
+import hashlib
+import json
+from typing import Any, Optional
+
+from aws_lambda_powertools.metrics import MetricUnit
+from pydantic import ValidationError
+
+from product.cache.base import CacheBackend
+from product.cache.exceptions import CacheBackendError
+from product.cache.keys import PRODUCTS_GENERATION_KEY, get_product_key, get_products_page_key
+from product.crud.models.product import Product, ProductField, ProductProjection, ProductsPage
+from product.observability import logger, metrics
+
+_INITIAL_GENERATION = '0'  # until the stream processor applies the first product change
+
+
+class SharedCache:
+    """Read-through cache of products and list pages shared by all the containers, on top of a cache backend.
+
+    Entries are dropped by the stream processor once their product changes, their TTL bounds the staleness left
+    when a read races with a change. Cache failures are logged and served as misses, they never fail a request.
+
+    Parameters
+    ----------
+    backend : Optional[CacheBackend]
+        Backend holding the cached entries, None disables the cache
+    product_ttl_seconds : int
+        Seconds a product is served from the cache
+    page_ttl_seconds : int
+        Seconds a list page is served from the cache
+    """
+
+    def __init__(self, backend: Optional[CacheBackend], product_ttl_seconds: int, page_ttl_seconds: int):
+        self.backend = backend
+        self.product_ttl_seconds = product_ttl_seconds
+        self.page_ttl_seconds = page_ttl_seconds
+
+    def get_product(self, product_id: str) -> Optional[Product]:
+        cached_product = self._get(get_product_key(product_id))
+        return self._parse(Product, cached_product) if cached_product is not None else None
+
+    def put_product(self, product: Product) -> None:
+        # the write time isn't serialized with the product, it is kept so cached products still validate conditional requests
+        cached_product = json.dumps({**product.model_dump(), 'updated_at': product.updated_at})
+        self._set(get_product_key(product.id), cached_product, self.product_ttl_seconds)
+
+    def get_page_key(self, limit: Optional[int], start_key: Optional[dict[str, Any]], fields: Optional[list[ProductField]]) -> Optional[str]:
+        """Returns the key of a list page, None when the cache is disabled or unavailable.
+
+        The key holds the current generation, read the page and cache it under the same key so a page read
+        before a product change is never cached as the page after it.
+        """
+        if self.backend is None:
+            return None
+        try:
+            generation = self.backend.get(PRODUCTS_GENERATION_KEY) or _INITIAL_GENERATION
+        except CacheBackendError:
+            self._on_error('failed to read the products generation from the shared cache')
+            return None
+        page_request = json.dumps({'limit': limit, 'start_key': start_key, 'fields': fields}, sort_keys=True, default=str)
+        return get_products_page_key(generation, hashlib.sha256(page_request.encode('utf-8')).hexdigest())
+
+    def get_page(self, page_key: str, fields: Optional[list[ProductField]]) -> Optional[ProductsPage]:
+        cached_page = self._get(page_key)
+        if cached_page is None:
+            return None
+        # a page read with a sparse fieldset holds projections
+        return self._parse(ProductsPage[ProductProjection] if fields is not None else ProductsPage[Product], cached_page)
+
+    def put_page(self, page_key: str, page: ProductsPage) -> None:
+        self._set(page_key, page.model_dump_json(exclude_unset=True), self.page_ttl_seconds)
+
+    def _get(self, key: str) -> Optional[str]:
+        if self.backend is None:
+            return None
+        try:
+            value = self.backend.get(key)
+        except CacheBackendError:
+            self._on_error('failed to read from the shared cache')
+            return None
+        hit = value is not None
+        metrics.add_metric(name='SharedCacheHits' if hit else 'SharedCacheMisses', unit=MetricUnit.Count, value=1)
+        logger.debug('shared cache lookup', key=key, hit=hit)
+        return value
+
+    def _set(self, key: str, value: str, ttl_seconds: int) -> None:
+        if self.backend is None:
+            return
+        try:
+            self.backend.set(key, value, ttl_seconds=ttl_seconds)
+        except CacheBackendError:
+            self._on_error('failed to write to the shared cache')
+
+    @staticmethod
+    def _parse(model: Any, value: str) -> Any:
+        try:
+            return model.model_validate_json(value)
+        except ValidationError:
+            # an entry written by another version of the service, served as a miss
+            logger.warning('dropping invalid shared cache entry', exc_info=True)
+            return None
+
+    @staticmethod
+    def _on_error(error_msg: str) -> None:
+        logger.warning(error_msg, exc_info=True)
+        metrics.add_metric(name='SharedCacheErrors', unit=MetricUnit.Count, value=1)
@@ -8,3 +8,11 @@ class ProductNotFoundException(Exception):
 
 class ProductAlreadyExistsException(Exception):
     pass
+
+
+class InvalidPaginationTokenException(Exception):
+    pass
+
+
+class CatalogSnapshotIncompleteException(Exception):
+    pass
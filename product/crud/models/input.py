@@ -1,28 +1,127 @@
-from typing import Annotated
+import base64
+from typing import Annotated, Any, List, Optional
 
-from aws_lambda_powertools.utilities.parser.models import APIGatewayProxyEventModel
-from pydantic import BaseModel, Field, Json, PositiveInt
+from pydantic import BaseModel, BeforeValidator, Field, Json, PositiveInt, model_validator
 
+from product.crud.models.product import ProductField, ProductsSort
 from product.models.products.product import ProductId
 
 
-class CreateProductBody(BaseModel):
+def _split_fields(value: Any) -> Any:
+    # API gateway passes ?fields=id,name as a single comma separated string
+    return value.split(',') if isinstance(value, str) else value
+
+
+ProductFields = Annotated[List[ProductField], Field(min_length=1, max_length=3), BeforeValidator(_split_fields)]
+
+
+# every handler imports all the request models, deferred models are only built by the route validating them
+class ApiGatewayRequest(BaseModel, defer_build=True):
+    """API Gateway proxy event, subclasses declare the only parts their route validates.
+
+    Every other part of the envelope (headers, request context, identity and more) is ignored instead of validated
+    on every request, the route reads those it needs from the resolver's current event.
+    """
+
+    @model_validator(mode='before')
+    @classmethod
+    def decode_body(cls, event: Any) -> Any:
+        # the API treats every media type as binary so compressed responses reach clients decoded,
+        # API Gateway then passes request bodies base64 encoded. A body that isn't valid base64 fails validation
+        if isinstance(event, dict) and event.get('isBase64Encoded') and isinstance(event.get('body'), str):
+            return {**event, 'body': base64.b64decode(event['body'], validate=True).decode('utf-8')}
+        return event
+
+
+class CreateProductBody(BaseModel, defer_build=True):
     name: Annotated[str, Field(min_length=1, max_length=20)]
     price: PositiveInt
 
 
-class ProductPathParams(BaseModel):
+class ProductPathParams(BaseModel, defer_build=True):
     product: ProductId
 
 
-class CreateProductInput(APIGatewayProxyEventModel):
-    pathParameters: ProductPathParams  # type: ignore
-    body: Json[CreateProductBody]  # type: ignore
+class CreateProductInput(ApiGatewayRequest):
+    pathParameters: ProductPathParams
+    body: Json[CreateProductBody]
+
+
+class UpdateProductBody(BaseModel, defer_build=True):
+    name: Optional[Annotated[str, Field(min_length=1, max_length=20)]] = None
+    price: Optional[PositiveInt] = None
+
+    @model_validator(mode='after')
+    def validate_not_empty(self) -> 'UpdateProductBody':
+        if self.name is None and self.price is None:
+            raise ValueError('at least one product attribute must be updated')
+        return self
+
+
+class UpdateProductInput(ApiGatewayRequest):
+    pathParameters: ProductPathParams
+    body: Json[UpdateProductBody]
+
+
+class GetProductQueryParams(BaseModel, defer_build=True):
+    fields: Optional[ProductFields] = None
+
+
+class GetProductRequest(ApiGatewayRequest):
+    pathParameters: ProductPathParams
+    queryStringParameters: Optional[GetProductQueryParams] = None
+
+
+class DeleteProductRequest(ApiGatewayRequest):
+    pathParameters: ProductPathParams
+
+
+class ListProductsQueryParams(BaseModel, defer_build=True):
+    limit: Optional[Annotated[int, Field(ge=1, le=100)]] = None
+    next_token: Optional[Annotated[str, Field(min_length=1, max_length=2048)]] = None
+    fields: Optional[ProductFields] = None
+    sort: Optional[ProductsSort] = None
+
+
+class ListProductsRequest(ApiGatewayRequest):
+    queryStringParameters: Optional[ListProductsQueryParams] = None
+
+
+class ExportProductsQueryParams(BaseModel, defer_build=True):
+    next_token: Optional[Annotated[str, Field(min_length=1, max_length=2048)]] = None
+    fields: Optional[ProductFields] = None
+
+
+class ExportProductsRequest(ApiGatewayRequest):
+    queryStringParameters: Optional[ExportProductsQueryParams] = None
+
+
+class BatchGetProductsBody(BaseModel, defer_build=True):
+    ids: Annotated[List[ProductId], Field(min_length=1, max_length=500)]
+
+
+class BatchGetProductsRequest(ApiGatewayRequest):
+    body: Json[BatchGetProductsBody]
+
+
+class BatchPutProductBody(CreateProductBody, defer_build=True):
+    id: ProductId
+
 
+class BatchWriteProductsBody(BaseModel, defer_build=True):
+    puts: Annotated[List[BatchPutProductBody], Field(max_length=1000)] = []  # upserts, an existing product is replaced
+    deletes: Annotated[List[ProductId], Field(max_length=1000)] = []
 
-class GetProductRequest(APIGatewayProxyEventModel):
-    pathParameters: ProductPathParams  # type: ignore
+    @model_validator(mode='after')
+    def validate_unique_product_ids(self) -> 'BatchWriteProductsBody':
+        product_ids = [product.id for product in self.puts] + self.deletes
+        if not product_ids:
+            raise ValueError('at least one product must be written')
+        # BatchWriteItem rejects a batch that writes the same key twice
+        if len(product_ids) != len(set(product_ids)):
+            raise ValueError('a product can only be written once per batch')
+        return self
 
 
-class DeleteProductRequest(APIGatewayProxyEventModel):
-    pathParameters: ProductPathParams  # type: ignore
+class BatchWriteProductsRequest(ApiGatewayRequest):
+    body: Json[BatchWriteProductsBody]
@@ -1,19 +1,63 @@
-from typing import Annotated, List
+from typing import Annotated, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, PositiveInt
 
 from product.models.products.product import ProductId
 
 
-class CreateProductOutput(BaseModel):
+# deferred like the request models, only the output of the invoked route is built
+class CreateProductOutput(BaseModel, defer_build=True):
     id: ProductId
 
 
-class GetProductOutput(BaseModel):
+class UpdateProductOutput(BaseModel, defer_build=True):
     id: ProductId
     name: Annotated[str, Field(min_length=1, max_length=20)]
     price: PositiveInt
 
 
-class ListProductsOutput(BaseModel):
+class GetProductOutput(BaseModel, defer_build=True):
+    id: ProductId
+    # unset when the client selected a sparse fieldset without them, dump with exclude_unset
+    name: Optional[Annotated[str, Field(min_length=1, max_length=20)]] = None
+    price: Optional[PositiveInt] = None
+    updated_at: Optional[PositiveInt] = Field(default=None, exclude=True)  # validator of the product, never sent
+
+
+class ListProductsOutput(BaseModel, defer_build=True):
     products: List[GetProductOutput]
+    next_token: Optional[str] = None
+
+
+class ExportProductsOutput(BaseModel, defer_build=True):
+    products: str  # newline delimited JSON, one GetProductOutput per line
+    next_token: Optional[str] = None
+
+
+class BatchGetProductsOutput(BaseModel, defer_build=True):
+    products: List[GetProductOutput]
+    missing_ids: List[ProductId]
+
+
+class BatchWriteProductResult(BaseModel, defer_build=True):
+    id: ProductId
+    operation: Literal['UPSERT', 'DELETE']  # an upsert creates the product or replaces the existing one
+    status: Literal['SUCCEEDED', 'FAILED']
+
+
+class BatchWriteProductsOutput(BaseModel, defer_build=True):
+    results: List[BatchWriteProductResult]
+    succeeded: int
+    failed: int
+
+
+class ProductsStatsOutput(BaseModel, defer_build=True):
+    product_count: int
+    price_sum: int
+    # unset while the catalog has no products
+    price_min: Optional[int] = None
+    price_max: Optional[int] = None
+    price_average: Optional[float] = None
+    added_per_day: Dict[str, int]  # UTC day (YYYY-MM-DD) -> products added that day, over the last 90 days
+    removed_per_day: Dict[str, int]
+    version: int = Field(default=0, exclude=True)  # catalog version the statistics were read at, never sent
@@ -1,4 +1,4 @@
-from typing import Annotated
+from typing import Annotated, Any, Generic, List, Literal, Optional, TypeVar
 
 from pydantic import BaseModel, Field, PositiveInt
 from pydantic.functional_validators import AfterValidator
@@ -8,6 +8,12 @@ from product.models.products.validators import validate_product_id
 ProductId = Annotated[str, Field(min_length=36, max_length=36), AfterValidator(validate_product_id)]
 """Unique Product ID, represented and validated as a UUID string."""
 
+ProductField = Literal['id', 'name', 'price']
+"""Product attribute a client can select with a sparse fieldset."""
+
+ProductsSort = Literal['newest']
+"""Sort order of a products listing, products are listed in table order when it is not set."""
+
 # schemas here are shared between both handler and domain layer of the crud module
 
 
@@ -22,8 +28,99 @@ class Product(BaseModel):
         Product ID (UUID string)
     price : PositiveInt
         Product price represented as a positive integer
+    updated_at : Optional[PositiveInt]
+        Unix time in milliseconds of the last write of the product, it validates conditional requests and is never serialized.
+        None for products last written before it was kept.
     """
 
     name: Annotated[str, Field(min_length=1, max_length=50)]
     id: ProductId
     price: PositiveInt
+    updated_at: Optional[PositiveInt] = Field(default=None, exclude=True)
+
+
+class ProductProjection(BaseModel):
+    """A product read with a subset of its attributes, attributes that were not read are left unset.
+
+    Parameters
+    ----------
+    id : ProductId
+        Product ID (UUID string), always read
+    name : Optional[str]
+        Product name
+    price : Optional[PositiveInt]
+        Product price represented as a positive integer
+    updated_at : Optional[PositiveInt]
+        Unix time in milliseconds of the last write of the product, always read and never serialized
+    """
+
+    id: ProductId
+    name: Optional[Annotated[str, Field(min_length=1, max_length=50)]] = None
+    price: Optional[PositiveInt] = None
+    updated_at: Optional[PositiveInt] = Field(default=None, exclude=True)
+
+
+class ProductUpdate(BaseModel):
+    """Attributes to change on an existing product, attributes left unset keep their current value.
+
+    Parameters
+    ----------
+    name : Optional[str]
+        New product name
+    price : Optional[PositiveInt]
+        New product price represented as a positive integer
+    """
+
+    name: Optional[Annotated[str, Field(min_length=1, max_length=50)]] = None
+    price: Optional[PositiveInt] = None
+
+
+ProductT = TypeVar('ProductT', Product, ProductProjection)
+
+
+class ProductsPage(BaseModel, Generic[ProductT]):
+    """A single page of products read from the database.
+
+    Parameters
+    ----------
+    products : List[ProductT]
+        Products in this page, projections when the page was read with a sparse fieldset
+    last_key : Optional[dict[str, Any]]
+        Key of the last product evaluated, used as the exclusive start key of the next page. None when there are no more pages.
+    """
+
+    products: List[ProductT]
+    last_key: Optional[dict[str, Any]] = None
+
+
+class ProductsBatch(BaseModel):
+    """Products read from the database by their IDs.
+
+    Parameters
+    ----------
+    products : List[Product]
+        Products that were found, in the order they were requested
+    missing_ids : List[ProductId]
+        Requested product IDs that were not found
+    """
+
+    products: List[Product]
+    missing_ids: List[ProductId]
+
+
+class ProductWriteResult(BaseModel):
+    """Outcome of a single product write in a batch.
+
+    Parameters
+    ----------
+    id : ProductId
+        Product ID (UUID string)
+    operation : Literal['UPSERT', 'DELETE']
+        Write operation requested for the product, an upsert creates the product or replaces the existing one
+    succeeded : bool
+        Whether the write was applied
+    """
+
+    id: ProductId
+    operation: Literal['UPSERT', 'DELETE']
+    succeeded: bool
@@ -0,0 +1,123 @@
+import functools
+import logging
+import os
+import random
+import sys
+from collections import deque
+from typing import IO, Any, Callable, Optional, TypeVar
+
+from product.constants import LOG_BUFFER_MAX_RECORDS, LOG_DEBUG_BUFFER_ENV, LOG_INFO_SAMPLE_RATE_ENV
+
+_Handler = TypeVar('_Handler', bound=Callable[..., Any])
+
+
+class LazyLogValue:
+    """Log value computed only when its record is emitted, a buffered or sampled out record never computes it."""
+
+    __slots__ = ('_func', '_args')
+
+    def __init__(self, func: Callable[..., Any], *args: Any):
+        self._func = func
+        self._args = args
+
+    def __call__(self) -> Any:
+        return self._func(*self._args)
+
+
+def lazy(func: Callable[..., Any], *args: Any) -> LazyLogValue:
+    """Wraps an expensive log value, e.g. `logger.debug('environment variables', env_vars=lazy(env_vars.model_dump))`."""
+    return LazyLogValue(func, *args)
+
+
+def log_json_default(value: Any) -> Any:
+    # JSON encoder fallback of the log formatter, lazy values are computed at encoding time
+    return value() if isinstance(value, LazyLogValue) else str(value)
+
+
+class BufferedLogHandler(logging.StreamHandler):
+    def __init__(
+        self,
+        buffer_enabled: bool = False,
+        info_sample_rate: float = 1.0,
+        max_records: int = LOG_BUFFER_MAX_RECORDS,
+        stream: Optional[IO[str]] = None,
+    ):
+        """Log handler emitting warnings and errors right away, and lower records of sampled invocations only.
+
+        With the buffer enabled, records that are not emitted are kept in memory and emitted right before the first error
+        of the invocation, or when the invocation raises, otherwise they are dropped when it ends. Records are formatted
+        only when emitted, dropped records never pay for their JSON encoding or their lazy values.
+
+        Parameters
+        ----------
+        buffer_enabled : bool, optional
+            Whether to buffer the records that are not emitted, by default False drops them
+        info_sample_rate : float, optional
+            Share of invocations emitting their records below WARNING, by default 1.0 emits all of them
+        max_records : int, optional
+            Records buffered per invocation, the oldest ones are dropped first
+        stream : Optional[IO[str]], optional
+            Stream to write to, by default stdout like the Powertools logger
+        """
+        super().__init__(stream or sys.stdout)
+        self.buffer_enabled = buffer_enabled
+        self.info_sample_rate = info_sample_rate
+        self.emit_level = logging.NOTSET  # records below it are buffered, the logger lets them through to the buffer
+        self._sampled = True  # init phase records are always emitted
+        # each record is kept with the logger keys of its time, keys appended later must not show up in it
+        self._buffer: deque[tuple[logging.LogRecord, Optional[dict[str, Any]]]] = deque(maxlen=max_records)
+
+    @classmethod
+    def from_env(cls) -> 'BufferedLogHandler':
+        """Builds a handler from `LOG_DEBUG_BUFFER` and `LOG_INFO_SAMPLE_RATE`, the environment models validate them."""
+        try:
+            info_sample_rate = min(1.0, max(0.0, float(os.getenv(LOG_INFO_SAMPLE_RATE_ENV, '1'))))
+        except ValueError:
+            info_sample_rate = 1.0
+        return cls(buffer_enabled=os.getenv(LOG_DEBUG_BUFFER_ENV, 'false').lower() == 'true', info_sample_rate=info_sample_rate)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.levelno >= logging.WARNING or (self._sampled and record.levelno >= self.emit_level):
+            if record.levelno >= logging.ERROR:
+                self.flush_buffer()
+            super().emit(record)
+        elif self.buffer_enabled:
+            log_format = getattr(self.formatter, 'log_format', None)
+            self._buffer.append((record, dict(log_format) if log_format is not None else None))
+
+    def flush_buffer(self) -> None:
+        """Emits the buffered records, with the logger keys they were logged with."""
+        with self.lock:  # type: ignore[union-attr]
+            current_format = getattr(self.formatter, 'log_format', None)
+            try:
+                while self._buffer:
+                    record, log_format = self._buffer.popleft()
+                    if log_format is not None:
+                        self.formatter.log_format = log_format  # type: ignore[union-attr]
+                    super().emit(record)
+            finally:
+                if current_format is not None:
+                    self.formatter.log_format = current_format  # type: ignore[union-attr]
+
+    def start_invocation(self) -> None:
+        self._buffer.clear()
+        self._sampled = random.random() < self.info_sample_rate
+
+    def end_invocation(self) -> None:
+        self._buffer.clear()
+
+    def buffer_invocation(self, handler: _Handler) -> _Handler:
+        """Lambda handler decorator, starts the invocation buffer and emits it when the invocation raises."""
+
+        @functools.wraps(handler)
+        def decorate(event: Any, context: Any, *args: Any, **kwargs: Any) -> Any:
+            self.start_invocation()
+            try:
+                return handler(event, context, *args, **kwargs)
+            except Exception:
+                self.flush_buffer()
+                raise
+            finally:
+                self.end_invocation()
+
+        return decorate  # type: ignore[return-value]
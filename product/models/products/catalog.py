@@ -0,0 +1,107 @@
+import hashlib
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+from product.models.products.product import ProductEntry
+
+# the catalog snapshot and statistics are written by the stream processor and read by the CRUD handlers
+
+CATALOG_SHARDS = 256
+"""Number of snapshot items, a 400 KB item holds ~3,000 products so the snapshot holds ~750,000 products."""
+CATALOG_SHARD_ATTRIBUTE = 'shard'
+CATALOG_PRODUCTS_ATTRIBUTE = 'products'
+CATALOG_VERSION_ATTRIBUTE = 'version'
+CATALOG_INCOMPLETE_ATTRIBUTE = 'incomplete'
+"""Set on a snapshot item that ran out of space, products were left out of it and lists no longer read the snapshot."""
+CATALOG_STATS_SHARD = -1
+"""Partition key of the catalog statistics item, it is never a products shard."""
+CATALOG_EXPIRES_AT_ATTRIBUTE = 'expires_at'
+"""Time to live attribute of the table, only set on stream batch markers."""
+CATALOG_STATS_BATCH_TTL_SECONDS = 86_400
+"""Stream records are kept for 24 hours, a batch is never retried once its marker expires."""
+CATALOG_STATS_RETENTION_DAYS = 90
+"""Days the added and removed products per day are kept for, older days are removed so the statistics item stays small."""
+
+
+def get_catalog_shard(product_id: str) -> int:
+    """Returns the snapshot item a product is kept in.
+
+    Parameters
+    ----------
+    product_id : str
+        Product ID (UUID string)
+
+    Returns
+    -------
+    int
+        Snapshot item partition key, between 0 and `CATALOG_SHARDS - 1`
+    """
+    # every item holds a range of consecutive product ids, a list page only reads the items from its cursor on
+    return int(product_id[:2], 16)
+
+
+def get_stats_batch_shard(batch_id: str) -> int:
+    """Returns the partition key of the marker of a stream batch applied to the catalog statistics.
+
+    Parameters
+    ----------
+    batch_id : str
+        Event ID of the first stream record of the batch
+
+    Returns
+    -------
+    int
+        Marker item partition key, below `CATALOG_STATS_SHARD`
+    """
+    # 120 bits of the event ID hash, within the 38 digits precision of DynamoDB numbers
+    return CATALOG_STATS_SHARD - 1 - int(hashlib.sha256(batch_id.encode('utf-8')).hexdigest()[:30], 16)
+
+
+class CatalogShard(BaseModel):
+    """Data representation for a single item of the catalog snapshot table.
+
+    Parameters
+    ----------
+    shard : int
+        Snapshot item partition key
+    version : int
+        Incremented by every product change applied to the item
+    products : dict[str, ProductEntry]
+        Products kept in the item, keyed by product ID
+    incomplete : bool
+        Whether products were left out of the item once it reached the DynamoDB item size limit
+    """
+
+    shard: Annotated[int, Field(ge=0, lt=CATALOG_SHARDS)]
+    version: Annotated[int, Field(ge=0)] = 0
+    products: dict[str, ProductEntry] = Field(default_factory=dict)
+    incomplete: bool = False
+
+
+class CatalogStatsEntry(BaseModel):
+    """Data representation for the catalog statistics item, maintained with atomic counter increments.
+
+    Parameters
+    ----------
+    product_count : int
+        Number of products in the catalog
+    price_sum : int
+        Sum of the prices of all products
+    price_counts : dict[int, int]
+        Number of products per price, min and max prices are derived from it. Prices no product has anymore are removed,
+        they may be read at 0 in between
+    added_per_day : dict[str, int]
+        Number of added products per UTC day (YYYY-MM-DD), over the last `CATALOG_STATS_RETENTION_DAYS` days
+    removed_per_day : dict[str, int]
+        Number of removed products per UTC day (YYYY-MM-DD), over the last `CATALOG_STATS_RETENTION_DAYS` days
+    version : int
+        Incremented by every batch of changes applied to the item
+    """
+
+    product_count: int = 0
+    price_sum: int = 0
+    price_counts: dict[int, int] = Field(default_factory=dict)
+    added_per_day: dict[str, int] = Field(default_factory=dict)
+    removed_per_day: dict[str, int] = Field(default_factory=dict)
+    version: Annotated[int, Field(ge=0)] = 0
@@ -1,11 +1,22 @@
+import logging
+
 from aws_lambda_powertools.logging.logger import Logger
 from aws_lambda_powertools.metrics.metrics import Metrics
 from aws_lambda_powertools.tracing.tracer import Tracer
 
+from product.log_buffer import BufferedLogHandler, log_json_default
+
 METRICS_NAMESPACE = 'products_kpi'
 
+# emits warnings and errors right away, samples lower records by invocation and buffers those not emitted when LOG_DEBUG_BUFFER is set
+log_handler = BufferedLogHandler.from_env()
+
 # JSON output format, service name can be set by environment variable "POWERTOOLS_SERVICE_NAME"
-logger: Logger = Logger()
+logger: Logger = Logger(logger_handler=log_handler, json_default=log_json_default)
+if log_handler.buffer_enabled:
+    # records below LOG_LEVEL reach the handler, which keeps them until the invocation fails
+    log_handler.emit_level = logger.log_level
+    logger.setLevel(logging.DEBUG)
 
 # service name can be set by environment variable "POWERTOOLS_SERVICE_NAME". Disabled by setting POWERTOOLS_TRACE_DISABLED to "True"
 tracer: Tracer = Tracer()
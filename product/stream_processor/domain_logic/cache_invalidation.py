@@ -0,0 +1,45 @@
+from uuid import uuid4
+
+from product.cache.base import CacheBackend
+from product.cache.exceptions import CacheBackendError
+from product.cache.keys import PRODUCTS_GENERATION_KEY, get_product_key
+from product.observability import logger
+from product.stream_processor.models.product import ProductCatalogChange
+
+
+def invalidate_product_cache(changes: list[ProductCatalogChange], cache_backend: CacheBackend) -> None:
+    """Drops changed products, and every cached list page, from the shared cache of the CRUD API.
+
+    Parameters
+    ----------
+    changes : list[ProductCatalogChange]
+        Product changes of the stream batch
+    cache_backend : CacheBackend
+        Backend holding the shared cache
+
+    Environment variables
+    ---------------------
+    `CACHE_URL` : URL of the shared cache
+
+    Integrations
+    ------------
+
+    # Cache
+
+    * `RedisCacheBackend` for any server speaking the Redis protocol, `InMemoryCacheBackend` as a local stand-in.
+
+    Notes
+    -----
+    Failures are logged and don't fail the batch, cached entries expire on their TTL anyway.
+    """
+    if not changes:
+        return
+    product_ids = sorted({change.product_id for change in changes})
+    try:
+        cache_backend.delete([get_product_key(product_id) for product_id in product_ids])
+        # pages are keyed by the generation, a new one orphans all of them at once and they expire on their TTL
+        cache_backend.set(PRODUCTS_GENERATION_KEY, uuid4().hex, ttl_seconds=None)
+    except CacheBackendError:
+        logger.exception('failed to invalidate shared product cache', products=len(product_ids))
+        return
+    logger.info('invalidated shared product cache', products=len(product_ids))
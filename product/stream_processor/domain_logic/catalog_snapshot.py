@@ -0,0 +1,32 @@
+from product.stream_processor.integrations.catalog.base import BaseCatalogHandler
+from product.stream_processor.models.product import ProductCatalogChange
+
+
+def update_catalog_snapshot(changes: list[ProductCatalogChange], catalog_handler: BaseCatalogHandler) -> None:
+    """Applies product changes to the catalog snapshot served by the list products API.
+
+    Parameters
+    ----------
+    changes : list[ProductCatalogChange]
+        Product changes in stream order, a change without a product removes it from the snapshot.
+    catalog_handler : BaseCatalogHandler
+        Catalog handler to apply changes with
+
+    Environment variables
+    ---------------------
+    `CATALOG_TABLE_NAME` : Table holding the catalog snapshot
+
+    Integrations
+    ------------
+
+    # Catalog
+
+    * `DynamoDbCatalogHandler` keeps the snapshot as a fixed number of DynamoDB items, one map of products per item.
+
+    Raises
+    ------
+    CatalogSnapshotUpdateError
+        When a change could not be applied. The stream retries the batch, replaying a change leaves the same products in the snapshot.
+    """
+    if changes:
+        catalog_handler.apply(changes=changes)
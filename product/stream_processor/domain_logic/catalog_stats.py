@@ -0,0 +1,84 @@
+from collections import Counter
+
+from product.observability import logger
+from product.stream_processor.integrations.catalog.base import BaseCatalogHandler
+from product.stream_processor.models.product import CatalogStatsBatch, CatalogStatsDelta, ProductCatalogChange
+
+
+def update_catalog_stats(changes: list[ProductCatalogChange], catalog_handler: BaseCatalogHandler, batch_id: str) -> None:
+    """Applies a batch of product changes to the catalog statistics served by the products stats API.
+
+    The whole batch is folded into a single delta, so the statistics item is updated once per batch. Every batch increments
+    the statistics version, even one that leaves the counters as they are, like a product renamed: the version validates the
+    catalog lists.
+    A retried batch starts at the same stream record, changes it already applied are not counted again.
+
+    Parameters
+    ----------
+    changes : list[ProductCatalogChange]
+        Product changes in stream order, with the product before and after each change.
+    catalog_handler : BaseCatalogHandler
+        Catalog handler to apply the statistics delta with
+    batch_id : str
+        Event ID of the first stream record of the batch
+
+    Environment variables
+    ---------------------
+    `CATALOG_TABLE_NAME` : Table holding the catalog statistics item
+
+    Raises
+    ------
+    CatalogSnapshotUpdateError
+        When the delta could not be applied, nothing is counted and the stream retries the batch.
+    """
+    if not changes:
+        return
+    batch = CatalogStatsBatch(batch_id=batch_id, changes=len(changes))
+    applied_changes = catalog_handler.apply_stats(delta=build_catalog_stats_delta(changes), batch=batch)
+    if applied_changes is None:
+        return
+    if applied_changes >= len(changes):
+        logger.info('catalog statistics batch was already applied', batch_id=batch_id)
+        return
+    # a retry after the statistics were applied, it may hold records that arrived since then, only they are counted
+    logger.info('catalog statistics batch was partially applied', batch_id=batch_id, applied_changes=applied_changes)
+    delta = build_catalog_stats_delta(changes[applied_changes:])
+    # only one invocation processes a stream shard at a time, the marker can't change in between
+    catalog_handler.apply_stats(delta=delta, batch=batch.model_copy(update={'applied_changes': applied_changes}))
+
+
+def build_catalog_stats_delta(changes: list[ProductCatalogChange]) -> CatalogStatsDelta:
+    """Folds product changes into the change they make to the catalog statistics.
+
+    Parameters
+    ----------
+    changes : list[ProductCatalogChange]
+        Product changes, with the product before and after each change.
+
+    Returns
+    -------
+    CatalogStatsDelta
+        Change to apply to the catalog statistics, prices whose count doesn't change are left out.
+    """
+    price_counts: Counter[int] = Counter()
+    added_per_day: Counter[str] = Counter()
+    removed_per_day: Counter[str] = Counter()
+    for change in changes:
+        day = change.changed_at.strftime('%Y-%m-%d')
+        # an update moves the product from its previous price to its new one
+        if change.previous_product is not None:
+            price_counts[change.previous_product.price] -= 1
+        if change.product is not None:
+            price_counts[change.product.price] += 1
+        if change.previous_product is None and change.product is not None:
+            added_per_day[day] += 1
+        elif change.previous_product is not None and change.product is None:
+            removed_per_day[day] += 1
+
+    return CatalogStatsDelta(
+        product_count=sum(added_per_day.values()) - sum(removed_per_day.values()),
+        price_sum=sum(price * count for price, count in price_counts.items()),
+        price_counts={price: count for price, count in price_counts.items() if count},
+        added_per_day=dict(added_per_day),
+        removed_per_day=dict(removed_per_day),
+    )
@@ -1,13 +1,18 @@
-from typing import Annotated, Literal
+from typing import Annotated, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SecretStr
 
 
 class Observability(BaseModel):
     POWERTOOLS_SERVICE_NAME: Annotated[str, Field(min_length=1)]
     LOG_LEVEL: Literal['DEBUG', 'INFO', 'ERROR', 'CRITICAL', 'WARNING', 'EXCEPTION']
+    # read by the log handler when the logger is created, declared here so invalid values fail the invocation
+    LOG_DEBUG_BUFFER: bool = False  # records below LOG_LEVEL are buffered and only emitted when the invocation fails
+    LOG_INFO_SAMPLE_RATE: Annotated[float, Field(ge=0, le=1)] = 1.0  # share of invocations emitting their records below WARNING
 
 
 class PrcStreamVars(Observability):
     EVENT_BUS: Annotated[str, Field(min_length=1)]
     EVENT_SOURCE: Annotated[str, Field(min_length=1)]
+    CATALOG_TABLE_NAME: Optional[Annotated[str, Field(min_length=1)]] = None  # catalog snapshot is maintained only when set
+    CACHE_URL: Optional[SecretStr] = None  # shared cache of the CRUD API, changed products are dropped from it when set
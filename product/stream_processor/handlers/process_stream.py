@@ -1,26 +1,43 @@
+from datetime import datetime, timezone
 from typing import Any
 
 from aws_lambda_env_modeler import get_environment_variables, init_environment_variables
 from aws_lambda_powertools.metrics import MetricUnit
-from aws_lambda_powertools.utilities.data_classes.dynamo_db_stream_event import DynamoDBStreamEvent
+from aws_lambda_powertools.utilities.data_classes.dynamo_db_stream_event import DynamoDBRecord, DynamoDBStreamEvent, StreamRecord
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
-from product.observability import logger, metrics, tracer
+from product.aws_clients import prime_clients
+from product.cache import get_cache_backend
+from product.cache.base import CacheBackend
+from product.log_buffer import lazy
+from product.models.products.product import ProductEntry
+from product.observability import log_handler, logger, metrics, tracer
+from product.stream_processor.domain_logic.cache_invalidation import invalidate_product_cache
+from product.stream_processor.domain_logic.catalog_snapshot import update_catalog_snapshot
+from product.stream_processor.domain_logic.catalog_stats import update_catalog_stats
 from product.stream_processor.domain_logic.product_notification import notify_product_updates
 from product.stream_processor.handlers.models.env_vars import PrcStreamVars
+from product.stream_processor.integrations.catalog.base import BaseCatalogHandler
+from product.stream_processor.integrations.catalog.dynamodb import DynamoDbCatalogHandler
 from product.stream_processor.integrations.events.base import BaseEventHandler
 from product.stream_processor.integrations.events.event_handler import EventHandler
-from product.stream_processor.models.product import ProductChangeNotification
+from product.stream_processor.models.product import ProductCatalogChange, ProductChangeNotification
+
+# every invocation reuses the clients created and connected during the Lambda init phase
+prime_clients('dynamodb', 'events')
 
 
 @init_environment_variables(model=PrcStreamVars)
-@logger.inject_lambda_context(log_event=True)
+@log_handler.buffer_invocation
+@logger.inject_lambda_context
 @metrics.log_metrics
 @tracer.capture_lambda_handler(capture_response=False)
 def process_stream(
     event: dict[str, Any],
     context: LambdaContext,
     event_handler: BaseEventHandler | None = None,
+    catalog_handler: BaseCatalogHandler | None = None,
+    cache_backend: CacheBackend | None = None,
 ) -> dict:
     """Process batch of Amazon DynamoDB Stream containing product changes.
 
@@ -39,12 +56,20 @@ def process_stream(
         See [sample](https://docs.aws.amazon.com/lambda/latest/dg/python-context.html)
     event_handler : BaseEventHandler | None, optional
         Event Handler to use to notify product changes, by default `EventHandler` with EventBridge as a provider
+    catalog_handler : BaseCatalogHandler | None, optional
+        Catalog Handler to apply product changes to the catalog snapshot and statistics with,
+        by default `DynamoDbCatalogHandler` when `CATALOG_TABLE_NAME` is set, otherwise the snapshot is not maintained
+    cache_backend : CacheBackend | None, optional
+        Shared cache of the CRUD API to drop changed products from, by default the backend of `CACHE_URL` when it is set
 
     Integrations
     ------------
 
     # Domain
 
+    * `update_catalog_snapshot` to apply `ProductCatalogChange` changes to the catalog snapshot
+    * `update_catalog_stats` to apply `ProductCatalogChange` changes to the catalog statistics, once per stream batch
+    * `invalidate_product_cache` to drop changed products from the shared cache
     * `notify_product_updates` to notify `ProductChangeNotification` changes
 
     Returns
@@ -58,26 +83,49 @@ def process_stream(
         Partial or total failures when sending notification. It allows the stream to stop at the exact same sequence number.
 
         This means sending notifications are at least once.
+    CatalogSnapshotUpdateError
+        A product change could not be applied to the catalog snapshot, the batch is retried before any notification is sent.
     """
     # Until we create our handler product stream change input
     stream_records = DynamoDBStreamEvent(event)
 
+    # the whole batch is only encoded when the record is emitted, it is buffered with the debug logs until a batch fails
+    logger.debug('stream batch received', event=event)
+
     env_vars = get_environment_variables(model=PrcStreamVars)
-    logger.debug('environment variables', env_vars=env_vars.model_dump())
+    logger.debug('environment variables', env_vars=lazy(env_vars.model_dump))
 
     metrics.add_metric(name='StreamRecords', unit=MetricUnit.Count, value=len(stream_records.keys()))
 
     product_updates = []
+    catalog_changes = []
+    batch_id = ''
     for record in stream_records.records:
+        batch_id = batch_id or record.event_id or ''  # a retried batch starts at the same record
         product_id = record.dynamodb.keys.get('id', '')  # type: ignore[union-attr]
         logger.append_keys(product_id=product_id)
         logger.info('handling record', event_name=record.event_name)
+        change = _build_catalog_change(product_id, record)
 
         match record.event_name:
             case record.event_name.INSERT:  # type: ignore[union-attr]
                 product_updates.append(ProductChangeNotification(product_id=product_id, status='ADDED'))
+            # writes that leave the product as is, like the recency bucket backfill, are not product updates
+            case record.event_name.MODIFY if change.product != change.previous_product:  # type: ignore[union-attr]
+                product_updates.append(ProductChangeNotification(product_id=product_id, status='UPDATED'))
             case record.event_name.REMOVE:  # type: ignore[union-attr]
                 product_updates.append(ProductChangeNotification(product_id=product_id, status='REMOVED'))
+        catalog_changes.append(change)
+
+    if catalog_handler is None and env_vars.CATALOG_TABLE_NAME:  # pragma: no cover
+        catalog_handler = DynamoDbCatalogHandler(table_name=env_vars.CATALOG_TABLE_NAME)
+
+    if catalog_handler is not None:
+        # applied before notifying, consumers listing products after a notification see the change
+        update_catalog_snapshot(changes=catalog_changes, catalog_handler=catalog_handler)
+        update_catalog_stats(changes=catalog_changes, catalog_handler=catalog_handler, batch_id=batch_id)
+
+    _invalidate_caches(catalog_changes, env_vars, cache_backend)
 
     if event_handler is None:  # pragma: no cover
         event_handler = EventHandler(event_source=env_vars.EVENT_SOURCE, event_bus=env_vars.EVENT_BUS)
@@ -85,3 +133,28 @@ def process_stream(
     receipt = notify_product_updates(update=product_updates, event_handler=event_handler)
 
     return receipt.model_dump()
+
+
+def _invalidate_caches(
+    changes: list[ProductCatalogChange],
+    env_vars: PrcStreamVars,
+    cache_backend: CacheBackend | None,
+) -> None:
+    if cache_backend is None and env_vars.CACHE_URL:  # pragma: no cover
+        cache_backend = get_cache_backend(env_vars.CACHE_URL.get_secret_value())
+
+    if cache_backend is not None:
+        invalidate_product_cache(changes=changes, cache_backend=cache_backend)
+
+
+def _build_catalog_change(product_id: str, record: DynamoDBRecord) -> ProductCatalogChange:
+    # the stream holds new and old images, an added product has no old image and a removed product no new image
+    stream_record: StreamRecord = record.dynamodb  # type: ignore[assignment]
+    new_image, old_image = stream_record.new_image, stream_record.old_image
+    changed_at = stream_record.approximate_creation_date_time
+    return ProductCatalogChange(
+        product_id=product_id,
+        product=ProductEntry.model_validate(new_image) if new_image else None,
+        previous_product=ProductEntry.model_validate(old_image) if old_image else None,
+        changed_at=datetime.fromtimestamp(changed_at, tz=timezone.utc) if changed_at is not None else datetime.now(timezone.utc),
+    )
@@ -0,0 +1,50 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from product.stream_processor.models.product import CatalogStatsBatch, CatalogStatsDelta, ProductCatalogChange
+
+
+class BaseCatalogHandler(ABC):
+    """ABC for a Catalog Handler that keeps the catalog snapshot and statistics in sync with product changes."""
+
+    @abstractmethod
+    def apply(self, changes: list[ProductCatalogChange]) -> None:
+        """Applies product changes to the catalog snapshot.
+
+        Parameters
+        ----------
+        changes : list[ProductCatalogChange]
+            Product changes in stream order, a change without a product removes it from the snapshot.
+
+        Raises
+        ------
+        CatalogSnapshotUpdateError
+            When a change could not be applied to the snapshot.
+        """
+        ...
+
+    @abstractmethod
+    def apply_stats(self, delta: CatalogStatsDelta, batch: CatalogStatsBatch) -> Optional[int]:
+        """Applies a batch of product changes to the catalog statistics, as a single atomic increment.
+
+        The increment and the marker of the batch changes it covers are written together, nothing is applied
+        when the marker doesn't hold `batch.applied_changes`.
+
+        Parameters
+        ----------
+        delta : CatalogStatsDelta
+            Change the batch makes to the catalog statistics.
+        batch : CatalogStatsBatch
+            Stream batch the delta comes from.
+
+        Returns
+        -------
+        Optional[int]
+            None once applied, otherwise the number of changes of the batch the marker holds, the delta wasn't applied.
+
+        Raises
+        ------
+        CatalogSnapshotUpdateError
+            When the delta could not be applied to the statistics.
+        """
+        ...
@@ -0,0 +1,282 @@
+import time
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Optional
+
+from aws_lambda_powertools.metrics import MetricUnit
+from botocore.exceptions import ClientError
+
+from product.aws_clients import get_dynamodb_resource
+from product.models.products.catalog import (
+    CATALOG_EXPIRES_AT_ATTRIBUTE,
+    CATALOG_INCOMPLETE_ATTRIBUTE,
+    CATALOG_PRODUCTS_ATTRIBUTE,
+    CATALOG_SHARD_ATTRIBUTE,
+    CATALOG_STATS_BATCH_TTL_SECONDS,
+    CATALOG_STATS_RETENTION_DAYS,
+    CATALOG_STATS_SHARD,
+    CATALOG_VERSION_ATTRIBUTE,
+    get_catalog_shard,
+    get_stats_batch_shard,
+)
+from product.observability import logger, metrics
+from product.stream_processor.integrations.catalog.base import BaseCatalogHandler
+from product.stream_processor.integrations.catalog.exceptions import CatalogSnapshotUpdateError
+from product.stream_processor.models.product import CatalogStatsBatch, CatalogStatsDelta, ProductCatalogChange
+
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.service_resource import Table
+
+_CONDITIONAL_CHECK_FAILED = 'ConditionalCheckFailedException'
+_VALIDATION_ERROR = 'ValidationException'
+_ITEM_TOO_LARGE_MESSAGE = 'maximum allowed size'  # the validation error of an update growing an item over 400 KB
+_TRANSACTION_CANCELED = 'TransactionCanceledException'
+_BATCH_CHANGES_ATTRIBUTE = 'changes'
+_STATS_ITEM, _BATCH_MARKER = 0, 1  # items of the statistics transaction
+_STATS_TRANSACTION_ATTEMPTS = 3  # batches of other stream shards update the statistics item concurrently
+_ATTRIBUTE_NAMES = {'#products': CATALOG_PRODUCTS_ATTRIBUTE, '#version': CATALOG_VERSION_ATTRIBUTE}
+_STATS_MAPS = ('price_counts', 'added_per_day', 'removed_per_day')  # created together with the statistics item
+_STATS_COUNTER_NAMES = {'#product_count': 'product_count', '#price_sum': 'price_sum', '#version': CATALOG_VERSION_ATTRIBUTE}
+_STATS_ATTRIBUTE_NAMES = {**_STATS_COUNTER_NAMES, **{f'#{name}': name for name in _STATS_MAPS}}
+_STATS_DAY_MAPS = ('added_per_day', 'removed_per_day')
+
+
+class DynamoDbCatalogHandler(BaseCatalogHandler):
+    def __init__(self, table_name: str, table: Optional['Table'] = None):
+        """Catalog Handler keeping the catalog snapshot in a DynamoDB table, one item per snapshot shard.
+
+        Every change is a single atomic UpdateItem of a product in the shard's `products` map,
+        so concurrent stream batches never overwrite each other's changes. Each change increments the shard version.
+        A product that doesn't fit in its shard anymore is left out and the shard is marked incomplete, lists stop reading
+        the snapshot instead of the stream retrying the batch forever.
+        Statistics live in one more item of the same table, every batch increments its counters with a single UpdateItem,
+        written in a transaction with a marker item of the batch so a retried batch is not counted twice.
+        Prices that no product has anymore and days older than the retention are then removed, so the item stays small.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the catalog snapshot table
+        table : Optional[Table], optional
+            DynamoDB boto3 table resource to use, by default a table of the container wide resource
+        """
+        self.table_name = table_name
+        self.table = table or get_dynamodb_resource().Table(table_name)
+
+    def apply(self, changes: list[ProductCatalogChange]) -> None:
+        for change in changes:
+            key = {CATALOG_SHARD_ATTRIBUTE: get_catalog_shard(change.product_id)}
+            try:
+                if change.product is None:
+                    self._remove_product(key, change.product_id)
+                else:
+                    self._put_product(key, change.product_id, change.product.model_dump())
+            except ClientError as exc:
+                error_msg = 'failed to update catalog snapshot'
+                logger.exception(error_msg, product_id=change.product_id)
+                raise CatalogSnapshotUpdateError(error_msg) from exc
+
+    def _put_product(self, key: dict[str, Any], product_id: str, product: dict[str, Any]) -> None:
+        try:
+            # nested paths can only be set once the products map exists
+            self.table.update_item(
+                Key=key,
+                UpdateExpression='SET #products.#id = :product ADD #version :one',
+                ConditionExpression='attribute_exists(#products)',
+                ExpressionAttributeNames={**_ATTRIBUTE_NAMES, '#id': product_id},
+                ExpressionAttributeValues={':product': product, ':one': 1},
+            )
+            return
+        except ClientError as exc:
+            if self._is_item_too_large(exc):
+                self._mark_shard_incomplete(key, product_id)
+                return
+            if exc.response['Error']['Code'] != _CONDITIONAL_CHECK_FAILED:
+                raise
+        logger.debug('creating catalog snapshot shard', shard=key[CATALOG_SHARD_ATTRIBUTE])
+        try:
+            self.table.update_item(
+                Key=key,
+                UpdateExpression='SET #products = :products ADD #version :one',
+                ConditionExpression='attribute_not_exists(#products)',
+                ExpressionAttributeNames=_ATTRIBUTE_NAMES,
+                ExpressionAttributeValues={':products': {product_id: product}, ':one': 1},
+            )
+        except ClientError as exc:
+            if exc.response['Error']['Code'] != _CONDITIONAL_CHECK_FAILED:
+                raise
+            # another batch created the shard in the meantime, it now has a products map
+            self._put_product(key, product_id, product)
+
+    def _mark_shard_incomplete(self, key: dict[str, Any], product_id: str) -> None:
+        # the previous version of the product is dropped too, the shard never serves a stale product
+        logger.error('catalog snapshot shard is full, product left out of the snapshot', shard=key[CATALOG_SHARD_ATTRIBUTE])
+        metrics.add_metric(name='CatalogShardOverflows', unit=MetricUnit.Count, value=1)
+        self.table.update_item(
+            Key=key,
+            UpdateExpression='REMOVE #products.#id SET #incomplete = :true ADD #version :one',
+            ExpressionAttributeNames={**_ATTRIBUTE_NAMES, '#id': product_id, '#incomplete': CATALOG_INCOMPLETE_ATTRIBUTE},
+            ExpressionAttributeValues={':true': True, ':one': 1},
+        )
+
+    @staticmethod
+    def _is_item_too_large(exc: ClientError) -> bool:
+        error = exc.response['Error']
+        return error['Code'] == _VALIDATION_ERROR and _ITEM_TOO_LARGE_MESSAGE in error.get('Message', '')
+
+    def _remove_product(self, key: dict[str, Any], product_id: str) -> None:
+        try:
+            self.table.update_item(
+                Key=key,
+                UpdateExpression='REMOVE #products.#id ADD #version :one',
+                ConditionExpression='attribute_exists(#products)',
+                ExpressionAttributeNames={**_ATTRIBUTE_NAMES, '#id': product_id},
+                ExpressionAttributeValues={':one': 1},
+            )
+        except ClientError as exc:
+            if exc.response['Error']['Code'] != _CONDITIONAL_CHECK_FAILED:
+                raise
+            logger.debug('catalog snapshot shard does not exist, nothing to remove', shard=key[CATALOG_SHARD_ATTRIBUTE])
+
+    def apply_stats(self, delta: CatalogStatsDelta, batch: CatalogStatsBatch) -> Optional[int]:
+        key = {CATALOG_SHARD_ATTRIBUTE: CATALOG_STATS_SHARD}
+        try:
+            applied_changes = self._add_stats(key, delta, batch)
+        except ClientError as exc:
+            error_msg = 'failed to update catalog statistics'
+            logger.exception(error_msg)
+            raise CatalogSnapshotUpdateError(error_msg) from exc
+        if applied_changes is None:
+            self._prune_stats(key, delta)
+        return applied_changes
+
+    def _prune_stats(self, key: dict[str, Any], delta: CatalogStatsDelta) -> None:
+        # best effort, the counters are applied already and whatever is left behind is pruned after a later batch
+        try:
+            removals, names, zero_prices = self._get_stats_removals(key, delta)
+            if not removals:
+                return
+            update: dict[str, Any] = {'UpdateExpression': f'REMOVE {", ".join(removals)}', 'ExpressionAttributeNames': names}
+            if zero_prices:
+                # a batch of another stream shard may have counted one of the prices again since it was read
+                update['ConditionExpression'] = ' AND '.join(f'{price} = :zero' for price in zero_prices)
+                update['ExpressionAttributeValues'] = {':zero': 0}
+            self.table.update_item(Key=key, **update)
+        except ClientError:
+            logger.warning('failed to prune catalog statistics, a later batch prunes them', exc_info=True)
+            return
+        logger.debug('pruned catalog statistics', removed_entries=len(removals))
+
+    def _get_stats_removals(self, key: dict[str, Any], delta: CatalogStatsDelta) -> tuple[list[str], dict[str, str], list[str]]:
+        # only prices whose count went down in this batch can have reached 0
+        prices = {f'#price_{idx}': str(price) for idx, price in enumerate(price for price, count in delta.price_counts.items() if count < 0)}
+        names = {**({'#price_counts': 'price_counts'} if prices else {}), **{f'#{name}': name for name in _STATS_DAY_MAPS}, **prices}
+        response = self.table.get_item(
+            Key=key,
+            ProjectionExpression=', '.join([*(f'#{name}' for name in _STATS_DAY_MAPS), *(f'#price_counts.{name}' for name in prices)]),
+            ExpressionAttributeNames=names,
+            ConsistentRead=True,
+        )
+        item: dict[str, Any] = response.get('Item', {})
+        zero_prices = [f'#price_counts.{name}' for name, price in prices.items() if item.get('price_counts', {}).get(price) == 0]
+
+        oldest_day = (datetime.now(timezone.utc) - timedelta(days=CATALOG_STATS_RETENTION_DAYS)).strftime('%Y-%m-%d')
+        old_days = sorted({day for name in _STATS_DAY_MAPS for day in item.get(name, {}) if day < oldest_day})
+        day_names = {day: f'#day_{idx}' for idx, day in enumerate(old_days)}
+        old_day_entries = [f'#{name}.{day_names[day]}' for name in _STATS_DAY_MAPS for day in item.get(name, {}) if day in day_names]
+
+        # an update rejects attribute names its expressions don't use
+        removals = [*zero_prices, *old_day_entries]
+        used_names = {name: value for name, value in names.items() if any(name in removal.split('.') for removal in removals)}
+        return removals, {**used_names, **{name: day for day, name in day_names.items()}}, zero_prices
+
+    def _add_stats(self, key: dict[str, Any], delta: CatalogStatsDelta, batch: CatalogStatsBatch) -> Optional[int]:
+        counters = ['#product_count :product_count', '#price_sum :price_sum', '#version :one']
+        values: dict[str, Any] = {':product_count': delta.product_count, ':price_sum': delta.price_sum, ':one': 1}
+        # DynamoDB rejects unused attribute names, other maps are only named when one of their entries changes
+        names = {**_STATS_COUNTER_NAMES, '#price_counts': 'price_counts'}  # used by the condition
+        map_entries: dict[str, dict[str, int]] = {
+            'price_counts': {str(price): count for price, count in delta.price_counts.items()},
+            'added_per_day': delta.added_per_day,
+            'removed_per_day': delta.removed_per_day,
+        }
+        for map_name, entries in map_entries.items():
+            if entries:
+                names[f'#{map_name}'] = map_name
+            for idx, (entry_key, count) in enumerate(entries.items()):
+                names[f'#{map_name}_{idx}'] = entry_key
+                values[f':{map_name}_{idx}'] = count
+                counters.append(f'#{map_name}.#{map_name}_{idx} :{map_name}_{idx}')
+        # map entries can only be incremented once the maps exist
+        failed_item = self._write_stats(
+            batch,
+            Key=key,
+            UpdateExpression=f'ADD {", ".join(counters)}',
+            ConditionExpression='attribute_exists(#price_counts)',
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values,
+        )
+        if failed_item is None:
+            return None
+        if failed_item == _BATCH_MARKER:
+            return self._get_applied_changes(batch)
+        logger.debug('creating catalog statistics item')
+        failed_item = self._write_stats(
+            batch,
+            Key=key,
+            UpdateExpression=f'SET {", ".join(f"#{name} = :{name}" for name in _STATS_MAPS)} ADD #product_count :product_count, #price_sum :price_sum, #version :one',
+            ConditionExpression='attribute_not_exists(#price_counts)',
+            ExpressionAttributeNames=_STATS_ATTRIBUTE_NAMES,
+            ExpressionAttributeValues={
+                ':product_count': delta.product_count,
+                ':price_sum': delta.price_sum,
+                ':one': 1,
+                **{f':{name}': entries for name, entries in map_entries.items()},
+            },
+        )
+        if failed_item is None:
+            return None
+        if failed_item == _BATCH_MARKER:
+            return self._get_applied_changes(batch)
+        # another batch created the item in the meantime, it now has its maps
+        return self._add_stats(key, delta, batch)
+
+    def _write_stats(self, batch: CatalogStatsBatch, **stats_update: Any) -> Optional[int]:
+        # returns None once written, otherwise the transaction item that failed its condition, the batch marker first
+        marker: dict[str, Any] = {
+            'TableName': self.table_name,
+            'Key': {CATALOG_SHARD_ATTRIBUTE: get_stats_batch_shard(batch.batch_id)},
+            'UpdateExpression': 'SET #changes = :changes, #expires_at = :expires_at',
+            'ExpressionAttributeNames': {'#changes': _BATCH_CHANGES_ATTRIBUTE, '#expires_at': CATALOG_EXPIRES_AT_ATTRIBUTE},
+            'ExpressionAttributeValues': {':changes': batch.changes, ':expires_at': int(time.time()) + CATALOG_STATS_BATCH_TTL_SECONDS},
+        }
+        if batch.applied_changes:
+            marker['ConditionExpression'] = '#changes = :applied_changes'
+            marker['ExpressionAttributeValues'][':applied_changes'] = batch.applied_changes
+        else:
+            marker['ConditionExpression'] = 'attribute_not_exists(#changes)'
+        # the client of the table resource serializes attribute values like the table does
+        transact_items: list[Any] = [{'Update': {'TableName': self.table_name, **stats_update}}, {'Update': marker}]
+        for attempt in range(_STATS_TRANSACTION_ATTEMPTS):
+            try:
+                self.table.meta.client.transact_write_items(TransactItems=transact_items)
+                return None
+            except ClientError as exc:
+                if exc.response['Error']['Code'] != _TRANSACTION_CANCELED:
+                    raise
+                reasons = [reason.get('Code') for reason in exc.response.get('CancellationReasons', [])]
+                if 'ConditionalCheckFailed' in reasons:
+                    return _BATCH_MARKER if reasons[_BATCH_MARKER] == 'ConditionalCheckFailed' else _STATS_ITEM
+                if 'TransactionConflict' not in reasons or attempt == _STATS_TRANSACTION_ATTEMPTS - 1:
+                    raise  # the stream retries the batch
+                logger.debug('catalog statistics transaction conflict, retrying', attempt=attempt)
+                time.sleep(0.05 * 2**attempt)
+        return None  # pragma: no cover (the loop always returns or raises)
+
+    def _get_applied_changes(self, batch: CatalogStatsBatch) -> int:
+        response = self.table.get_item(
+            Key={CATALOG_SHARD_ATTRIBUTE: get_stats_batch_shard(batch.batch_id)},
+            ProjectionExpression='#changes',
+            ExpressionAttributeNames={'#changes': _BATCH_CHANGES_ATTRIBUTE},
+            ConsistentRead=True,
+        )
+        return int(response.get('Item', {}).get(_BATCH_CHANGES_ATTRIBUTE, 0))  # type: ignore[arg-type]
@@ -0,0 +1,2 @@
+class CatalogSnapshotUpdateError(Exception):
+    """Raised when a product change could not be applied to the catalog snapshot, the stream retries the whole batch."""
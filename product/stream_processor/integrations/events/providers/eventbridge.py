@@ -1,9 +1,9 @@
 import os
 from typing import TYPE_CHECKING, Generator, Optional
 
-import boto3
 import botocore.exceptions
 
+from product.aws_clients import get_events_client
 from product.constants import XRAY_TRACE_ID_ENV
 from product.stream_processor.integrations.events.base import BaseEventProvider
 from product.stream_processor.integrations.events.constants import EVENTBRIDGE_PROVIDER_MAX_EVENTS_ENTRY
@@ -28,10 +28,10 @@ class EventBridge(BaseEventProvider):
         bus_name : str
             Name of the event bus to send events to
         client : Optional[EventBridgeClient], optional
-            EventBridge boto3 client to use, by default None
+            EventBridge boto3 client to use, by default the container wide client
         """
         self.bus_name = bus_name
-        self.client = client or boto3.client('events')
+        self.client = client or get_events_client()
 
     def send(self, payload: list[Event]) -> EventReceipt:
         """Sends batches of events up to maximum allowed by PutEvents API (10).
@@ -1,9 +1,9 @@
 from datetime import datetime
-from typing import Literal
+from typing import Annotated, Literal, Optional
 
 from pydantic import BaseModel, Field
 
-from product.models.products.product import ProductId
+from product.models.products.product import ProductEntry, ProductId
 
 # schemas here are shared between both handler and domain layer of the stream processor
 
@@ -26,3 +26,69 @@ class ProductChangeNotification(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
     __version__: str = 'v1'
+
+
+class ProductCatalogChange(BaseModel):
+    """Data representation for a product change applied to the catalog snapshot.
+
+    Parameters
+    ----------
+    product_id : ProductId
+        Product ID (UUID string)
+    product : Optional[ProductEntry]
+        Product as it appears after the change, None when the product was removed
+    previous_product : Optional[ProductEntry]
+        Product as it appeared before the change, None when the product was added
+    changed_at : datetime
+        Product change time (UTC)
+    """
+
+    product_id: ProductId
+    product: Optional[ProductEntry] = None
+    previous_product: Optional[ProductEntry] = None
+    changed_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class CatalogStatsDelta(BaseModel):
+    """Data representation for the changes a batch of product changes makes to the catalog statistics.
+
+    Parameters
+    ----------
+    product_count : int
+        Change in the number of products
+    price_sum : int
+        Change in the sum of all prices
+    price_counts : dict[int, int]
+        Change in the number of products per price
+    added_per_day : dict[str, int]
+        Products added per UTC day (YYYY-MM-DD)
+    removed_per_day : dict[str, int]
+        Products removed per UTC day (YYYY-MM-DD)
+    """
+
+    product_count: int = 0
+    price_sum: int = 0
+    price_counts: dict[int, int] = Field(default_factory=dict)
+    added_per_day: dict[str, int] = Field(default_factory=dict)
+    removed_per_day: dict[str, int] = Field(default_factory=dict)
+
+
+class CatalogStatsBatch(BaseModel):
+    """Data representation for the stream batch a catalog statistics delta comes from.
+
+    A failed batch is retried from its first record, possibly with more records, a marker of the applied changes
+    keeps the retries from counting them again.
+
+    Parameters
+    ----------
+    batch_id : str
+        Event ID of the first stream record of the batch
+    changes : int
+        Number of changes of the batch, counted from its first record, the delta is applied up to
+    applied_changes : int
+        Number of changes of the batch that were already applied, the delta holds the changes after them
+    """
+
+    batch_id: str
+    changes: Annotated[int, Field(ge=1)]
+    applied_changes: Annotated[int, Field(ge=0)] = 0
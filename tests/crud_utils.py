@@ -17,13 +17,14 @@ def generate_product_api_gw_event(
     body: Optional[Dict[str, Any]] = None,
     path_params: Optional[Dict[str, Any]] = None,
     path: Optional[str] = '/api/product/',
+    headers: Optional[Dict[str, str]] = None,
 ) -> dict[str, Any]:
     return {
         'version': '1.0',
         'resource': f'{path}{product_id}',
         'path': f'{path}{product_id}',
         'httpMethod': http_method.value,
-        'headers': {'Header1': 'value1', 'Header2': 'value2'},
+        'headers': {'Header1': 'value1', 'Header2': 'value2', **(headers or {})},
         'multiValueHeaders': {'Header1': ['value1'], 'Header2': ['value1', 'value2']},
         'queryStringParameters': {'parameter1': 'value1', 'parameter2': 'value'},
         'multiValueQueryStringParameters': {'parameter1': ['value1', 'value2'], 'parameter2': ['value']},
@@ -77,16 +78,20 @@ def generate_product_api_gw_event(
 def generate_api_gw_list_products_event(
     path_params: Optional[Dict[str, Any]] = None,
     path: Optional[str] = '/api/products/',
+    query_params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
 ) -> dict[str, Any]:
     return {
         'version': '1.0',
         'resource': f'{path}',
         'path': f'{path}',
         'httpMethod': 'GET',
-        'headers': {'Header1': 'value1', 'Header2': 'value2'},
+        'headers': {'Header1': 'value1', 'Header2': 'value2', **(headers or {})},
         'multiValueHeaders': {'Header1': ['value1'], 'Header2': ['value1', 'value2']},
-        'queryStringParameters': {'parameter1': 'value1', 'parameter2': 'value'},
-        'multiValueQueryStringParameters': {'parameter1': ['value1', 'value2'], 'parameter2': ['value']},
+        'queryStringParameters': {'parameter1': 'value1', 'parameter2': 'value'} if query_params is None else query_params,
+        'multiValueQueryStringParameters': {'parameter1': ['value1', 'value2'], 'parameter2': ['value']}
+        if query_params is None
+        else {key: [value] for key, value in query_params.items()},
         'requestContext': {
             'accountId': '123456789012',
             'apiId': 'id',
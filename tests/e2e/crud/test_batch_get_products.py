@@ -0,0 +1,39 @@
+import json
+from http import HTTPStatus
+
+import requests
+
+from infrastructure.product.constants import BATCH_GET_RESOURCE
+from product.crud.models.output import BatchGetProductsOutput
+from product.crud.models.product import Product
+from tests.crud_utils import generate_product_id
+from tests.e2e.crud.utils import get_auth_header
+
+
+def test_handler_200_ok(api_gw_url_slash_products: str, add_product_entry_to_db: Product, id_token: str) -> None:
+    # GIVEN an existing product in the database and a product id that does not exist
+    missing_id = generate_product_id()
+    body = {'ids': [add_product_entry_to_db.id, missing_id]}
+
+    # WHEN making a batch get request for both products
+    response: requests.Response = requests.post(
+        url=f'{api_gw_url_slash_products}/{BATCH_GET_RESOURCE}', data=json.dumps(body), timeout=10, headers=get_auth_header(id_token)
+    )
+
+    # THEN the response should be HTTP 200 OK
+    # AND contain the existing product and the missing product id
+    assert response.status_code == HTTPStatus.OK
+    response_entry = BatchGetProductsOutput.model_validate_json(response.text)
+    assert [product.model_dump() for product in response_entry.products] == [add_product_entry_to_db.model_dump()]
+    assert response_entry.missing_ids == [missing_id]
+
+
+def test_handler_invalid_body(api_gw_url_slash_products: str, id_token: str) -> None:
+    # GIVEN a batch get request with an invalid product id
+    body = {'ids': ['aaaa']}
+
+    # WHEN making a batch get request
+    response = requests.post(url=f'{api_gw_url_slash_products}/{BATCH_GET_RESOURCE}', data=json.dumps(body), headers=get_auth_header(id_token))
+
+    # THEN the response should indicate a bad request (HTTP 400)
+    assert response.status_code == HTTPStatus.BAD_REQUEST
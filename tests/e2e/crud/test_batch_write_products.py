@@ -0,0 +1,41 @@
+import json
+from http import HTTPStatus
+
+import requests
+
+from infrastructure.product.constants import BATCH_WRITE_RESOURCE
+from product.crud.models.output import BatchWriteProductsOutput
+from tests.crud_utils import generate_product_id
+from tests.e2e.crud.utils import get_auth_header
+
+
+def test_handler_200_ok(api_gw_url_slash_products: str, api_gw_url_slash_product: str, id_token: str) -> None:
+    # GIVEN a new product to create
+    product_id = generate_product_id()
+    body = {'puts': [{'id': product_id, 'name': 'test', 'price': 5}]}
+
+    # WHEN making a batch write request
+    response: requests.Response = requests.post(
+        url=f'{api_gw_url_slash_products}/{BATCH_WRITE_RESOURCE}', data=json.dumps(body), timeout=10, headers=get_auth_header(id_token)
+    )
+
+    # THEN the response should be HTTP 200 OK with a successful put
+    assert response.status_code == HTTPStatus.OK
+    response_entry = BatchWriteProductsOutput.model_validate_json(response.text)
+    assert response_entry.succeeded == 1
+    assert response_entry.results[0].model_dump() == {'id': product_id, 'operation': 'UPSERT', 'status': 'SUCCEEDED'}
+
+    # AND the product should be retrievable
+    response = requests.get(url=f'{api_gw_url_slash_product}/{product_id}', timeout=10, headers=get_auth_header(id_token))
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_handler_invalid_body(api_gw_url_slash_products: str, id_token: str) -> None:
+    # GIVEN a batch write request without any operation
+    body: dict = {'puts': [], 'deletes': []}
+
+    # WHEN making a batch write request
+    response = requests.post(url=f'{api_gw_url_slash_products}/{BATCH_WRITE_RESOURCE}', data=json.dumps(body), headers=get_auth_header(id_token))
+
+    # THEN the response should indicate a bad request (HTTP 400)
+    assert response.status_code == HTTPStatus.BAD_REQUEST
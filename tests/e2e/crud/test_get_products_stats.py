@@ -0,0 +1,29 @@
+from http import HTTPStatus
+
+import requests
+
+from infrastructure.product.constants import STATS_RESOURCE
+from product.crud.models.output import ProductsStatsOutput
+from tests.e2e.crud.utils import get_auth_header
+
+
+def test_handler_200_ok(api_gw_url_slash_products: str, id_token: str) -> None:
+    # GIVEN the catalog statistics maintained by the stream processor
+
+    # WHEN getting the products statistics
+    response: requests.Response = requests.get(url=f'{api_gw_url_slash_products}/{STATS_RESOURCE}', timeout=10, headers=get_auth_header(id_token))
+
+    # THEN the response should be HTTP 200 OK with a non negative product count
+    assert response.status_code == HTTPStatus.OK
+    stats = ProductsStatsOutput.model_validate_json(response.text)
+    assert stats.product_count >= 0
+
+
+def test_handler_forbidden(api_gw_url_slash_products: str) -> None:
+    # GIVEN a request without an authorization header
+
+    # WHEN getting the products statistics
+    response: requests.Response = requests.get(url=f'{api_gw_url_slash_products}/{STATS_RESOURCE}', timeout=10)
+
+    # THEN the response should be HTTP 401 Unauthorized
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
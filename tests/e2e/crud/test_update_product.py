@@ -0,0 +1,42 @@
+from http import HTTPStatus
+
+import requests
+
+from product.crud.models.product import Product
+from tests.crud_utils import generate_product_id
+from tests.e2e.crud.utils import get_auth_header
+
+
+def test_handler_200_update_price(api_gw_url_slash_product: str, add_product_entry_to_db: Product, id_token: str) -> None:
+    # GIVEN a URL of an existing product
+    url_with_product_id = f'{api_gw_url_slash_product}/{add_product_entry_to_db.id}'
+    new_price = add_product_entry_to_db.price + 1
+
+    # WHEN making a PATCH request that only changes the price
+    response = requests.patch(url=url_with_product_id, json={'price': new_price}, timeout=10, headers=get_auth_header(id_token))
+
+    # THEN the response should hold the updated product (HTTP 200)
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {'id': add_product_entry_to_db.id, 'name': add_product_entry_to_db.name, 'price': new_price}
+
+
+def test_handler_404_product_not_found(api_gw_url_slash_product: str, id_token: str) -> None:
+    # GIVEN a URL of a product that does not exist
+    url_with_product_id = f'{api_gw_url_slash_product}/{generate_product_id()}'
+
+    # WHEN making a PATCH request
+    response = requests.patch(url=url_with_product_id, json={'price': 5}, timeout=10, headers=get_auth_header(id_token))
+
+    # THEN the response should indicate the product was not found (HTTP 404)
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_handler_invalid_auth_token(api_gw_url_slash_product: str) -> None:
+    # GIVEN a URL for updating a product
+    url_with_product_id = f'{api_gw_url_slash_product}/{generate_product_id()}'
+
+    # WHEN making a PATCH request with an invalid id token
+    response = requests.patch(url=url_with_product_id, json={'price': 5}, timeout=10, headers=get_auth_header('aaaa'))
+
+    # THEN the response should indicate an unauthorized request (HTTP 401)
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
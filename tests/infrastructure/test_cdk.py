@@ -1,5 +1,5 @@
 from aws_cdk import App
-from aws_cdk.assertions import Template
+from aws_cdk.assertions import Match, Template
 
 from infrastructure.product.product_stack import ServiceStack
 
@@ -15,3 +15,35 @@ def test_synthesizes_properly():
     template.resource_count_is('AWS::ApiGateway::RestApi', 1)
     template.resource_count_is('AWS::DynamoDB::Table', 2)  # main db and one for idempotency
     template.resource_count_is('AWS::Events::EventBus', 1)
+
+
+def test_synthesizes_single_function_crud_api():
+    app = App()
+    service_stack = ServiceStack(scope=app, id='service-test', is_production=False, crud_single_function=True)
+
+    template = Template.from_stack(service_stack)
+
+    # verify that one function serves every CRUD route
+    template.has_resource_properties('AWS::Lambda::Function', {'Handler': 'product.crud.handlers.handle_crud_api.lambda_handler'})
+    template.resource_count_is('AWS::ApiGateway::Method', 9)
+
+
+def test_synthesizes_api_cache():
+    app = App()
+    service_stack = ServiceStack(scope=app, id='service-test', is_production=False, api_cache=True)
+
+    template = Template.from_stack(service_stack)
+
+    # verify that the stage caches the GET routes, keyed on the product, and that clients reuse them for the stage TTL
+    template.has_resource_properties('AWS::ApiGateway::Stage', {'CacheClusterEnabled': True})
+    template.has_resource_properties(
+        'AWS::ApiGateway::Method',
+        {'HttpMethod': 'GET', 'Integration': {'CacheKeyParameters': Match.array_with(['method.request.path.product'])}},
+    )
+    template.has_resource_properties(
+        'AWS::Lambda::Function',
+        {
+            'Handler': 'product.crud.handlers.handle_get_product.lambda_handler',
+            'Environment': {'Variables': Match.object_like({'GET_PRODUCT_MAX_AGE_SECONDS': '10'})},
+        },
+    )
@@ -7,6 +7,7 @@ import pytest
 from pydantic import BaseModel
 
 from infrastructure.product.constants import (
+    CATALOG_TABLE_NAME_OUTPUT,
     IDEMPOTENCY_TABLE_NAME_OUTPUT,
     POWER_TOOLS_LOG_LEVEL,
     POWERTOOLS_SERVICE_NAME,
@@ -36,6 +37,8 @@ def init():
     os.environ['AWS_DEFAULT_REGION'] = os.environ.get('AWS_DEFAULT_REGION', 'us-east-1')  # used for appconfig mocked boto calls
     os.environ['TABLE_NAME'] = get_stack_output(TABLE_NAME_OUTPUT)
     os.environ['IDEMPOTENCY_TABLE_NAME'] = get_stack_output(IDEMPOTENCY_TABLE_NAME_OUTPUT)
+    os.environ['CATALOG_TABLE_NAME'] = get_stack_output(CATALOG_TABLE_NAME_OUTPUT)
+    os.environ['CURSOR_SIGNING_KEY'] = 'integration-tests-cursor-signing-key'
 
 
 @pytest.fixture(scope='session', autouse=True)
@@ -0,0 +1,51 @@
+from datetime import datetime
+
+import boto3
+import pytest
+
+from product.crud.domain_logic.backfill_recency_buckets import backfill_recency_buckets
+from product.crud.integration.constants import RECENCY_BUCKET_ATTRIBUTE
+from product.crud.integration.dynamo_db_handler import DynamoDbHandler
+from product.models.products.product import ProductEntry
+from tests.crud_utils import clear_table, generate_product_id
+
+
+@pytest.fixture
+def product_ids(table_name: str):
+    # products written before the recency index existed, without a recency bucket
+    clear_table(table_name)
+    table = boto3.resource('dynamodb').Table(table_name)
+    product_ids = {generate_product_id() for _ in range(10)}
+    for product_id in product_ids:
+        entry = ProductEntry(id=product_id, price=1, name='test', created_at=int(datetime.utcnow().timestamp()))
+        table.put_item(Item=entry.model_dump())
+    yield product_ids
+    clear_table(table_name)
+
+
+def test_backfill_recency_buckets(table_name: str, product_ids: set[str]):
+    # GIVEN a product table with ten products that are not in the recency index
+
+    # WHEN backfilling the recency buckets
+    backfilled = backfill_recency_buckets(table_name, total_segments=2)
+
+    # THEN every product should get the recency bucket it would have been written with
+    assert backfilled == len(product_ids)
+    table = boto3.resource('dynamodb').Table(table_name)
+    for product_id in product_ids:
+        item = table.get_item(Key={'id': product_id}, ConsistentRead=True)['Item']
+        assert item[RECENCY_BUCKET_ATTRIBUTE] == DynamoDbHandler._get_recency_bucket(product_id)
+
+    # AND a second run should leave them as is
+    assert backfill_recency_buckets(table_name, total_segments=2) == 0
+
+
+def test_set_recency_bucket_skips_deleted_product(table_name: str):
+    # GIVEN a product that was deleted after the backfill scan read it
+    product_id = generate_product_id()
+    db_handler = DynamoDbHandler(table_name)
+
+    # WHEN setting its recency bucket
+    # THEN it should not be written back
+    assert not db_handler.set_recency_bucket(product_id)
+    assert 'Item' not in boto3.resource('dynamodb').Table(table_name).get_item(Key={'id': product_id}, ConsistentRead=True)
@@ -0,0 +1,103 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPMethod, HTTPStatus
+from typing import cast
+
+import pytest
+from botocore.stub import Stubber
+
+from product.crud.handlers.constants import PRODUCTS_BATCH_GET_PATH
+from product.crud.handlers.handle_batch_get_products import lambda_handler
+from product.crud.integration import get_db_handler
+from product.crud.integration.constants import BATCH_GET_MAX_KEYS
+from product.crud.integration.dynamo_db_handler import DynamoDbHandler
+from product.crud.models.output import BatchGetProductsOutput
+from product.crud.models.product import Product
+from tests.crud_utils import generate_product_api_gw_event, generate_product_id
+from tests.utils import generate_context
+
+
+def generate_batch_get_event(body: dict) -> dict:
+    return generate_product_api_gw_event(product_id='', http_method=HTTPMethod.POST, body=body, path=PRODUCTS_BATCH_GET_PATH)
+
+
+def test_handler_200_ok(add_product_entry_to_db: Product):
+    # GIVEN a product entry in the database and a product id that does not exist
+    missing_id = generate_product_id()
+    event = generate_batch_get_event({'ids': [add_product_entry_to_db.id, missing_id]})
+
+    # WHEN requesting both products in a single batch
+    response = lambda_handler(event, generate_context())
+
+    # THEN the response should return OK (HTTP 200) with the found product and the missing id
+    assert response['statusCode'] == HTTPStatus.OK
+    response_entry = BatchGetProductsOutput.model_validate_json(response['body'])
+    assert len(response_entry.products) == 1
+    assert response_entry.products[0].model_dump() == add_product_entry_to_db.model_dump()
+    assert response_entry.missing_ids == [missing_id]
+
+
+def test_handler_duplicate_ids(add_product_entry_to_db: Product):
+    # GIVEN a batch request that asks for the same product twice
+    event = generate_batch_get_event({'ids': [add_product_entry_to_db.id, add_product_entry_to_db.id]})
+
+    # WHEN requesting the batch
+    response = lambda_handler(event, generate_context())
+
+    # THEN the product should be returned once
+    assert response['statusCode'] == HTTPStatus.OK
+    response_entry = BatchGetProductsOutput.model_validate_json(response['body'])
+    assert len(response_entry.products) == 1
+    assert not response_entry.missing_ids
+
+
+def test_internal_server_error(table_name: str):
+    # GIVEN a DynamoDB exception scenario
+    db_handler: DynamoDbHandler = DynamoDbHandler(table_name)
+    table = db_handler._get_table(table_name)
+
+    with Stubber(table.meta.client) as stubber:
+        # WHEN attempting to get products while the DynamoDB exception is triggered
+        stubber.add_client_error(method='batch_get_item', service_error_code='ValidationException')
+        event = generate_batch_get_event({'ids': [generate_product_id()]})
+        response = lambda_handler(event, generate_context())
+
+    # THEN the response should indicate an internal server error (HTTP 500 Internal Server Error)
+    assert response['statusCode'] == HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+def test_handler_bad_request_invalid_product_id():
+    # GIVEN a batch request with an invalid product id
+    event = generate_batch_get_event({'ids': [generate_product_id(), 'aaaaaa']})
+
+    # WHEN requesting the batch
+    response = lambda_handler(event, generate_context())
+
+    # THEN the response should indicate bad request due to invalid input (HTTP 400 Bad Request)
+    assert response['statusCode'] == HTTPStatus.BAD_REQUEST
+    body_dict = json.loads(response['body'])
+    assert body_dict['error'] == 'invalid input'
+
+
+def test_handler_reads_chunks_of_large_batch(monkeypatch: pytest.MonkeyPatch, table_name: str):
+    # GIVEN a batch larger than a single BatchGetItem request
+    db_handler = cast(DynamoDbHandler, get_db_handler(table_name))  # the handler the route uses
+    table = db_handler._get_table(table_name)
+    monkeypatch.setattr(db_handler, '_get_thread_table', lambda: table)
+    monkeypatch.setattr(db_handler, '_batch_get_executor', ThreadPoolExecutor(max_workers=1))  # chunks are read in order
+    product_ids = [generate_product_id() for _ in range(BATCH_GET_MAX_KEYS + 1)]
+    found = {'id': {'S': product_ids[-1]}, 'name': {'S': 'test'}, 'price': {'N': '1'}, 'created_at': {'N': '1'}}
+
+    with Stubber(table.meta.client) as stubber:
+        stubber.add_response(method='batch_get_item', service_response={'Responses': {table_name: []}})
+        stubber.add_response(method='batch_get_item', service_response={'Responses': {table_name: [found]}})
+
+        # WHEN requesting the batch
+        response = lambda_handler(generate_batch_get_event({'ids': product_ids}), generate_context())
+
+        # THEN one BatchGetItem request should be sent per chunk and their results merged in request order
+        stubber.assert_no_pending_responses()
+    assert response['statusCode'] == HTTPStatus.OK
+    response_entry = BatchGetProductsOutput.model_validate_json(response['body'])
+    assert [product.id for product in response_entry.products] == [product_ids[-1]]
+    assert response_entry.missing_ids == product_ids[:-1]
@@ -0,0 +1,94 @@
+import json
+from http import HTTPMethod, HTTPStatus
+from typing import cast
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+from product.crud.handlers.constants import PRODUCTS_BATCH_WRITE_PATH
+from product.crud.handlers.handle_batch_write_products import lambda_handler
+from product.crud.integration import get_db_handler
+from product.crud.integration.dynamo_db_handler import DynamoDbHandler
+from product.crud.models.output import BatchWriteProductsOutput
+from product.crud.models.product import Product
+from tests.crud_utils import generate_product_api_gw_event, generate_product_id
+from tests.utils import generate_context
+
+
+def generate_batch_write_event(body: dict) -> dict:
+    return generate_product_api_gw_event(product_id='', http_method=HTTPMethod.POST, body=body, path=PRODUCTS_BATCH_WRITE_PATH)
+
+
+def test_handler_200_ok(table_name: str, add_product_entry_to_db: Product):
+    # GIVEN a product entry in the database and a new product to create
+    new_product = {'id': generate_product_id(), 'name': 'test', 'price': 5}
+    event = generate_batch_write_event({'puts': [new_product], 'deletes': [add_product_entry_to_db.id]})
+
+    # WHEN creating the new product and deleting the existing one in a single batch
+    response = lambda_handler(event, generate_context())
+
+    # THEN the response should return OK (HTTP 200) with a successful result per product
+    assert response['statusCode'] == HTTPStatus.OK
+    response_entry = BatchWriteProductsOutput.model_validate_json(response['body'])
+    assert response_entry.succeeded == 2
+    assert response_entry.failed == 0
+    assert {(result.id, result.operation, result.status) for result in response_entry.results} == {
+        (new_product['id'], 'UPSERT', 'SUCCEEDED'),
+        (add_product_entry_to_db.id, 'DELETE', 'SUCCEEDED'),
+    }
+
+    # AND the database should hold the new product and not the deleted one
+    table = boto3.resource('dynamodb').Table(table_name)
+    assert table.get_item(Key={'id': new_product['id']})['Item']['name'] == new_product['name']
+    assert 'Item' not in table.get_item(Key={'id': add_product_entry_to_db.id})
+
+
+def test_handler_upserts_existing_product(table_name: str, add_product_entry_to_db: Product):
+    # GIVEN a product entry in the database
+    product_id = add_product_entry_to_db.id
+    event = generate_batch_write_event({'puts': [{'id': product_id, 'name': 'replaced', 'price': 7}]})
+
+    # WHEN putting a product with the same id in a batch
+    response = lambda_handler(event, generate_context())
+
+    # THEN the put should succeed as an upsert, replacing the existing product
+    assert response['statusCode'] == HTTPStatus.OK
+    response_entry = BatchWriteProductsOutput.model_validate_json(response['body'])
+    assert response_entry.results[0].model_dump() == {'id': product_id, 'operation': 'UPSERT', 'status': 'SUCCEEDED'}
+    item = boto3.resource('dynamodb').Table(table_name).get_item(Key={'id': product_id}, ConsistentRead=True)['Item']
+    assert (item['name'], item['price']) == ('replaced', 7)
+
+
+def test_handler_chunk_failure(monkeypatch: pytest.MonkeyPatch, table_name: str):
+    # GIVEN a DynamoDB exception scenario on the batch write worker table
+    db_handler = cast(DynamoDbHandler, get_db_handler(table_name))  # the handler the route uses
+    table = db_handler._get_table(table_name)
+    monkeypatch.setattr(db_handler, '_get_thread_table', lambda: table)
+    product_id = generate_product_id()
+
+    with Stubber(table.meta.client) as stubber:
+        # WHEN attempting to delete a product while the DynamoDB exception is triggered
+        stubber.add_client_error(method='batch_write_item', service_error_code='ValidationException')
+        event = generate_batch_write_event({'deletes': [product_id]})
+        response = lambda_handler(event, generate_context())
+
+    # THEN the response should return OK (HTTP 200) and report the product write as failed
+    assert response['statusCode'] == HTTPStatus.OK
+    response_entry = BatchWriteProductsOutput.model_validate_json(response['body'])
+    assert response_entry.failed == 1
+    assert response_entry.results[0].model_dump() == {'id': product_id, 'operation': 'DELETE', 'status': 'FAILED'}
+
+
+def test_handler_bad_request_duplicate_product_id():
+    # GIVEN a batch request that writes the same product twice
+    product_id = generate_product_id()
+    event = generate_batch_write_event({'puts': [{'id': product_id, 'name': 'test', 'price': 5}], 'deletes': [product_id]})
+
+    # WHEN requesting the batch
+    response = lambda_handler(event, generate_context())
+
+    # THEN the response should indicate bad request due to invalid input (HTTP 400 Bad Request)
+    assert response['statusCode'] == HTTPStatus.BAD_REQUEST
+    body_dict = json.loads(response['body'])
+    assert body_dict['error'] == 'invalid input'
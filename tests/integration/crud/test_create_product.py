@@ -3,9 +3,11 @@ from datetime import datetime
 from http import HTTPMethod, HTTPStatus
 
 import boto3
+import pytest
 from botocore.stub import Stubber
 
 from product.crud.integration.dynamo_db_handler import DynamoDbHandler
+from product.crud.models.exceptions import ProductAlreadyExistsException
 from product.crud.models.product import Product
 from tests.crud_utils import generate_create_product_request_body, generate_product_api_gw_event, generate_product_id
 from tests.utils import generate_context
@@ -67,6 +69,30 @@ def test_handler_bad_request_product_already_exists(add_product_entry_to_db: Pro
     assert body_dict['error'] == 'product already exists'
 
 
+def test_single_write_create_retry_succeeds(add_product_entry_to_db: Product, table_name: str):
+    from product.crud.domain_logic.create_product import create_product_single_write
+
+    # GIVEN a product that already exists in the database
+
+    # WHEN creating it again with the same attributes in single write mode
+    response = create_product_single_write(product=add_product_entry_to_db, table_name=table_name)
+
+    # THEN the create should succeed as a retry of the original create
+    assert response.id == add_product_entry_to_db.id
+
+
+def test_single_write_create_conflict(add_product_entry_to_db: Product, table_name: str):
+    from product.crud.domain_logic.create_product import create_product_single_write
+
+    # GIVEN a product that already exists in the database
+    conflicting_product = add_product_entry_to_db.model_copy(update={'price': add_product_entry_to_db.price + 1})
+
+    # WHEN creating a product with the same ID but other attributes in single write mode
+    # THEN the create should fail, the product already exists
+    with pytest.raises(ProductAlreadyExistsException):
+        create_product_single_write(product=conflicting_product, table_name=table_name)
+
+
 def test_internal_server_error(table_name: str):
     # GIVEN a DynamoDB exception scenario
     db_handler: DynamoDbHandler = DynamoDbHandler(table_name)
@@ -1,8 +1,11 @@
 import json
 from http import HTTPMethod, HTTPStatus
 
+import pytest
 from botocore.stub import Stubber
 
+from product.crud.handlers import handle_get_product
+from product.crud.handlers.constants import CONSISTENT_READ_HEADER
 from product.crud.handlers.handle_delete_product import lambda_handler
 from product.crud.integration.dynamo_db_handler import DynamoDbHandler
 from product.crud.models.product import Product
@@ -22,6 +25,24 @@ def test_handler_204_success_delete(add_product_entry_to_db: Product):
     assert response['statusCode'] == HTTPStatus.NO_CONTENT
 
 
+def test_handler_delete_drops_cached_product(add_product_entry_to_db: Product, monkeypatch: pytest.MonkeyPatch):
+    # GIVEN a product cached by an eventually consistent read, with a product cache size other than the default
+    monkeypatch.setenv('PRODUCT_CACHE_MAX_SIZE', '5')
+    product_id = add_product_entry_to_db.id
+    get_event = generate_product_api_gw_event(
+        http_method=HTTPMethod.GET, product_id=product_id, path_params={'product': product_id}, headers={CONSISTENT_READ_HEADER: 'false'}
+    )
+    assert handle_get_product.lambda_handler(get_event, generate_context())['statusCode'] == HTTPStatus.OK
+
+    # WHEN deleting the product and reading it again
+    event = generate_product_api_gw_event(http_method=HTTPMethod.DELETE, product_id=product_id, path_params={'product': product_id})
+    lambda_handler(event, generate_context())
+    response = handle_get_product.lambda_handler(get_event, generate_context())
+
+    # THEN the delete should have dropped the product from the cache the reads use (HTTP 404 Not Found)
+    assert response['statusCode'] == HTTPStatus.NOT_FOUND
+
+
 def test_internal_server_error(table_name):
     # GIVEN a DynamoDB exception scenario
     db_handler: DynamoDbHandler = DynamoDbHandler(table_name)
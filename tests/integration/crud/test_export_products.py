@@ -0,0 +1,94 @@
+import json
+from datetime import datetime
+from http import HTTPStatus
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+from product.crud.domain_logic.export_products import export_products
+from product.crud.domain_logic.pagination import encode_next_token
+from product.crud.handlers.constants import EXPORT_NEXT_TOKEN_HEADER, NDJSON_CONTENT_TYPE
+from product.crud.handlers.handle_export_products import lambda_handler
+from product.crud.integration.dynamo_db_handler import DynamoDbHandler
+from product.crud.models.exceptions import InternalServerException, InvalidPaginationTokenException
+from product.models.products.product import ProductEntry
+from tests.crud_utils import clear_table, generate_api_gw_list_products_event, generate_product_id
+from tests.utils import generate_context
+
+EXPORT_PATH = '/api/products/export'
+CURSOR_SIGNING_KEY = 'integration-tests-cursor-signing-key'
+
+
+@pytest.fixture
+def product_ids(table_name: str):
+    clear_table(table_name)
+    table = boto3.resource('dynamodb').Table(table_name)
+    product_ids = {generate_product_id() for _ in range(10)}
+    for product_id in product_ids:
+        entry = ProductEntry(id=product_id, price=1, name='test', created_at=int(datetime.utcnow().timestamp()))
+        table.put_item(Item=entry.model_dump())
+    yield product_ids
+    clear_table(table_name)
+
+
+def test_handler_200_ok(product_ids: set[str]):
+    # GIVEN a product table with ten products and an export request selecting product names
+    event = generate_api_gw_list_products_event(path=EXPORT_PATH, query_params={'fields': 'name'})
+
+    # WHEN exporting the catalog
+    response = lambda_handler(event, generate_context())
+
+    # THEN the whole catalog should be returned in a single chunk, one product per line
+    assert response['statusCode'] == HTTPStatus.OK
+    assert response['multiValueHeaders']['Content-Type'] == [NDJSON_CONTENT_TYPE]
+    assert EXPORT_NEXT_TOKEN_HEADER not in response['multiValueHeaders']
+    lines = [json.loads(line) for line in response['body'].splitlines()]
+    assert {line['id'] for line in lines} == product_ids
+    assert all(line == {'id': line['id'], 'name': 'test'} for line in lines)
+
+
+def test_export_in_chunks(table_name: str, product_ids: set[str]):
+    # GIVEN a product table with ten products, and chunks that only fit a few of them
+    exported: list[str] = []
+    next_token = None
+
+    # WHEN exporting the catalog chunk by chunk
+    for _ in range(len(product_ids)):
+        chunk = export_products(table_name=table_name, cursor_signing_key=CURSOR_SIGNING_KEY, max_bytes=300, next_token=next_token)
+        exported.extend(json.loads(line)['id'] for line in chunk.products.splitlines())
+        next_token = chunk.next_token
+        if next_token is None:
+            break
+
+    # THEN every product should be exported exactly once, over several chunks
+    assert sorted(exported) == sorted(product_ids)
+    assert len(exported) == len(product_ids)
+
+
+def test_handler_bad_request_invalid_token():
+    # GIVEN an export request with a forged token, and a list request token issued for the recency order
+    forged_event = generate_api_gw_list_products_event(path=EXPORT_PATH, query_params={'next_token': 'forged.token'})
+    recency_token = encode_next_token({'buckets': {}}, CURSOR_SIGNING_KEY)
+
+    # WHEN exporting the catalog
+    response = lambda_handler(forged_event, generate_context())
+
+    # THEN the request should be rejected
+    assert response['statusCode'] == HTTPStatus.BAD_REQUEST
+    with pytest.raises(InvalidPaginationTokenException):
+        export_products(table_name='products', cursor_signing_key=CURSOR_SIGNING_KEY, max_bytes=300, next_token=recency_token)
+
+
+def test_iter_products_internal_server_error(table_name: str):
+    # GIVEN a DynamoDB exception scenario
+    db_handler: DynamoDbHandler = DynamoDbHandler(table_name)
+    table = db_handler._get_table(table_name)
+
+    with Stubber(table.meta.client) as stubber:
+        stubber.add_client_error(method='scan', service_error_code='ValidationException')
+
+        # WHEN iterating over the catalog
+        # THEN an internal server error should be raised
+        with pytest.raises(InternalServerException):
+            list(db_handler.iter_products())
@@ -3,6 +3,7 @@ from http import HTTPMethod, HTTPStatus
 
 from botocore.stub import Stubber
 
+from product.crud.handlers.constants import CONSISTENT_READ_HEADER
 from product.crud.handlers.handle_get_product import lambda_handler
 from product.crud.integration.dynamo_db_handler import DynamoDbHandler
 from product.crud.models.output import GetProductOutput
@@ -25,6 +26,96 @@ def test_handler_200_ok(add_product_entry_to_db: Product):
     assert response_entry.model_dump() == add_product_entry_to_db.model_dump()
 
 
+def test_handler_200_ok_sparse_fieldset(add_product_entry_to_db: Product):
+    # GIVEN a product entry in the database and a request that only selects its name
+    product_id = add_product_entry_to_db.id
+    event = generate_product_api_gw_event(http_method=HTTPMethod.GET, product_id=product_id, path_params={'product': product_id})
+    event['queryStringParameters'] = {'fields': 'name'}
+
+    # WHEN requesting the product details
+    response = lambda_handler(event, generate_context())
+
+    # THEN the response should return OK (HTTP 200) with the product id and name only
+    assert response['statusCode'] == HTTPStatus.OK
+    assert json.loads(response['body']) == {'id': product_id, 'name': add_product_entry_to_db.name}
+
+
+def test_handler_served_from_cache(table_name: str, add_product_entry_to_db: Product):
+    # GIVEN a product that was already read by this container with an eventually consistent read
+    product_id = add_product_entry_to_db.id
+    event = generate_product_api_gw_event(
+        http_method=HTTPMethod.GET, product_id=product_id, path_params={'product': product_id}, headers={CONSISTENT_READ_HEADER: 'false'}
+    )
+    lambda_handler(event, generate_context())
+    db_handler: DynamoDbHandler = DynamoDbHandler(table_name)
+    table = db_handler._get_table(table_name)
+
+    with Stubber(table.meta.client) as stubber:
+        # WHEN requesting the product again while DynamoDB would fail
+        stubber.add_client_error(method='get_item', service_error_code='ValidationException')
+        response = lambda_handler(event, generate_context())
+
+    # THEN the product should be served from the cache (HTTP 200)
+    assert response['statusCode'] == HTTPStatus.OK
+    assert GetProductOutput.model_validate_json(response['body']).model_dump() == add_product_entry_to_db.model_dump()
+
+
+def test_handler_consistent_read_bypasses_cache(table_name: str, add_product_entry_to_db: Product):
+    # GIVEN a product that is cached in this container
+    product_id = add_product_entry_to_db.id
+    headers = {CONSISTENT_READ_HEADER: 'false'}
+    event = generate_product_api_gw_event(http_method=HTTPMethod.GET, product_id=product_id, path_params={'product': product_id}, headers=headers)
+    lambda_handler(event, generate_context())
+    db_handler: DynamoDbHandler = DynamoDbHandler(table_name)
+    table = db_handler._get_table(table_name)
+
+    with Stubber(table.meta.client) as stubber:
+        # WHEN requesting the product with a strongly consistent read while DynamoDB fails
+        stubber.add_client_error(method='get_item', service_error_code='ValidationException')
+        event['headers'][CONSISTENT_READ_HEADER] = 'true'
+        response = lambda_handler(event, generate_context())
+
+    # THEN the product should be read from the table and not from the cache
+    assert response['statusCode'] == HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+def test_handler_not_modified(table_name: str):
+    # GIVEN a product written at a known time, and a client holding its ETag
+    product_id = generate_product_id()
+    item = {'id': {'S': product_id}, 'name': {'S': 'test'}, 'price': {'N': '1'}, 'created_at': {'N': '1'}, 'updated_at': {'N': '1700000000000'}}
+    event = generate_product_api_gw_event(
+        http_method=HTTPMethod.GET, product_id=product_id, path_params={'product': product_id}, headers={CONSISTENT_READ_HEADER: 'true'}
+    )
+    table = DynamoDbHandler(table_name)._get_table(table_name)
+
+    with Stubber(table.meta.client) as stubber:
+        stubber.add_response(method='get_item', service_response={'Item': dict(item)})
+        etag = lambda_handler(event, generate_context())['multiValueHeaders']['ETag'][0]
+
+        # WHEN requesting the product again while it wasn't written since
+        stubber.add_response(method='get_item', service_response={'Item': dict(item)})
+        event['headers']['If-None-Match'] = etag
+        response = lambda_handler(event, generate_context())
+
+    # THEN a 304 without a body should be returned
+    assert response['statusCode'] == HTTPStatus.NOT_MODIFIED
+    assert not response['body']
+
+
+def test_handler_bad_request_invalid_consistent_read_header():
+    # GIVEN a request with an invalid read consistency header
+    product_id = generate_product_id()
+    headers = {CONSISTENT_READ_HEADER: 'sometimes'}
+    event = generate_product_api_gw_event(http_method=HTTPMethod.GET, product_id=product_id, path_params={'product': product_id}, headers=headers)
+
+    # WHEN requesting the product details
+    response = lambda_handler(event, generate_context())
+
+    # THEN the response should indicate bad request due to invalid input (HTTP 400 Bad Request)
+    assert response['statusCode'] == HTTPStatus.BAD_REQUEST
+    assert json.loads(response['body'])['error'] == 'invalid input'
+
+
 def test_internal_server_error(table_name):
     # GIVEN a DynamoDB exception scenario
     db_handler: DynamoDbHandler = DynamoDbHandler(table_name)
@@ -0,0 +1,94 @@
+import os
+from http import HTTPMethod, HTTPStatus
+
+from botocore.stub import Stubber
+
+from product.crud.handlers.constants import PRODUCTS_STATS_PATH
+from product.crud.handlers.handle_get_products_stats import lambda_handler
+from product.crud.handlers.utils.conditional_get import get_etag
+from product.crud.integration.dynamo_db_handler import DynamoDbHandler
+from product.crud.models.output import ProductsStatsOutput
+from tests.crud_utils import generate_product_api_gw_event
+from tests.utils import generate_context
+
+
+def generate_stats_event() -> dict:
+    return generate_product_api_gw_event(product_id='', http_method=HTTPMethod.GET, path=PRODUCTS_STATS_PATH)
+
+
+def test_handler_200_ok():
+    # GIVEN the catalog statistics maintained by the stream processor
+    event = generate_stats_event()
+
+    # WHEN getting the products statistics
+    response = lambda_handler(event, generate_context())
+
+    # THEN the response should return OK (HTTP 200) with statistics that are consistent with each other
+    assert response['statusCode'] == HTTPStatus.OK
+    stats = ProductsStatsOutput.model_validate_json(response['body'])
+    assert stats.product_count >= 0
+    assert (stats.price_average is None) == (stats.product_count == 0)
+
+
+def test_handler_stats_are_derived_from_counters(table_name: str):
+    # GIVEN a statistics item with three products, one of the prices it saw no longer has products
+    table = DynamoDbHandler(table_name)._get_table(os.environ['CATALOG_TABLE_NAME'])
+    item = {
+        'shard': {'N': '-1'},
+        'product_count': {'N': '3'},
+        'price_sum': {'N': '60'},
+        'price_counts': {'M': {'10': {'N': '1'}, '20': {'N': '0'}, '25': {'N': '2'}}},
+        'added_per_day': {'M': {'2024-05-01': {'N': '4'}}},
+        'removed_per_day': {'M': {'2024-05-01': {'N': '1'}}},
+        'version': {'N': '5'},
+    }
+
+    with Stubber(table.meta.client) as stubber:
+        stubber.add_response(method='get_item', service_response={'Item': {'version': {'N': '5'}}})
+        stubber.add_response(method='get_item', service_response={'Item': item})
+
+        # WHEN getting the products statistics
+        response = lambda_handler(generate_stats_event(), generate_context())
+
+    # THEN min, max and average prices should be derived from the counters, tagged with the statistics version
+    assert response['statusCode'] == HTTPStatus.OK
+    assert response['multiValueHeaders']['ETag'] == [get_etag(5)]
+    stats = ProductsStatsOutput.model_validate_json(response['body'])
+    assert stats.model_dump() == {
+        'product_count': 3,
+        'price_sum': 60,
+        'price_min': 10,
+        'price_max': 25,
+        'price_average': 20.0,
+        'added_per_day': {'2024-05-01': 4},
+        'removed_per_day': {'2024-05-01': 1},
+    }
+
+
+def test_handler_not_modified(table_name: str):
+    # GIVEN a client holding the statistics of the current catalog version
+    table = DynamoDbHandler(table_name)._get_table(os.environ['CATALOG_TABLE_NAME'])
+    event = generate_product_api_gw_event(product_id='', http_method=HTTPMethod.GET, path=PRODUCTS_STATS_PATH, headers={'If-None-Match': get_etag(5)})
+
+    with Stubber(table.meta.client) as stubber:
+        stubber.add_response(method='get_item', service_response={'Item': {'version': {'N': '5'}}})
+
+        # WHEN getting the products statistics again
+        response = lambda_handler(event, generate_context())
+
+        # THEN a 304 should be returned, after reading the catalog version only
+        assert response['statusCode'] == HTTPStatus.NOT_MODIFIED
+        stubber.assert_no_pending_responses()
+
+
+def test_internal_server_error(table_name: str):
+    # GIVEN a DynamoDB exception scenario
+    table = DynamoDbHandler(table_name)._get_table(os.environ['CATALOG_TABLE_NAME'])
+
+    with Stubber(table.meta.client) as stubber:
+        # WHEN getting the products statistics while the DynamoDB exception is triggered
+        stubber.add_client_error(method='get_item', service_error_code='ValidationException')
+        response = lambda_handler(generate_stats_event(), generate_context())
+
+    # THEN the response should indicate an internal server error (HTTP 500 Internal Server Error)
+    assert response['statusCode'] == HTTPStatus.INTERNAL_SERVER_ERROR
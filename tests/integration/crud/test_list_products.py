@@ -1,12 +1,25 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from http import HTTPStatus
+from typing import cast
 
+import boto3
+import pytest
 from botocore.stub import Stubber
 
+from product.crud.domain_logic.list_products import list_products
+from product.crud.handlers.constants import CONSISTENT_READ_HEADER
 from product.crud.handlers.handle_list_products import lambda_handler
+from product.crud.integration import get_db_handler
+from product.crud.integration.constants import CATALOG_MAX_SHARDS_PER_READ, RECENCY_BUCKETS
 from product.crud.integration.dynamo_db_handler import DynamoDbHandler
+from product.crud.models.exceptions import InvalidPaginationTokenException
 from product.crud.models.output import ListProductsOutput
 from product.crud.models.product import Product
-from tests.crud_utils import clear_table, generate_api_gw_list_products_event
+from product.models.products.catalog import CATALOG_SHARDS
+from product.models.products.product import ProductEntry
+from tests.crud_utils import clear_table, generate_api_gw_list_products_event, generate_product_id
 from tests.utils import generate_context
 
 
@@ -26,6 +39,42 @@ def test_handler_200_ok(add_product_entry_to_db: Product):
     assert products[0].model_dump() == add_product_entry_to_db.model_dump()
 
 
+def test_handler_200_ok_sparse_fieldset(add_product_entry_to_db: Product):
+    # GIVEN a product entry in the database and a request that only selects product names
+    event = generate_api_gw_list_products_event(query_params={'fields': 'id,name'})
+
+    # WHEN listing all products
+    response = lambda_handler(event, generate_context())
+
+    # THEN the response should return OK (HTTP 200) with the product ids and names only
+    assert response['statusCode'] == HTTPStatus.OK
+    assert json.loads(response['body'])['products'] == [{'id': add_product_entry_to_db.id, 'name': add_product_entry_to_db.name}]
+
+
+def test_handler_bad_request_invalid_fields():
+    # GIVEN a request that selects an unknown field
+    event = generate_api_gw_list_products_event(query_params={'fields': 'created_at'})
+
+    # WHEN listing all products
+    response = lambda_handler(event, generate_context())
+
+    # THEN the response should indicate bad request due to invalid input (HTTP 400 Bad Request)
+    assert response['statusCode'] == HTTPStatus.BAD_REQUEST
+
+
+def test_handler_eventually_consistent_read():
+    # GIVEN a list request that opts out of strongly consistent reads
+    event = generate_api_gw_list_products_event(headers={CONSISTENT_READ_HEADER: 'false'})
+
+    # WHEN listing all products with an eventually consistent read
+    response = lambda_handler(event, generate_context())
+
+    # THEN the response should return OK (HTTP 200)
+    # AND the product list may lag behind recent writes, so its content isn't asserted
+    assert response['statusCode'] == HTTPStatus.OK
+    ListProductsOutput.model_validate_json(response['body'])
+
+
 def test_handler_empty_list(table_name: str):
     # GIVEN an empty product table
     clear_table(table_name)
@@ -55,3 +104,194 @@ def test_internal_server_error(table_name):
 
     # THEN the response should indicate an internal server error (HTTP 500)
     assert response['statusCode'] == HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+def test_handler_pagination(table_name: str):
+    # GIVEN a product table with three products
+    clear_table(table_name)
+    table = boto3.resource('dynamodb').Table(table_name)
+    product_ids = {generate_product_id() for _ in range(3)}
+    for product_id in product_ids:
+        entry = ProductEntry(id=product_id, price=1, name='test', created_at=int(datetime.utcnow().timestamp()))
+        table.put_item(Item=entry.model_dump())
+
+    # WHEN listing the first page with a page size of two
+    response = lambda_handler(generate_api_gw_list_products_event(query_params={'limit': '2'}), generate_context())
+
+    # THEN the response should contain two products and a token for the next page
+    assert response['statusCode'] == HTTPStatus.OK
+    first_page = ListProductsOutput.model_validate_json(response['body'])
+    assert len(first_page.products) == 2
+    assert first_page.next_token
+
+    # AND listing the next page with that token returns the remaining product and no further token
+    event = generate_api_gw_list_products_event(query_params={'limit': '2', 'next_token': first_page.next_token})
+    response = lambda_handler(event, generate_context())
+    assert response['statusCode'] == HTTPStatus.OK
+    second_page = ListProductsOutput.model_validate_json(response['body'])
+    assert len(second_page.products) == 1
+    assert second_page.next_token is None
+    assert {product.id for product in first_page.products + second_page.products} == product_ids
+    clear_table(table_name)
+
+
+def test_handler_bad_request_invalid_next_token():
+    # GIVEN a pagination token that was not signed by the service
+    event = generate_api_gw_list_products_event(query_params={'next_token': 'eyJpZCI6ImEifQ.forged'})
+
+    # WHEN listing products
+    response = lambda_handler(event, generate_context())
+
+    # THEN the response should indicate bad request (HTTP 400 Bad Request)
+    assert response['statusCode'] == HTTPStatus.BAD_REQUEST
+    body_dict = json.loads(response['body'])
+    assert body_dict['error'] == 'invalid pagination token'
+
+
+def test_handler_bad_request_invalid_limit():
+    # GIVEN a page size above the maximum allowed
+    event = generate_api_gw_list_products_event(query_params={'limit': '1000'})
+
+    # WHEN listing products
+    response = lambda_handler(event, generate_context())
+
+    # THEN the response should indicate bad request due to invalid input (HTTP 400 Bad Request)
+    assert response['statusCode'] == HTTPStatus.BAD_REQUEST
+    body_dict = json.loads(response['body'])
+    assert body_dict['error'] == 'invalid input'
+
+
+def generate_recency_item(product_id: str, created_at: int, bucket: int) -> dict:
+    return {
+        'id': {'S': product_id},
+        'name': {'S': 'test'},
+        'price': {'N': '1'},
+        'created_at': {'N': str(created_at)},
+        'recency_bucket': {'N': str(bucket)},
+    }
+
+
+def test_handler_sort_newest(monkeypatch: pytest.MonkeyPatch, table_name: str):
+    # GIVEN a recency index with products spread over its buckets, each bucket is returned newest first
+    db_handler = cast(DynamoDbHandler, get_db_handler(table_name))  # the handler the route uses
+    table = db_handler._get_table(table_name)
+    monkeypatch.setattr(db_handler, '_get_thread_table', lambda: table)
+    monkeypatch.setattr(db_handler, '_scan_executor', ThreadPoolExecutor(max_workers=1))  # buckets are queried in order
+    product_ids = [generate_product_id() for _ in range(4)]
+    bucket_items = [
+        [generate_recency_item(product_ids[0], 4, 0), generate_recency_item(product_ids[2], 2, 0)],
+        [generate_recency_item(product_ids[1], 3, 1)],
+        [generate_recency_item(product_ids[3], 1, 2)],
+    ] + [[] for _ in range(RECENCY_BUCKETS - 3)]
+
+    with Stubber(table.meta.client) as stubber:
+        for items in bucket_items:
+            stubber.add_response(method='query', service_response={'Items': items})
+
+        # WHEN listing the newest two products
+        response = lambda_handler(generate_api_gw_list_products_event(query_params={'sort': 'newest', 'limit': '2'}), generate_context())
+
+        # THEN the newest products across all buckets should be returned with a token for the next page
+        assert response['statusCode'] == HTTPStatus.OK
+        first_page = ListProductsOutput.model_validate_json(response['body'])
+        assert [product.id for product in first_page.products] == product_ids[:2]
+        assert first_page.next_token
+
+        # AND the next page should only query the buckets that were not exhausted
+        stubber.add_response(method='query', service_response={'Items': [generate_recency_item(product_ids[2], 2, 0)]})
+        stubber.add_response(method='query', service_response={'Items': [generate_recency_item(product_ids[3], 1, 2)]})
+        event = generate_api_gw_list_products_event(query_params={'sort': 'newest', 'limit': '2', 'next_token': first_page.next_token})
+        response = lambda_handler(event, generate_context())
+        assert response['statusCode'] == HTTPStatus.OK
+        second_page = ListProductsOutput.model_validate_json(response['body'])
+        assert [product.id for product in second_page.products] == product_ids[2:]
+        assert second_page.next_token is None
+        stubber.assert_no_pending_responses()
+
+    # AND a recency token should be rejected when listing in table order
+    event = generate_api_gw_list_products_event(query_params={'limit': '2', 'next_token': first_page.next_token})
+    response = lambda_handler(event, generate_context())
+    assert response['statusCode'] == HTTPStatus.BAD_REQUEST
+    assert json.loads(response['body'])['error'] == 'invalid pagination token'
+
+
+def generate_catalog_shard(shard: int, product_ids: list[str], incomplete: bool = False) -> dict:
+    products = {
+        product_id: {'M': {'id': {'S': product_id}, 'name': {'S': 'test'}, 'price': {'N': '1'}, 'created_at': {'N': '1'}}}
+        for product_id in product_ids
+    }
+    shard_item = {'shard': {'N': str(shard)}, 'version': {'N': str(len(product_ids))}, 'products': {'M': products}}
+    return {**shard_item, 'incomplete': {'BOOL': True}} if incomplete else shard_item
+
+
+def generate_catalog_product_id(shard: int) -> str:
+    # snapshot items hold product id ranges, the first two hex digits of the id are its item
+    return f'{shard:02x}{generate_product_id()[2:]}'
+
+
+def add_catalog_shards_response(stubber: Stubber, shards: list[dict], first_shard: int, shard_count: int) -> None:
+    keys = [{'shard': shard} for shard in range(first_shard, first_shard + shard_count)]
+    stubber.add_response(
+        method='batch_get_item',
+        service_response={'Responses': {'catalog': shards}},
+        expected_params={'RequestItems': {'catalog': {'Keys': keys, 'ConsistentRead': False}}},
+    )
+
+
+def test_list_products_from_catalog_snapshot(table_name: str):
+    # GIVEN a catalog snapshot with products in its first three items
+    table = DynamoDbHandler(table_name)._get_table(table_name)
+    product_ids = [generate_catalog_product_id(shard) for shard in range(3)]
+    signing_key = 'integration-tests-cursor-signing-key'
+
+    with Stubber(table.meta.client) as stubber:
+        add_catalog_shards_response(stubber, [generate_catalog_shard(0, [product_ids[0]])], first_shard=0, shard_count=1)
+        shards = [generate_catalog_shard(1, [product_ids[1]]), generate_catalog_shard(2, [product_ids[2]])]
+        add_catalog_shards_response(stubber, shards, first_shard=1, shard_count=2)
+
+        # WHEN listing the first two products with an eventually consistent read
+        first_page = list_products(table_name, limit=2, cursor_signing_key=signing_key, consistent_read=False, catalog_table_name='catalog')
+
+        # THEN the products should be read from the first snapshot items only, in product id order, with a token for the next page
+        assert [product.id for product in first_page.products] == product_ids[:2]
+        assert first_page.next_token
+        stubber.assert_no_pending_responses()
+
+        # AND the next page should be read from the item of the cursor on, until the last item
+        add_catalog_shards_response(stubber, [generate_catalog_shard(1, [product_ids[1]])], first_shard=1, shard_count=1)
+        add_catalog_shards_response(stubber, [generate_catalog_shard(2, [product_ids[2]])], first_shard=2, shard_count=2)
+        first_shard, shard_count = 4, 4
+        while first_shard < CATALOG_SHARDS:
+            add_catalog_shards_response(stubber, [], first_shard=first_shard, shard_count=min(shard_count, CATALOG_SHARDS - first_shard))
+            first_shard, shard_count = first_shard + shard_count, min(shard_count * 2, CATALOG_MAX_SHARDS_PER_READ)
+        second_page = list_products(
+            table_name, limit=2, cursor_signing_key=signing_key, next_token=first_page.next_token, consistent_read=False, catalog_table_name='catalog'
+        )
+        assert [product.id for product in second_page.products] == product_ids[2:]
+        assert second_page.next_token is None
+        stubber.assert_no_pending_responses()
+
+    # AND a snapshot token should be rejected by a strongly consistent list, which scans the table
+    with pytest.raises(InvalidPaginationTokenException):
+        list_products(table_name, limit=2, cursor_signing_key=signing_key, next_token=first_page.next_token, catalog_table_name='catalog')
+
+
+def test_list_products_from_incomplete_catalog_snapshot(table_name: str):
+    # GIVEN a catalog snapshot whose first item ran out of space
+    table = DynamoDbHandler(table_name)._get_table(table_name)
+    product_id = generate_catalog_product_id(0)
+    signing_key = 'integration-tests-cursor-signing-key'
+
+    with Stubber(table.meta.client) as stubber:
+        add_catalog_shards_response(stubber, [generate_catalog_shard(0, [], incomplete=True)], first_shard=0, shard_count=1)
+        stubber.add_response(
+            method='scan',
+            service_response={'Items': [{'id': {'S': product_id}, 'name': {'S': 'test'}, 'price': {'N': '1'}, 'created_at': {'N': '1'}}]},
+        )
+
+        # WHEN listing products with an eventually consistent read
+        page = list_products(table_name, limit=2, cursor_signing_key=signing_key, consistent_read=False, catalog_table_name='catalog')
+
+        # THEN the products should be listed from the table instead
+        assert [product.id for product in page.products] == [product_id]
+        stubber.assert_no_pending_responses()
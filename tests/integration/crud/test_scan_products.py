@@ -0,0 +1,61 @@
+from datetime import datetime
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+from product.crud.integration import get_db_handler
+from product.crud.integration.dynamo_db_handler import DynamoDbHandler
+from product.crud.models.exceptions import InternalServerException
+from product.models.products.product import ProductEntry
+from tests.crud_utils import clear_table, generate_product_id
+
+
+@pytest.fixture
+def product_ids(table_name: str):
+    clear_table(table_name)
+    table = boto3.resource('dynamodb').Table(table_name)
+    product_ids = {generate_product_id() for _ in range(10)}
+    for product_id in product_ids:
+        entry = ProductEntry(id=product_id, price=1, name='test', created_at=int(datetime.utcnow().timestamp()))
+        table.put_item(Item=entry.model_dump())
+    yield product_ids
+    clear_table(table_name)
+
+
+def test_scan_products_with_segments(table_name: str, product_ids: set[str]):
+    # GIVEN a product table with ten products
+    db_handler = get_db_handler(table_name)
+
+    # WHEN scanning the whole catalog with four parallel segments
+    products = list(db_handler.scan_products(total_segments=4))
+
+    # THEN every product should be returned exactly once
+    assert len(products) == len(product_ids)
+    assert {product.id for product in products} == product_ids
+
+
+@pytest.mark.parametrize('total_segments', [0, -1])
+def test_scan_products_rejects_invalid_segments(table_name: str, total_segments: int):
+    # GIVEN a product table
+    db_handler = get_db_handler(table_name)
+
+    # WHEN scanning it without a positive number of segments
+    # THEN the scan should be rejected instead of returning no products
+    with pytest.raises(ValueError):
+        list(db_handler.scan_products(total_segments=total_segments))
+
+
+def test_scan_products_internal_server_error(monkeypatch: pytest.MonkeyPatch, table_name: str):
+    # GIVEN a DynamoDB exception scenario on the scan worker table
+    db_handler: DynamoDbHandler = DynamoDbHandler(table_name)
+    table = db_handler._get_table(table_name)
+    monkeypatch.setattr(db_handler, '_get_thread_table', lambda: table)
+
+    with Stubber(table.meta.client) as stubber:
+        stubber.add_client_error(method='scan', service_error_code='ValidationException')
+
+        # WHEN scanning the whole catalog
+        # THEN an internal server error should be raised
+        with pytest.raises(InternalServerException):
+            list(db_handler.scan_products(total_segments=1))
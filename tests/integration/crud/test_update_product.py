@@ -0,0 +1,78 @@
+import json
+from http import HTTPMethod, HTTPStatus
+
+from botocore.stub import Stubber
+
+from product.crud.handlers.handle_update_product import lambda_handler
+from product.crud.integration.dynamo_db_handler import DynamoDbHandler
+from product.crud.models.product import Product
+from tests.crud_utils import generate_product_api_gw_event, generate_product_id
+from tests.utils import generate_context
+
+
+def test_handler_200_update_price(add_product_entry_to_db: Product, table_name: str):
+    # GIVEN a product entry in the database
+    product_id = add_product_entry_to_db.id
+    new_price = add_product_entry_to_db.price + 1
+
+    # WHEN requesting to change only the product price
+    event = generate_product_api_gw_event(
+        http_method=HTTPMethod.PATCH, product_id=product_id, path_params={'product': product_id}, body={'price': new_price}
+    )
+    response = lambda_handler(event, generate_context())
+
+    # THEN the response should hold the whole updated product (HTTP 200 OK)
+    assert response['statusCode'] == HTTPStatus.OK
+    body_dict = json.loads(response['body'])
+    assert body_dict == {'id': product_id, 'name': add_product_entry_to_db.name, 'price': new_price}
+
+    # AND the product should be updated in place in the table, keeping its creation time
+    item = DynamoDbHandler(table_name)._get_table(table_name).get_item(Key={'id': product_id})['Item']
+    assert item['price'] == new_price
+    assert 'created_at' in item
+
+
+def test_handler_404_product_not_found():
+    # GIVEN a product ID that does not exist in the database
+    product_id = generate_product_id()
+
+    # WHEN requesting to update the product
+    event = generate_product_api_gw_event(
+        http_method=HTTPMethod.PATCH, product_id=product_id, path_params={'product': product_id}, body={'name': 'new name'}
+    )
+    response = lambda_handler(event, generate_context())
+
+    # THEN the response should indicate the product was not found (HTTP 404), no product should be created
+    assert response['statusCode'] == HTTPStatus.NOT_FOUND
+    assert json.loads(response['body']) == {'error': 'product was not found'}
+
+
+def test_internal_server_error(table_name):
+    # GIVEN a DynamoDB exception scenario
+    db_handler: DynamoDbHandler = DynamoDbHandler(table_name)
+    table = db_handler._get_table(table_name)
+    product_id = generate_product_id()
+
+    with Stubber(table.meta.client) as stubber:
+        # WHEN attempting to update a product while the DynamoDB exception is triggered
+        stubber.add_client_error(method='update_item', service_error_code='ValidationException')
+        event = generate_product_api_gw_event(
+            http_method=HTTPMethod.PATCH, product_id=product_id, path_params={'product': product_id}, body={'price': 5}
+        )
+        response = lambda_handler(event, generate_context())
+
+    # THEN the response should indicate an internal server error (HTTP 500 Internal Server Error)
+    assert response['statusCode'] == HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+def test_handler_bad_request_empty_update():
+    # GIVEN an update request without any product attribute
+    product_id = generate_product_id()
+
+    # WHEN the lambda handler processes the request
+    event = generate_product_api_gw_event(http_method=HTTPMethod.PATCH, product_id=product_id, path_params={'product': product_id}, body={})
+    response = lambda_handler(event, generate_context())
+
+    # THEN the response should indicate bad request due to invalid input (HTTP 400 Bad Request)
+    assert response['statusCode'] == HTTPStatus.BAD_REQUEST
+    assert json.loads(response['body']) == {'error': 'invalid input'}
@@ -0,0 +1,48 @@
+import base64
+from http import HTTPMethod
+
+import pytest
+from pydantic import ValidationError
+
+from product.crud.models.input import CreateProductInput, DeleteProductRequest
+from tests.crud_utils import generate_product_api_gw_event
+
+
+def test_only_the_route_parts_of_the_event_are_kept(product_id: str):
+    # GIVEN a full API Gateway proxy event of a create product request
+    event = generate_product_api_gw_event(product_id, HTTPMethod.PUT, body={'name': 'test', 'price': 1}, path_params={'product': product_id})
+
+    # WHEN validating it
+    create_input = CreateProductInput.model_validate(event)
+
+    # THEN only the path parameters and the body should be validated and kept, not the rest of the envelope
+    assert create_input.model_dump() == {'pathParameters': {'product': product_id}, 'body': {'name': 'test', 'price': 1}}
+
+
+@pytest.mark.parametrize('path_params', [None, {'product': 'aa'}])
+def test_invalid_route_parts_fail_validation(product_id: str, path_params):
+    # GIVEN API Gateway proxy events without a valid product path parameter
+    event = generate_product_api_gw_event(product_id, HTTPMethod.DELETE, path_params=path_params)
+
+    # WHEN validating them
+    # THEN a validation error should be raised, the resolver answers it with a 400
+    with pytest.raises(ValidationError):
+        DeleteProductRequest.model_validate(event)
+
+
+def test_base64_encoded_body_is_decoded(product_id: str):
+    # GIVEN an API Gateway proxy event with a base64 encoded body, as sent for binary media types
+    event = generate_product_api_gw_event(product_id, HTTPMethod.PUT, body={'name': 'test', 'price': 1}, path_params={'product': product_id})
+    event['body'] = base64.b64encode(event['body'].encode('utf-8')).decode('ascii')
+    event['isBase64Encoded'] = True
+
+    # WHEN validating it
+    create_input = CreateProductInput.model_validate(event)
+
+    # THEN the body should be decoded before it is validated
+    assert create_input.body.model_dump() == {'name': 'test', 'price': 1}
+
+    # AND a body that isn't base64 should fail validation
+    event['body'] = '{"name": "test", "price": 1}'
+    with pytest.raises(ValidationError):
+        CreateProductInput.model_validate(event)
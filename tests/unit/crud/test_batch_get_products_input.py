@@ -0,0 +1,26 @@
+import pytest
+from aws_lambda_powertools.utilities.parser import ValidationError
+
+from product.crud.models.input import BatchGetProductsBody
+from tests.crud_utils import generate_product_id
+
+
+@pytest.mark.parametrize(
+    'invalid_input',
+    [
+        {'ids': []},  # no ids
+        {'ids': ['aa']},  # invalid product id
+        {'ids': [generate_product_id() for _ in range(501)]},  # too many ids
+        {},  # missing ids
+    ],
+)
+def test_invalid_input(invalid_input):
+    with pytest.raises(ValidationError):
+        BatchGetProductsBody.model_validate(invalid_input)
+
+
+def test_valid_input(product_id):
+    # GIVEN a list of valid product ids
+    # WHEN creating a batch get input
+    # THEN no error should be raised and the instance should be created successfully
+    BatchGetProductsBody(ids=[product_id])
@@ -0,0 +1,31 @@
+import pytest
+from aws_lambda_powertools.utilities.parser import ValidationError
+
+from product.crud.models.input import BatchWriteProductsBody
+from tests.crud_utils import generate_product_id
+
+PRODUCT_ID = generate_product_id()
+
+
+@pytest.mark.parametrize(
+    'invalid_input',
+    [
+        {},  # no operations
+        {'puts': [], 'deletes': []},  # no operations
+        {'deletes': ['aa']},  # invalid product id
+        {'puts': [{'id': PRODUCT_ID, 'name': 'aaa', 'price': -1}]},  # invalid price
+        {'puts': [{'id': PRODUCT_ID, 'name': 'aaa', 'price': 5}], 'deletes': [PRODUCT_ID]},  # same product twice
+        {'deletes': [PRODUCT_ID, PRODUCT_ID]},  # same product twice
+        {'deletes': [generate_product_id() for _ in range(1001)]},  # too many deletes
+    ],
+)
+def test_invalid_input(invalid_input):
+    with pytest.raises(ValidationError):
+        BatchWriteProductsBody.model_validate(invalid_input)
+
+
+def test_valid_input(product_id):
+    # GIVEN a put and a delete of two different products
+    # WHEN creating a batch write input
+    # THEN no error should be raised and the instance should be created successfully
+    BatchWriteProductsBody.model_validate({'puts': [{'id': product_id, 'name': 'aaa', 'price': 5}], 'deletes': [generate_product_id()]})
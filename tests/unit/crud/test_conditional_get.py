@@ -0,0 +1,107 @@
+import base64
+import gzip
+import json
+from http import HTTPMethod, HTTPStatus
+from typing import Any, Optional
+
+import pytest
+from aws_lambda_powertools.event_handler import APIGatewayRestResolver, Response
+
+from product.crud.handlers.constants import COMPRESSION_MIN_BYTES
+from product.crud.handlers.utils.compression import compress_response
+from product.crud.handlers.utils.conditional_get import get_etag, is_not_modified
+from product.crud.handlers.utils.json_response import json_response, not_modified_response
+from product.crud.models.output import ListProductsOutput
+from tests.crud_utils import generate_product_api_gw_event
+from tests.utils import generate_context
+
+app = APIGatewayRestResolver()
+app.use(middlewares=[compress_response])
+PRODUCT_ID = '8c18c85a-0f10-4b73-b54a-07ab0d381018'
+OTHER_PRODUCT_ID = '4d6e9a56-3d3a-4b2e-9c55-6f2f7c8a1b90'
+catalog: dict[str, Any] = {'version': 1, 'products': [{'id': PRODUCT_ID, 'name': 'product', 'price': 1}]}
+reads: list[int] = []
+
+
+@app.get('/products')
+def list_products() -> Response[str]:
+    # validated before the products are read, like the catalog routes
+    etag = get_etag(catalog['version'])
+    if is_not_modified(app.current_event, etag):
+        return not_modified_response(etag, max_age_seconds=60)
+    reads.append(catalog['version'])
+    return json_response(ListProductsOutput(products=catalog['products']), exclude_unset=True, max_age_seconds=60, etag=etag)
+
+
+def resolve(headers: Optional[dict[str, str]] = None) -> dict[str, Any]:
+    return app.resolve(generate_product_api_gw_event('', HTTPMethod.GET, path='/products', headers=headers), generate_context())
+
+
+def test_etag_changes_with_any_validator():
+    # GIVEN a version and the request parameters shaping a response
+    # WHEN building ETags from them
+    # THEN they should be stable quoted strong tags, different when any validator changes
+    assert get_etag(1, 10, None) == get_etag(1, 10, None)
+    assert get_etag(1, 10, None).startswith('"')
+    assert len({get_etag(1, 10, None), get_etag(2, 10, None), get_etag(1, 20, None), get_etag(1, 10, 'token')}) == 4
+
+
+def test_unchanged_resource_is_not_modified():
+    # GIVEN a client holding the ETag of a resource
+    etag = resolve()['multiValueHeaders']['ETag'][0]
+    reads.clear()
+
+    # WHEN it sends a conditional GET, also with a weak or listed tag
+    # THEN a 304 without a body should be returned, without reading the resource
+    for if_none_match in (etag, f'W/{etag}', f'"other", {etag}', '*'):
+        response = resolve({'If-None-Match': if_none_match})
+        assert response['statusCode'] == HTTPStatus.NOT_MODIFIED
+        assert not response['body']
+        assert response['multiValueHeaders']['ETag'] == [etag]
+    assert not reads
+
+
+def test_changed_resource_is_sent_with_new_etag(monkeypatch: pytest.MonkeyPatch):
+    # GIVEN a client holding the ETag of a resource whose version changed since
+    etag = resolve()['multiValueHeaders']['ETag'][0]
+    monkeypatch.setitem(catalog, 'version', 2)
+    monkeypatch.setitem(catalog, 'products', [{'id': OTHER_PRODUCT_ID, 'name': 'product', 'price': 1}])
+
+    # WHEN it sends a conditional GET
+    response = resolve({'If-None-Match': etag})
+
+    # THEN the new body should be returned, with a new strong ETag
+    assert response['statusCode'] == HTTPStatus.OK
+    assert json.loads(response['body']) == {'products': [{'id': OTHER_PRODUCT_ID, 'name': 'product', 'price': 1}]}
+    new_etag = response['multiValueHeaders']['ETag'][0]
+    assert new_etag != etag and new_etag == get_etag(2)
+
+
+def test_compressed_response_has_weak_etag(monkeypatch: pytest.MonkeyPatch):
+    # GIVEN a resource large enough to be compressed
+    products = [{'id': PRODUCT_ID, 'name': 'product', 'price': 1}] * (COMPRESSION_MIN_BYTES // 10)
+    monkeypatch.setitem(catalog, 'products', products)
+    etag = resolve()['multiValueHeaders']['ETag'][0]
+
+    # WHEN a client accepting gzip gets it, and then sends a conditional GET with the weak ETag it received
+    response = resolve({'Accept-Encoding': 'gzip'})
+    conditional_response = resolve({'Accept-Encoding': 'gzip', 'If-None-Match': response['multiValueHeaders']['ETag'][0]})
+
+    # THEN the compressed response should carry the weak form of the ETag, which the 304 matches
+    assert response['multiValueHeaders']['ETag'] == [f'W/{etag}']
+    assert json.loads(gzip.decompress(base64.b64decode(response['body']))) == {'products': products}
+    assert conditional_response['statusCode'] == HTTPStatus.NOT_MODIFIED
+
+
+def test_not_modified_response_keeps_cache_control():
+    # GIVEN a route sending a caching policy, and a client holding the ETag of its resource
+    response = resolve()
+    etag = response['multiValueHeaders']['ETag'][0]
+
+    # WHEN it sends a conditional GET
+    conditional_response = resolve({'If-None-Match': etag})
+
+    # THEN both the response and the 304 should carry the caching policy
+    assert response['multiValueHeaders']['Cache-Control'] == ['public, max-age=60']
+    assert conditional_response['statusCode'] == HTTPStatus.NOT_MODIFIED
+    assert conditional_response['multiValueHeaders']['Cache-Control'] == ['public, max-age=60']
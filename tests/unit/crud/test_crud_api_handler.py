@@ -0,0 +1,60 @@
+import json
+from http import HTTPMethod, HTTPStatus
+
+import pytest
+
+from product.crud.handlers.handle_crud_api import lambda_handler
+from tests.crud_utils import generate_api_gw_list_products_event, generate_product_api_gw_event
+from tests.utils import generate_context
+
+INVALID_PRODUCT_ID = 'not-a-product-id'
+
+
+@pytest.fixture
+def crud_api_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    for name, value in {
+        'POWERTOOLS_SERVICE_NAME': 'products',
+        'LOG_LEVEL': 'DEBUG',
+        'TABLE_NAME': 'products',
+        'IDEMPOTENCY_TABLE_NAME': 'idempotency',
+        'CATALOG_TABLE_NAME': 'catalog',
+        'CURSOR_SIGNING_KEY': 'cursor-signing-key-for-tests',
+        'POWERTOOLS_TRACE_DISABLED': 'true',
+    }.items():
+        monkeypatch.setenv(name, value)
+
+
+@pytest.mark.parametrize(
+    'event',
+    [
+        generate_product_api_gw_event(INVALID_PRODUCT_ID, HTTPMethod.PUT, path_params={'product': INVALID_PRODUCT_ID}),
+        generate_product_api_gw_event(INVALID_PRODUCT_ID, HTTPMethod.PATCH, path_params={'product': INVALID_PRODUCT_ID}),
+        generate_product_api_gw_event(INVALID_PRODUCT_ID, HTTPMethod.GET, path_params={'product': INVALID_PRODUCT_ID}),
+        generate_product_api_gw_event(INVALID_PRODUCT_ID, HTTPMethod.DELETE, path_params={'product': INVALID_PRODUCT_ID}),
+        generate_api_gw_list_products_event(query_params={'limit': '0'}),
+        generate_product_api_gw_event('', HTTPMethod.POST, path='/api/products/batch-get'),
+        generate_product_api_gw_event('', HTTPMethod.POST, path='/api/products/batch-write'),
+        generate_api_gw_list_products_event(path='/api/products/export', query_params={'fields': 'created_at'}),
+    ],
+    ids=['create', 'update', 'get', 'delete', 'list', 'batch-get', 'batch-write', 'export'],
+)
+def test_single_function_routes_every_crud_request(crud_api_env: None, event: dict):
+    # GIVEN the single function handler and an invalid request of one of the routes
+
+    # WHEN handling the request
+    response = lambda_handler(event, generate_context())
+
+    # THEN the request should reach its route, which rejects the input, instead of being not found
+    assert response['statusCode'] == HTTPStatus.BAD_REQUEST
+    assert json.loads(response['body']) == {'error': 'invalid input'}
+
+
+def test_single_function_rejects_unknown_routes(crud_api_env: None):
+    # GIVEN the single function handler and a request of a route the API doesn't have
+    event = generate_product_api_gw_event('', HTTPMethod.DELETE, path='/api/products')
+
+    # WHEN handling the request
+    response = lambda_handler(event, generate_context())
+
+    # THEN it should not be found
+    assert response['statusCode'] == HTTPStatus.NOT_FOUND
@@ -0,0 +1,39 @@
+import pytest
+from aws_lambda_powertools.utilities import parameters
+from pydantic import ValidationError
+
+from product.crud.handlers.constants import CURSOR_SIGNING_KEY_MAX_AGE_SECONDS
+from product.crud.handlers.models.env_vars import Pagination
+from product.crud.handlers.utils.cursor_signing_key import get_cursor_signing_key
+
+SECRET_ARN = 'arn:aws:secretsmanager:us-east-1:123456789012:secret:cursor-signing-key'
+
+
+def test_pagination_requires_a_cursor_signing_key():
+    # GIVEN no signing key and no secret
+    # WHEN validating the pagination environment variables
+    # THEN it should fail
+    with pytest.raises(ValidationError):
+        Pagination()
+
+
+def test_cursor_signing_key_from_environment():
+    # GIVEN a signing key set in the environment
+    env_vars = Pagination(CURSOR_SIGNING_KEY='cursor-signing-key-for-tests')
+
+    # WHEN getting the signing key
+    # THEN it should be used as is
+    assert get_cursor_signing_key(env_vars) == 'cursor-signing-key-for-tests'
+
+
+def test_cursor_signing_key_from_secrets_manager(mocker):
+    # GIVEN a deployed function, which only knows the secret ARN
+    env_vars = Pagination(CURSOR_SIGNING_SECRET_ARN=SECRET_ARN)
+    get_secret = mocker.patch.object(parameters, 'get_secret', return_value='cursor-signing-key-from-secret')
+
+    # WHEN getting the signing key
+    signing_key = get_cursor_signing_key(env_vars)
+
+    # THEN it should be read from Secrets Manager, cached by the container
+    assert signing_key == 'cursor-signing-key-from-secret'
+    get_secret.assert_called_once_with(SECRET_ARN, max_age=CURSOR_SIGNING_KEY_MAX_AGE_SECONDS)
@@ -0,0 +1,22 @@
+from typing import cast
+
+from product.cache.memory import InMemoryCacheBackend
+from product.crud.integration import get_db_handler
+from product.crud.integration.dynamo_db_handler import DynamoDbHandler
+
+
+def test_handlers_are_memoized_per_configuration():
+    # GIVEN a handler of a table, built with the default configuration
+    default_handler = cast(DynamoDbHandler, get_db_handler('products'))
+
+    # WHEN getting handlers of other configurations, and of the same configuration passed differently
+    cached_handler = cast(DynamoDbHandler, get_db_handler('products', product_cache_size=5, cache_url='memory://'))
+    other_table_handler = cast(DynamoDbHandler, get_db_handler('other'))
+
+    # THEN every configuration should get its own handler, built once
+    assert cached_handler is not default_handler
+    assert cached_handler._product_cache.max_size == 5
+    assert isinstance(cached_handler._shared_cache.backend, InMemoryCacheBackend)
+    assert default_handler._shared_cache.backend is None
+    assert other_table_handler.table_name == 'other'
+    assert get_db_handler('products', cache_url=None) is default_handler
@@ -0,0 +1,46 @@
+from functools import partial
+
+import boto3
+import pytest
+from aws_lambda_powertools.utilities import idempotency
+from botocore.stub import Stubber
+
+from product.crud.domain_logic import create_product as create_product_module
+from product.crud.domain_logic.create_product import create_product
+from product.crud.models.output import CreateProductOutput
+from product.crud.models.product import Product
+from product.observability import metrics
+
+PRODUCT_ID = '8c18c85a-0f10-4b73-b54a-07ab0d381018'
+
+
+def test_repeated_create_is_counted_as_idempotency_cache_hit(monkeypatch: pytest.MonkeyPatch, mocker):
+    # GIVEN idempotent creates persisted in a stubbed idempotency table, with the local record cache enabled
+    client = boto3.client('dynamodb')
+    monkeypatch.setenv('IDEMPOTENCY_TABLE_NAME', 'idempotency')
+    monkeypatch.setattr(idempotency, 'DynamoDBPersistenceLayer', partial(idempotency.DynamoDBPersistenceLayer, boto3_client=client))
+    db_handler = mocker.MagicMock()
+    monkeypatch.setattr(create_product_module, 'get_db_handler', lambda table_name, **cache_config: db_handler)
+    create_product_module._get_idempotent_create.cache_clear()
+    product = Product(id=PRODUCT_ID, name='test', price=1)
+
+    metrics.clear_metrics()
+    with Stubber(client) as stubber:
+        # only the first request writes its in progress and completed records
+        stubber.add_response('put_item', {})
+        stubber.add_response('update_item', {})
+
+        # WHEN the same product is created twice
+        first = create_product(product=product, table_name='products')
+        second = create_product(product=product, table_name='products')
+
+        # THEN the second create should be answered from memory, without writing the product or calling DynamoDB
+        stubber.assert_no_pending_responses()
+    create_product_module._get_idempotent_create.cache_clear()
+    assert first == second == CreateProductOutput(id=PRODUCT_ID)
+    db_handler.create_product.assert_called_once()
+
+    # AND the creates should be counted as a cache miss then a cache hit
+    assert metrics.metric_set['IdempotencyCacheMisses']['Value'] == [1.0]
+    assert metrics.metric_set['IdempotencyCacheHits']['Value'] == [1.0]
+    metrics.clear_metrics()
@@ -0,0 +1,34 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+# modules the handlers only import on first use, none of them may be loaded by importing a handler module
+LAZY_MODULES = [
+    'product.cache.memory',
+    'product.cache.redis',
+    'aws_lambda_powertools.utilities.idempotency',
+    'aws_lambda_powertools.utilities.parameters',
+]
+
+
+@pytest.mark.parametrize(
+    'handler_module',
+    [
+        'product.crud.handlers.handle_create_product',
+        'product.crud.handlers.handle_get_product',
+        'product.crud.handlers.handle_list_products',
+        'product.crud.handlers.handle_crud_api',
+    ],
+)
+def test_handler_import_defers_lazy_modules(handler_module: str):
+    # GIVEN a fresh interpreter, as in a Lambda init phase
+    script = f'import importlib, json, sys; importlib.import_module({handler_module!r}); print(json.dumps(sorted(sys.modules)))'
+
+    # WHEN importing the handler module
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)
+
+    # THEN the modules loaded on first use should not be imported yet
+    loaded_modules = set(json.loads(result.stdout.splitlines()[-1]))
+    assert not loaded_modules.intersection(LAZY_MODULES)
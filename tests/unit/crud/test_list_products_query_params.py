@@ -0,0 +1,41 @@
+import pytest
+from aws_lambda_powertools.utilities.parser import ValidationError
+
+from product.crud.models.input import ListProductsQueryParams
+
+
+@pytest.mark.parametrize(
+    'invalid_input',
+    [
+        {'limit': 0},  # below minimum page size
+        {'limit': 101},  # above maximum page size
+        {'limit': 'a'},  # type mismatch
+        {'next_token': ''},  # empty token
+        {'fields': ''},  # empty fieldset
+        {'fields': 'id,created_at'},  # unknown field
+        {'fields': 'name,'},  # trailing comma
+        {'sort': 'oldest'},  # unsupported sort order
+    ],
+)
+def test_invalid_input(invalid_input):
+    with pytest.raises(ValidationError):
+        ListProductsQueryParams.model_validate(invalid_input)
+
+
+def test_valid_input():
+    # GIVEN query string parameters as sent by API Gateway (strings)
+    # WHEN parsing them
+    params = ListProductsQueryParams.model_validate({'limit': '10', 'next_token': 'token'})
+
+    # THEN the limit should be converted to an integer
+    assert params.limit == 10
+    assert params.next_token == 'token'
+
+
+def test_valid_fields():
+    # GIVEN a comma separated sparse fieldset as sent by API Gateway
+    # WHEN parsing it
+    params = ListProductsQueryParams.model_validate({'fields': 'id,name'})
+
+    # THEN it should be split into the selected fields
+    assert params.fields == ['id', 'name']
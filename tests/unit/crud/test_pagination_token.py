@@ -0,0 +1,71 @@
+from decimal import Decimal
+
+import pytest
+
+from product.crud.domain_logic.pagination import decode_next_token, encode_next_token
+from product.crud.models.exceptions import InvalidPaginationTokenException
+
+SIGNING_KEY = 'unit-tests-signing-key'
+
+
+def test_token_round_trip(product_id):
+    # GIVEN the key of the last product evaluated in a page
+    last_key = {'id': product_id}
+
+    # WHEN encoding it as a pagination token and decoding it back
+    token = encode_next_token(last_key, SIGNING_KEY)
+
+    # THEN the decoded key should match the original key
+    assert token is not None
+    assert decode_next_token(token, SIGNING_KEY) == last_key
+
+
+def test_token_round_trip_decimal_key(product_id):
+    # GIVEN a key with a DynamoDB number (boto3 returns Decimal)
+    last_key = {'id': product_id, 'created_at': Decimal(1700000000)}
+
+    # WHEN encoding it as a pagination token and decoding it back
+    token = encode_next_token(last_key, SIGNING_KEY)
+
+    # THEN the number should be decoded as an integer
+    assert decode_next_token(token, SIGNING_KEY) == {'id': product_id, 'created_at': 1700000000}
+
+
+def test_no_more_pages():
+    # GIVEN no last evaluated key (last page) and no incoming token (first page)
+    # WHEN encoding and decoding
+    # THEN no token and no start key should be returned
+    assert encode_next_token(None, SIGNING_KEY) is None
+    assert decode_next_token(None, SIGNING_KEY) is None
+
+
+def test_tampered_token(product_id):
+    # GIVEN a valid token whose payload was replaced
+    token = encode_next_token({'id': product_id}, SIGNING_KEY)
+    other_token = encode_next_token({'id': 'other'}, SIGNING_KEY)
+    assert token is not None and other_token is not None
+    tampered = f'{other_token.split(".")[0]}.{token.split(".")[1]}'
+
+    # WHEN decoding the token
+    # THEN an invalid pagination token error should be raised
+    with pytest.raises(InvalidPaginationTokenException):
+        decode_next_token(tampered, SIGNING_KEY)
+
+
+@pytest.mark.parametrize('token', ['', 'no_separator', '.', 'payload.'])
+def test_malformed_token(token):
+    # GIVEN a malformed token
+    # WHEN decoding the token
+    # THEN an invalid pagination token error should be raised
+    with pytest.raises(InvalidPaginationTokenException):
+        decode_next_token(token, SIGNING_KEY)
+
+
+def test_token_signed_with_other_key(product_id):
+    # GIVEN a token signed with a different key
+    token = encode_next_token({'id': product_id}, 'another-signing-key')
+
+    # WHEN decoding the token
+    # THEN an invalid pagination token error should be raised
+    with pytest.raises(InvalidPaginationTokenException):
+        decode_next_token(token, SIGNING_KEY)
@@ -0,0 +1,86 @@
+from product.crud.integration.product_cache import ProductCache
+from product.crud.models.product import Product
+from tests.crud_utils import generate_product_id
+
+
+def generate_product() -> Product:
+    return Product(id=generate_product_id(), name='test', price=1)
+
+
+def test_cache_hit_and_miss():
+    # GIVEN a cache holding a single product
+    cache = ProductCache(max_size=10, ttl_seconds=60, negative_ttl_seconds=60)
+    product = generate_product()
+    cache.put(product.id, product)
+
+    # WHEN looking up the cached product and a product that was never cached
+    # THEN the cached product should be a hit and the other product a miss
+    assert cache.get(product.id) == (True, product)
+    assert cache.get(generate_product_id()) == (False, None)
+
+
+def test_cache_not_found_entry():
+    # GIVEN a product cached as not found
+    cache = ProductCache(max_size=10, ttl_seconds=60, negative_ttl_seconds=60)
+    product_id = generate_product_id()
+    cache.put(product_id, None)
+
+    # WHEN looking it up
+    # THEN it should be a hit without a product
+    assert cache.get(product_id) == (True, None)
+
+
+def test_cache_negative_ttl():
+    # GIVEN a cache that expires not found products immediately
+    cache = ProductCache(max_size=10, ttl_seconds=60, negative_ttl_seconds=0)
+    product = generate_product()
+    product_id = generate_product_id()
+    cache.put(product.id, product)
+    cache.put(product_id, None)
+
+    # WHEN looking both up
+    # THEN only the found product should be served from the cache
+    assert cache.get(product.id) == (True, product)
+    assert cache.get(product_id) == (False, None)
+
+
+def test_cache_lru_eviction():
+    # GIVEN a full cache where the first product was used recently
+    cache = ProductCache(max_size=2, ttl_seconds=60, negative_ttl_seconds=60)
+    first, second, third = generate_product(), generate_product(), generate_product()
+    cache.put(first.id, first)
+    cache.put(second.id, second)
+    cache.get(first.id)
+
+    # WHEN caching another product
+    cache.put(third.id, third)
+
+    # THEN the least recently used product should be evicted
+    assert cache.get(second.id) == (False, None)
+    assert cache.get(first.id) == (True, first)
+    assert cache.get(third.id) == (True, third)
+
+
+def test_cache_invalidate():
+    # GIVEN a cached product
+    cache = ProductCache(max_size=10, ttl_seconds=60, negative_ttl_seconds=60)
+    product = generate_product()
+    cache.put(product.id, product)
+
+    # WHEN invalidating it
+    cache.invalidate(product.id)
+
+    # THEN it should no longer be served from the cache
+    assert cache.get(product.id) == (False, None)
+
+
+def test_cache_disabled():
+    # GIVEN a disabled cache
+    cache = ProductCache(max_size=0, ttl_seconds=60, negative_ttl_seconds=60)
+    product = generate_product()
+
+    # WHEN caching a product
+    cache.put(product.id, product)
+
+    # THEN it should not be served from the cache
+    assert cache.get(product.id) == (False, None)
@@ -0,0 +1,72 @@
+import base64
+import gzip
+import json
+from http import HTTPMethod
+from typing import Any, Optional
+
+import pytest
+from aws_lambda_powertools.event_handler import APIGatewayRestResolver, Response, content_types
+
+from product.crud.handlers.constants import COMPRESSION_MIN_BYTES
+from product.crud.handlers.utils.compression import compress_response
+from tests.crud_utils import generate_product_api_gw_event
+from tests.utils import generate_context
+
+LARGE_BODY = json.dumps({'products': [{'id': str(idx), 'name': 'product'} for idx in range(COMPRESSION_MIN_BYTES // 10)]})
+
+app = APIGatewayRestResolver()
+app.use(middlewares=[compress_response])
+
+
+@app.get('/large')
+def large() -> Response[str]:
+    return Response(status_code=200, content_type=content_types.APPLICATION_JSON, body=LARGE_BODY)
+
+
+@app.get('/small')
+def small() -> dict[str, Any]:
+    return {'id': 'small'}
+
+
+def resolve(path: str, accept_encoding: Optional[str]) -> dict[str, Any]:
+    event = generate_product_api_gw_event('', HTTPMethod.GET, path=path, headers={'Accept-Encoding': accept_encoding} if accept_encoding else None)
+    return app.resolve(event, generate_context())
+
+
+@pytest.mark.parametrize('accept_encoding', ['gzip', 'gzip, deflate, br', 'br;q=1.0, GZIP;q=0.5', '*', '*;q=0, gzip'])
+def test_large_body_is_compressed_when_accepted(accept_encoding: str):
+    # GIVEN a route returning a body above the compression threshold
+
+    # WHEN a client accepting gzip calls it
+    response = resolve('/large', accept_encoding)
+
+    # THEN the body should be gzip compressed and base64 encoded, decoding to the original body
+    assert response['isBase64Encoded']
+    assert response['multiValueHeaders']['Content-Encoding'] == ['gzip']
+    assert response['multiValueHeaders']['Vary'] == ['Accept-Encoding']
+    assert gzip.decompress(base64.b64decode(response['body'])).decode('utf-8') == LARGE_BODY
+
+
+@pytest.mark.parametrize('accept_encoding', [None, 'br', 'gzip;q=0', 'identity', '*;q=0.1, gzip;q=0', 'gzip;q=0, *'])
+def test_large_body_is_not_compressed_when_not_accepted(accept_encoding: Optional[str]):
+    # GIVEN a route returning a body above the compression threshold
+
+    # WHEN a client that doesn't accept gzip calls it
+    response = resolve('/large', accept_encoding)
+
+    # THEN the body should be sent as is, marked as varying by accepted encoding for caches
+    assert not response['isBase64Encoded']
+    assert 'Content-Encoding' not in response['multiValueHeaders']
+    assert response['multiValueHeaders']['Vary'] == ['Accept-Encoding']
+    assert response['body'] == LARGE_BODY
+
+
+def test_small_body_is_not_compressed():
+    # GIVEN a route returning a body below the compression threshold
+
+    # WHEN a client accepting gzip calls it
+    response = resolve('/small', 'gzip')
+
+    # THEN the body should be sent as is
+    assert not response['isBase64Encoded']
+    assert json.loads(response['body']) == {'id': 'small'}
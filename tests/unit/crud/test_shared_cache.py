@@ -0,0 +1,71 @@
+from typing import Optional
+
+from product.cache.base import CacheBackend
+from product.cache.exceptions import CacheBackendError
+from product.cache.memory import InMemoryCacheBackend
+from product.crud.integration.shared_cache import SharedCache
+from product.crud.models.product import Product, ProductProjection, ProductsPage
+from product.stream_processor.domain_logic.cache_invalidation import invalidate_product_cache
+from product.stream_processor.models.product import ProductCatalogChange
+from tests.crud_utils import generate_product_id
+
+
+class _UnavailableCacheBackend(CacheBackend):
+    def get(self, key: str) -> Optional[str]:
+        raise CacheBackendError('unavailable')
+
+    def set(self, key: str, value: str, ttl_seconds: Optional[int]) -> None:
+        raise CacheBackendError('unavailable')
+
+    def delete(self, keys: list[str]) -> None:
+        raise CacheBackendError('unavailable')
+
+
+def generate_product() -> Product:
+    return Product(id=generate_product_id(), name='test', price=1)
+
+
+def test_product_round_trip_and_stream_invalidation():
+    # GIVEN a shared cache holding a product
+    backend = InMemoryCacheBackend()
+    cache = SharedCache(backend=backend, product_ttl_seconds=60, page_ttl_seconds=60)
+    product = generate_product()
+    cache.put_product(product)
+    assert cache.get_product(product.id) == product
+
+    # WHEN the stream processor applies a change of the product
+    invalidate_product_cache(changes=[ProductCatalogChange(product_id=product.id)], cache_backend=backend)
+
+    # THEN the product should no longer be served from the cache
+    assert cache.get_product(product.id) is None
+
+
+def test_pages_are_invalidated_by_any_product_change():
+    # GIVEN a shared cache holding a page of projections
+    backend = InMemoryCacheBackend()
+    cache = SharedCache(backend=backend, product_ttl_seconds=60, page_ttl_seconds=60)
+    page = ProductsPage(products=[ProductProjection(id=generate_product_id(), name='test')], last_key={'id': generate_product_id()})
+    page_key = cache.get_page_key(limit=10, start_key=None, fields=['name'])
+    assert page_key is not None
+    cache.put_page(page_key, page)
+    assert cache.get_page(page_key, fields=['name']) == page
+
+    # WHEN the stream processor applies a change of any product
+    invalidate_product_cache(changes=[ProductCatalogChange(product_id=generate_product_id())], cache_backend=backend)
+
+    # THEN the same page request should get a new key, the cached page is no longer served
+    new_page_key = cache.get_page_key(limit=10, start_key=None, fields=['name'])
+    assert new_page_key != page_key
+    assert new_page_key is not None and cache.get_page(new_page_key, fields=['name']) is None
+
+
+def test_unavailable_or_disabled_cache_is_a_miss():
+    # GIVEN a shared cache on an unavailable backend, and a disabled shared cache
+    for cache in (SharedCache(backend=_UnavailableCacheBackend(), product_ttl_seconds=60, page_ttl_seconds=60), SharedCache(None, 60, 60)):
+        # WHEN caching and reading
+        product = generate_product()
+        cache.put_product(product)
+
+        # THEN every read should be a miss, without raising
+        assert cache.get_product(product.id) is None
+        assert cache.get_page_key(limit=10, start_key=None, fields=None) is None
@@ -0,0 +1,36 @@
+import pytest
+from aws_lambda_powertools.utilities.parser import ValidationError
+
+from product.crud.models.input import UpdateProductBody
+
+
+def test_empty_update():
+    # GIVEN an update without any product attribute
+    # WHEN creating an update product input
+    # THEN a validation error should be raised
+    with pytest.raises(ValidationError):
+        UpdateProductBody()
+
+
+def test_invalid_price():
+    # GIVEN an invalid price (negative value)
+    # WHEN creating an update product input
+    # THEN a validation error should be raised
+    with pytest.raises(ValidationError):
+        UpdateProductBody(price=-1)
+
+
+def test_invalid_name():
+    # GIVEN an invalid name (empty string)
+    # WHEN creating an update product input
+    # THEN a validation error should be raised
+    with pytest.raises(ValidationError):
+        UpdateProductBody(name='')
+
+
+def test_valid_partial_input():
+    # GIVEN only a new price
+    # WHEN creating an update product input
+    # THEN no error should be raised and the name should be left unset
+    update = UpdateProductBody(price=4)
+    assert update.name is None
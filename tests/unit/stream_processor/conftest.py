@@ -1,14 +1,16 @@
 import os
-from typing import Any, Sequence
+from typing import Any, Optional, Sequence
 
 import pytest
 from pytest_socket import disable_socket
 
 from infrastructure.product.constants import POWER_TOOLS_LOG_LEVEL, POWERTOOLS_SERVICE_NAME, SERVICE_NAME
+from product.stream_processor.integrations.catalog.base import BaseCatalogHandler
 from product.stream_processor.integrations.events.base import BaseEventHandler, BaseEventProvider
 from product.stream_processor.integrations.events.event_handler import EventHandler
 from product.stream_processor.integrations.events.models.input import AnyModel, Event
 from product.stream_processor.integrations.events.models.output import EventReceipt, EventReceiptSuccess
+from product.stream_processor.models.product import CatalogStatsBatch, CatalogStatsDelta, ProductCatalogChange
 
 
 @pytest.fixture(scope='session', autouse=True)
@@ -56,3 +58,29 @@ class FakeEventHandler(BaseEventHandler[AnyModel]):
 
     def __contains__(self, item: AnyModel):
         return item in self.published_payloads
+
+
+class FakeCatalogHandler(BaseCatalogHandler):
+    def __init__(self) -> None:
+        self.catalog: dict[str, Any] = {}
+        self.applied_changes: list[ProductCatalogChange] = []
+        self.applied_stats: list[CatalogStatsDelta] = []
+        self.batch_markers: dict[str, int] = {}
+        self.version = 0  # statistics version, incremented by every applied delta
+
+    def apply(self, changes: list[ProductCatalogChange]) -> None:
+        for change in changes:
+            if change.product is None:
+                self.catalog.pop(change.product_id, None)
+            else:
+                self.catalog[change.product_id] = change.product
+        self.applied_changes.extend(changes)
+
+    def apply_stats(self, delta: CatalogStatsDelta, batch: CatalogStatsBatch) -> Optional[int]:
+        applied_changes = self.batch_markers.get(batch.batch_id, 0)
+        if applied_changes != batch.applied_changes:
+            return applied_changes
+        self.batch_markers[batch.batch_id] = batch.changes
+        self.applied_stats.append(delta)
+        self.version += 1
+        return None
@@ -26,6 +26,7 @@ def generate_dynamodb_stream_events(
                         'price': {'N': '1'},
                         'name': {'S': 'test'},
                         'id': {'S': f'{product_id}'},
+                        'created_at': {'N': '1700000000'},
                     },
                     'SequenceNumber': f'{random.randint(a=10**24, b=10**25 - 1)}',
                     'SizeBytes': 91,
@@ -46,6 +47,7 @@ def generate_dynamodb_stream_events(
                         'price': {'N': '1'},
                         'name': {'S': 'test'},
                         'id': {'S': f'{product_id}'},
+                        'created_at': {'N': '1700000000'},
                     },
                     'SequenceNumber': f'{random.randint(a=10**24, b=10**25 - 1)}',
                     'SizeBytes': 91,
@@ -57,6 +59,42 @@ def generate_dynamodb_stream_events(
     }
 
 
+def generate_dynamodb_modify_stream_event(
+    product_id: str = '8c18c85a-0f10-4b73-b54a-07ab0d381018', old_price: int = 1, new_price: int = 2
+) -> dict[str, Any]:
+    return {
+        'Records': [
+            {
+                'eventID': 'c4ca4238a0b923820dcc509a6f75849b',
+                'eventName': 'MODIFY',
+                'eventVersion': '1.1',
+                'eventSource': 'aws:dynamodb',
+                'awsRegion': 'eu-west-1',
+                'dynamodb': {
+                    'ApproximateCreationDateTime': time.time(),
+                    'Keys': {'id': {'S': f'{product_id}'}},
+                    'NewImage': {
+                        'price': {'N': f'{new_price}'},
+                        'name': {'S': 'test'},
+                        'id': {'S': f'{product_id}'},
+                        'created_at': {'N': '1700000000'},
+                    },
+                    'OldImage': {
+                        'price': {'N': f'{old_price}'},
+                        'name': {'S': 'test'},
+                        'id': {'S': f'{product_id}'},
+                        'created_at': {'N': '1700000000'},
+                    },
+                    'SequenceNumber': f'{random.randint(a=10**24, b=10**25 - 1)}',
+                    'SizeBytes': 140,
+                    'StreamViewType': 'NEW_AND_OLD_IMAGES',
+                },
+                'eventSourceARN': 'arn:aws:dynamodb:eu-west-1:123456789012:table/lessa-stream-processor-ProductCruddbproducts/stream/2023-09-29T09:00:01.491',
+            },
+        ]
+    }
+
+
 def generate_product_notifications(product_id: str = '') -> list[ProductChangeNotification]:
     product_id = product_id or f'{uuid4()}'
     return [
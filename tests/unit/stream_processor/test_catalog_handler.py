@@ -0,0 +1,367 @@
+from datetime import datetime, timezone
+
+import boto3
+import pytest
+from botocore import stub
+
+from product.models.products.catalog import CATALOG_STATS_SHARD, get_catalog_shard, get_stats_batch_shard
+from product.models.products.product import ProductEntry
+from product.stream_processor.integrations.catalog.dynamodb import DynamoDbCatalogHandler
+from product.stream_processor.integrations.catalog.exceptions import CatalogSnapshotUpdateError
+from product.stream_processor.models.product import CatalogStatsBatch, CatalogStatsDelta, ProductCatalogChange
+
+PRODUCT_ID = '8c18c85a-0f10-4b73-b54a-07ab0d381018'
+ATTRIBUTE_NAMES = {'#products': 'products', '#version': 'version'}
+BATCH_ID = 'af0065970f39f49c7d014079db1b86ce'
+BATCH = CatalogStatsBatch(batch_id=BATCH_ID, changes=2)
+TODAY = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+DAY_NAMES = {'#added_per_day': 'added_per_day', '#removed_per_day': 'removed_per_day'}
+
+
+def generate_product() -> ProductEntry:
+    return ProductEntry(id=PRODUCT_ID, name='test', price=1, created_at=1700000000)
+
+
+def test_catalog_handler_adds_product_to_existing_shard():
+    # GIVEN a catalog table whose shard already holds a products map
+    table = boto3.resource('dynamodb').Table('catalog')
+    stubber = stub.Stubber(table.meta.client)
+    stubber.add_response(
+        method='update_item',
+        service_response={},
+        expected_params={
+            'TableName': 'catalog',
+            'Key': {'shard': get_catalog_shard(PRODUCT_ID)},
+            'UpdateExpression': 'SET #products.#id = :product ADD #version :one',
+            'ConditionExpression': 'attribute_exists(#products)',
+            'ExpressionAttributeNames': {**ATTRIBUTE_NAMES, '#id': PRODUCT_ID},
+            'ExpressionAttributeValues': {':product': generate_product().model_dump(), ':one': 1},
+        },
+    )
+    stubber.activate()
+
+    # WHEN a new product is applied to the snapshot
+    DynamoDbCatalogHandler(table_name='catalog', table=table).apply([ProductCatalogChange(product_id=PRODUCT_ID, product=generate_product())])
+
+    # THEN a single UpdateItem should set the product in the shard
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
+
+
+def test_catalog_handler_creates_missing_shard():
+    # GIVEN a catalog table whose shard doesn't exist yet
+    table = boto3.resource('dynamodb').Table('catalog')
+    stubber = stub.Stubber(table.meta.client)
+    stubber.add_client_error(method='update_item', service_error_code='ConditionalCheckFailedException')
+    stubber.add_response(
+        method='update_item',
+        service_response={},
+        expected_params={
+            'TableName': 'catalog',
+            'Key': {'shard': get_catalog_shard(PRODUCT_ID)},
+            'UpdateExpression': 'SET #products = :products ADD #version :one',
+            'ConditionExpression': 'attribute_not_exists(#products)',
+            'ExpressionAttributeNames': ATTRIBUTE_NAMES,
+            'ExpressionAttributeValues': {':products': {PRODUCT_ID: generate_product().model_dump()}, ':one': 1},
+        },
+    )
+    stubber.activate()
+
+    # WHEN a new product is applied to the snapshot
+    DynamoDbCatalogHandler(table_name='catalog', table=table).apply([ProductCatalogChange(product_id=PRODUCT_ID, product=generate_product())])
+
+    # THEN the shard should be created with the product in it
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
+
+
+def test_catalog_handler_ignores_removal_from_missing_shard():
+    # GIVEN a catalog table whose shard doesn't exist
+    table = boto3.resource('dynamodb').Table('catalog')
+    stubber = stub.Stubber(table.meta.client)
+    stubber.add_client_error(method='update_item', service_error_code='ConditionalCheckFailedException')
+    stubber.activate()
+
+    # WHEN a removed product is applied to the snapshot
+    DynamoDbCatalogHandler(table_name='catalog', table=table).apply([ProductCatalogChange(product_id=PRODUCT_ID)])
+
+    # THEN there is nothing to remove and no error should be raised
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
+
+
+def test_catalog_handler_update_failure():
+    # GIVEN a catalog table that throttles updates
+    table = boto3.resource('dynamodb').Table('catalog')
+    stubber = stub.Stubber(table.meta.client)
+    stubber.add_client_error(method='update_item', service_error_code='ProvisionedThroughputExceededException')
+    stubber.activate()
+
+    # WHEN a removed product is applied to the snapshot
+    # THEN a CatalogSnapshotUpdateError should be raised so the stream retries the batch
+    with pytest.raises(CatalogSnapshotUpdateError):
+        DynamoDbCatalogHandler(table_name='catalog', table=table).apply([ProductCatalogChange(product_id=PRODUCT_ID)])
+
+    stubber.deactivate()
+
+
+def test_catalog_handler_marks_full_shard_incomplete():
+    # GIVEN a catalog table whose shard has no space left for the product
+    table = boto3.resource('dynamodb').Table('catalog')
+    stubber = stub.Stubber(table.meta.client)
+    stubber.add_client_error(
+        method='update_item',
+        service_error_code='ValidationException',
+        service_message='Item size to update has exceeded the maximum allowed size',
+    )
+    stubber.add_response(
+        method='update_item',
+        service_response={},
+        expected_params={
+            'TableName': 'catalog',
+            'Key': {'shard': get_catalog_shard(PRODUCT_ID)},
+            'UpdateExpression': 'REMOVE #products.#id SET #incomplete = :true ADD #version :one',
+            'ExpressionAttributeNames': {**ATTRIBUTE_NAMES, '#id': PRODUCT_ID, '#incomplete': 'incomplete'},
+            'ExpressionAttributeValues': {':true': True, ':one': 1},
+        },
+    )
+    stubber.activate()
+
+    # WHEN the product is applied to the snapshot
+    DynamoDbCatalogHandler(table_name='catalog', table=table).apply([ProductCatalogChange(product_id=PRODUCT_ID, product=generate_product())])
+
+    # THEN the product should be left out and the shard marked incomplete, without failing the batch
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
+
+
+def generate_stats_transaction(stats_update: dict, applied_changes: int = 0) -> dict:
+    marker = {
+        'TableName': 'catalog',
+        'Key': {'shard': get_stats_batch_shard(BATCH_ID)},
+        'UpdateExpression': 'SET #changes = :changes, #expires_at = :expires_at',
+        'ConditionExpression': '#changes = :applied_changes' if applied_changes else 'attribute_not_exists(#changes)',
+        'ExpressionAttributeNames': {'#changes': 'changes', '#expires_at': 'expires_at'},
+        'ExpressionAttributeValues': {
+            ':changes': 2,
+            ':expires_at': stub.ANY,
+            **({':applied_changes': applied_changes} if applied_changes else {}),
+        },
+    }
+    return {'TransactItems': [{'Update': {'TableName': 'catalog', **stats_update}}, {'Update': marker}]}
+
+
+def add_transaction_canceled(stubber: stub.Stubber, reasons: list[str]) -> None:
+    stubber.add_client_error(
+        method='transact_write_items',
+        service_error_code='TransactionCanceledException',
+        modeled_fields={'CancellationReasons': [{'Code': reason} for reason in reasons]},
+    )
+
+
+def test_catalog_handler_increments_stats():
+    # GIVEN a catalog table with a statistics item and a delta of a single added product
+    table = boto3.resource('dynamodb').Table('catalog')
+    stubber = stub.Stubber(table.meta.client)
+    stubber.add_response(
+        method='transact_write_items',
+        service_response={},
+        expected_params=generate_stats_transaction(
+            {
+                'Key': {'shard': CATALOG_STATS_SHARD},
+                'UpdateExpression': 'ADD #product_count :product_count, #price_sum :price_sum, #version :one, '
+                '#price_counts.#price_counts_0 :price_counts_0, #added_per_day.#added_per_day_0 :added_per_day_0',
+                'ConditionExpression': 'attribute_exists(#price_counts)',
+                'ExpressionAttributeNames': {
+                    '#product_count': 'product_count',
+                    '#price_sum': 'price_sum',
+                    '#version': 'version',
+                    '#price_counts': 'price_counts',
+                    '#price_counts_0': '10',
+                    '#added_per_day': 'added_per_day',
+                    '#added_per_day_0': '2024-05-01',
+                },
+                'ExpressionAttributeValues': {':product_count': 1, ':price_sum': 10, ':one': 1, ':price_counts_0': 1, ':added_per_day_0': 1},
+            }
+        ),
+    )
+    stubber.add_response(
+        method='get_item',
+        service_response={'Item': {'added_per_day': {'M': {TODAY: {'N': '1'}}}}},
+        expected_params={
+            'TableName': 'catalog',
+            'Key': {'shard': CATALOG_STATS_SHARD},
+            'ProjectionExpression': '#added_per_day, #removed_per_day',
+            'ExpressionAttributeNames': DAY_NAMES,
+            'ConsistentRead': True,
+        },
+    )
+    stubber.activate()
+
+    # WHEN the delta is applied to the statistics
+    delta = CatalogStatsDelta(product_count=1, price_sum=10, price_counts={10: 1}, added_per_day={'2024-05-01': 1})
+    applied_changes = DynamoDbCatalogHandler(table_name='catalog', table=table).apply_stats(delta, BATCH)
+
+    # THEN a single transaction should increment every counter and mark the batch changes as applied, with nothing to prune
+    assert applied_changes is None
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
+
+
+def test_catalog_handler_creates_missing_stats_item():
+    # GIVEN a catalog table without a statistics item
+    table = boto3.resource('dynamodb').Table('catalog')
+    stubber = stub.Stubber(table.meta.client)
+    add_transaction_canceled(stubber, ['ConditionalCheckFailed', 'None'])
+    stubber.add_response(
+        method='transact_write_items',
+        service_response={},
+        expected_params=generate_stats_transaction(
+            {
+                'Key': {'shard': CATALOG_STATS_SHARD},
+                'UpdateExpression': 'SET #price_counts = :price_counts, #added_per_day = :added_per_day, #removed_per_day = :removed_per_day '
+                'ADD #product_count :product_count, #price_sum :price_sum, #version :one',
+                'ConditionExpression': 'attribute_not_exists(#price_counts)',
+                'ExpressionAttributeNames': {
+                    '#product_count': 'product_count',
+                    '#price_sum': 'price_sum',
+                    '#version': 'version',
+                    '#price_counts': 'price_counts',
+                    '#added_per_day': 'added_per_day',
+                    '#removed_per_day': 'removed_per_day',
+                },
+                'ExpressionAttributeValues': {
+                    ':product_count': 1,
+                    ':price_sum': 10,
+                    ':one': 1,
+                    ':price_counts': {'10': 1},
+                    ':added_per_day': {'2024-05-01': 1},
+                    ':removed_per_day': {},
+                },
+            }
+        ),
+    )
+    stubber.add_response(
+        method='get_item',
+        service_response={'Item': {'added_per_day': {'M': {TODAY: {'N': '1'}}}}},
+        expected_params={
+            'TableName': 'catalog',
+            'Key': {'shard': CATALOG_STATS_SHARD},
+            'ProjectionExpression': '#added_per_day, #removed_per_day',
+            'ExpressionAttributeNames': DAY_NAMES,
+            'ConsistentRead': True,
+        },
+    )
+    stubber.activate()
+
+    # WHEN the delta is applied to the statistics
+    delta = CatalogStatsDelta(product_count=1, price_sum=10, price_counts={10: 1}, added_per_day={'2024-05-01': 1})
+    DynamoDbCatalogHandler(table_name='catalog', table=table).apply_stats(delta, BATCH)
+
+    # THEN the statistics item should be created with the delta as its initial values
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
+
+
+def test_catalog_handler_prunes_stats():
+    # GIVEN a statistics item where the last product of a price was just removed, with days older than the retention
+    table = boto3.resource('dynamodb').Table('catalog')
+    stubber = stub.Stubber(table.meta.client)
+    stubber.add_response(method='transact_write_items', service_response={})
+    stubber.add_response(
+        method='get_item',
+        service_response={
+            'Item': {
+                'price_counts': {'M': {'10': {'N': '0'}, '20': {'N': '1'}}},
+                'added_per_day': {'M': {'2024-05-01': {'N': '2'}, TODAY: {'N': '1'}}},
+                'removed_per_day': {'M': {'2024-05-01': {'N': '1'}, '2024-05-02': {'N': '1'}, TODAY: {'N': '2'}}},
+            }
+        },
+        expected_params={
+            'TableName': 'catalog',
+            'Key': {'shard': CATALOG_STATS_SHARD},
+            'ProjectionExpression': '#added_per_day, #removed_per_day, #price_counts.#price_0, #price_counts.#price_1',
+            'ExpressionAttributeNames': {'#price_counts': 'price_counts', **DAY_NAMES, '#price_0': '10', '#price_1': '20'},
+            'ConsistentRead': True,
+        },
+    )
+    stubber.add_response(
+        method='update_item',
+        service_response={},
+        expected_params={
+            'TableName': 'catalog',
+            'Key': {'shard': CATALOG_STATS_SHARD},
+            'UpdateExpression': 'REMOVE #price_counts.#price_0, #added_per_day.#day_0, #removed_per_day.#day_0, #removed_per_day.#day_1',
+            'ConditionExpression': '#price_counts.#price_0 = :zero',
+            'ExpressionAttributeNames': {
+                '#price_counts': 'price_counts',
+                **DAY_NAMES,
+                '#price_0': '10',
+                '#day_0': '2024-05-01',
+                '#day_1': '2024-05-02',
+            },
+            'ExpressionAttributeValues': {':zero': 0},
+        },
+    )
+    stubber.activate()
+
+    # WHEN a delta removing products of both prices is applied
+    delta = CatalogStatsDelta(product_count=-2, price_sum=-30, price_counts={10: -1, 20: -1}, removed_per_day={TODAY: 2})
+    applied_changes = DynamoDbCatalogHandler(table_name='catalog', table=table).apply_stats(delta, BATCH)
+
+    # THEN the price no product has anymore and the days older than the retention should be removed, if still at 0
+    assert applied_changes is None
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
+
+
+def test_catalog_handler_ignores_prune_failure():
+    # GIVEN a statistics item whose zero count price is counted again by another stream shard before it is pruned
+    table = boto3.resource('dynamodb').Table('catalog')
+    stubber = stub.Stubber(table.meta.client)
+    stubber.add_response(method='transact_write_items', service_response={})
+    stubber.add_response(method='get_item', service_response={'Item': {'price_counts': {'M': {'10': {'N': '0'}}}}})
+    stubber.add_client_error(method='update_item', service_error_code='ConditionalCheckFailedException')
+    stubber.activate()
+
+    # WHEN a delta removing the last product of the price is applied
+    delta = CatalogStatsDelta(product_count=-1, price_sum=-10, price_counts={10: -1})
+    applied_changes = DynamoDbCatalogHandler(table_name='catalog', table=table).apply_stats(delta, BATCH)
+
+    # THEN the delta should still be applied, the price is left to a later batch
+    assert applied_changes is None
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
+
+
+def test_catalog_handler_skips_applied_batch():
+    # GIVEN a catalog table holding the marker of a batch whose changes were applied
+    table = boto3.resource('dynamodb').Table('catalog')
+    stubber = stub.Stubber(table.meta.client)
+    add_transaction_canceled(stubber, ['None', 'ConditionalCheckFailed'])
+    stubber.add_response(method='get_item', service_response={'Item': {'changes': {'N': '2'}}})
+    stubber.activate()
+
+    # WHEN the retried batch applies its delta again
+    delta = CatalogStatsDelta(product_count=1, price_sum=10, price_counts={10: 1}, added_per_day={'2024-05-01': 1})
+    applied_changes = DynamoDbCatalogHandler(table_name='catalog', table=table).apply_stats(delta, BATCH)
+
+    # THEN nothing should be applied, and the applied changes of the batch returned
+    assert applied_changes == 2
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
+
+
+def test_catalog_handler_stats_error():
+    # GIVEN a catalog table where transactions keep conflicting
+    table = boto3.resource('dynamodb').Table('catalog')
+    stubber = stub.Stubber(table.meta.client)
+    for _ in range(3):
+        add_transaction_canceled(stubber, ['TransactionConflict', 'None'])
+    stubber.activate()
+
+    # WHEN applying a delta to the statistics
+    # THEN the batch should fail once the attempts are exhausted
+    with pytest.raises(CatalogSnapshotUpdateError):
+        DynamoDbCatalogHandler(table_name='catalog', table=table).apply_stats(CatalogStatsDelta(product_count=1), BATCH)
+    stubber.deactivate()
@@ -0,0 +1,67 @@
+from datetime import datetime, timezone
+
+from product.crud.handlers.utils.conditional_get import get_etag
+from product.models.products.product import ProductEntry
+from product.stream_processor.domain_logic.catalog_stats import build_catalog_stats_delta, update_catalog_stats
+from product.stream_processor.models.product import CatalogStatsDelta, ProductCatalogChange
+from tests.unit.stream_processor.conftest import FakeCatalogHandler
+
+PRODUCT_ID = '8c18c85a-0f10-4b73-b54a-07ab0d381018'
+CHANGED_AT = datetime(2024, 5, 1, 12, tzinfo=timezone.utc)
+
+
+def generate_product(price: int) -> ProductEntry:
+    return ProductEntry(id=PRODUCT_ID, name='test', price=price, created_at=1700000000)
+
+
+def test_stats_delta_of_added_updated_and_removed_products():
+    # GIVEN a product added at price 10, its price updated to 20, and another product at price 5 removed
+    changes = [
+        ProductCatalogChange(product_id=PRODUCT_ID, product=generate_product(10), changed_at=CHANGED_AT),
+        ProductCatalogChange(product_id=PRODUCT_ID, product=generate_product(20), previous_product=generate_product(10), changed_at=CHANGED_AT),
+        ProductCatalogChange(product_id=PRODUCT_ID, previous_product=generate_product(5), changed_at=CHANGED_AT),
+    ]
+
+    # WHEN folding the changes into a statistics delta
+    delta = build_catalog_stats_delta(changes)
+
+    # THEN the delta should hold the net change of every counter
+    assert delta.product_count == 0
+    assert delta.price_sum == 15
+    assert delta.price_counts == {20: 1, 5: -1}
+    assert delta.added_per_day == {'2024-05-01': 1}
+    assert delta.removed_per_day == {'2024-05-01': 1}
+
+
+def test_name_only_update_changes_list_etag():
+    # GIVEN a product renamed without changing its price, and the ETag of a list page before the change
+    renamed = generate_product(10).model_copy(update={'name': 'renamed'})
+    changes = [ProductCatalogChange(product_id=PRODUCT_ID, product=renamed, previous_product=generate_product(10))]
+    catalog_store = FakeCatalogHandler()
+    etag = get_etag(catalog_store.version, 10, None, None, None)
+
+    # WHEN applying the change to the statistics
+    update_catalog_stats(changes=changes, catalog_handler=catalog_store, batch_id='batch')
+
+    # THEN the counters should be left as they are, but the version should be incremented so the list page gets a new ETag
+    assert catalog_store.applied_stats == [CatalogStatsDelta()]
+    assert get_etag(catalog_store.version, 10, None, None, None) != etag
+
+
+def test_retried_batch_is_counted_once():
+    # GIVEN a batch whose statistics were applied before it failed, and its retry holding one more record
+    changes = [
+        ProductCatalogChange(product_id=PRODUCT_ID, product=generate_product(10), changed_at=CHANGED_AT),
+        ProductCatalogChange(product_id=PRODUCT_ID, product=generate_product(20), previous_product=generate_product(10), changed_at=CHANGED_AT),
+    ]
+    retried_changes = [*changes, ProductCatalogChange(product_id=PRODUCT_ID, previous_product=generate_product(20), changed_at=CHANGED_AT)]
+    catalog_store = FakeCatalogHandler()
+    update_catalog_stats(changes=changes, catalog_handler=catalog_store, batch_id='batch')
+
+    # WHEN the batch is retried, twice
+    update_catalog_stats(changes=retried_changes, catalog_handler=catalog_store, batch_id='batch')
+    update_catalog_stats(changes=retried_changes, catalog_handler=catalog_store, batch_id='batch')
+
+    # THEN every change should be counted once
+    assert [delta.product_count for delta in catalog_store.applied_stats] == [1, -1]
+    assert sum(delta.price_sum for delta in catalog_store.applied_stats) == 0
@@ -1,6 +1,9 @@
+from product.cache.keys import get_product_key
+from product.cache.memory import InMemoryCacheBackend
 from product.stream_processor.handlers.process_stream import process_stream
-from tests.unit.stream_processor.conftest import FakeEventHandler
-from tests.unit.stream_processor.data_builder import generate_dynamodb_stream_events
+from product.stream_processor.models.product import CatalogStatsDelta
+from tests.unit.stream_processor.conftest import FakeCatalogHandler, FakeEventHandler
+from tests.unit.stream_processor.data_builder import generate_dynamodb_modify_stream_event, generate_dynamodb_stream_events
 from tests.utils import generate_context
 
 
@@ -17,6 +20,68 @@ def test_process_stream_notify_product_updates():
     assert len(dynamodb_stream_events['Records']) == len(event_store)
 
 
+def test_process_stream_updates_catalog_snapshot():
+    # GIVEN a DynamoDB stream event that adds and then removes a product, and a fake catalog handler
+    product_id = '8c18c85a-0f10-4b73-b54a-07ab0d381018'
+    dynamodb_stream_events = generate_dynamodb_stream_events(product_id=product_id)
+    catalog_store = FakeCatalogHandler()
+
+    # WHEN process_stream is called with a custom catalog handler
+    process_stream(event=dynamodb_stream_events, context=generate_context(), event_handler=FakeEventHandler(), catalog_handler=catalog_store)
+
+    # THEN the product should be added then removed from the snapshot, in stream order
+    assert [change.product is not None for change in catalog_store.applied_changes] == [True, False]
+    assert catalog_store.applied_changes[0].product.name == 'test'
+    assert product_id not in catalog_store.catalog
+
+    # AND the statistics should be updated once for the whole batch, the product was added and removed
+    assert len(catalog_store.applied_stats) == 1
+    stats = catalog_store.applied_stats[0]
+    assert stats.product_count == 0
+    assert sum(stats.added_per_day.values()) == sum(stats.removed_per_day.values()) == 1
+
+
+def test_process_stream_notifies_and_applies_product_update():
+    # GIVEN a DynamoDB stream event that changes a product price in place, and fake event and catalog handlers
+    product_id = '8c18c85a-0f10-4b73-b54a-07ab0d381018'
+    dynamodb_stream_events = generate_dynamodb_modify_stream_event(product_id=product_id, old_price=1, new_price=5)
+    event_store = FakeEventHandler()
+    catalog_store = FakeCatalogHandler()
+
+    # WHEN process_stream is called with custom handlers
+    process_stream(event=dynamodb_stream_events, context=generate_context(), event_handler=event_store, catalog_handler=catalog_store)
+
+    # THEN a single updated notification should be emitted, not a removal and an addition
+    assert [notification.status for notification in event_store.published_payloads] == ['UPDATED']
+
+    # AND the snapshot should hold the updated product
+    assert catalog_store.catalog[product_id].price == 5
+
+    # AND the statistics should move the product to its new price without changing the product count
+    stats = catalog_store.applied_stats[0]
+    assert stats.product_count == 0
+    assert stats.price_counts == {1: -1, 5: 1}
+    assert stats.price_sum == 4
+
+
+def test_process_stream_invalidates_shared_cache():
+    # GIVEN a DynamoDB stream event for a product held in the shared cache
+    product_id = '8c18c85a-0f10-4b73-b54a-07ab0d381018'
+    cache_backend = InMemoryCacheBackend()
+    cache_backend.set(get_product_key(product_id), '{}', ttl_seconds=60)
+
+    # WHEN process_stream is called with the cache backend
+    process_stream(
+        event=generate_dynamodb_modify_stream_event(product_id=product_id),
+        context=generate_context(),
+        event_handler=FakeEventHandler(),
+        cache_backend=cache_backend,
+    )
+
+    # THEN the changed product should be dropped from the shared cache
+    assert cache_backend.get(get_product_key(product_id)) is None
+
+
 # NOTE: this should fail once we have schema validation
 def test_process_stream_with_empty_records():
     # GIVEN an empty DynamoDB stream event
@@ -29,3 +94,21 @@ def test_process_stream_with_empty_records():
     # THEN the fake event handler should emit these product notifications
     # and no errors should have been raised
     assert len(event_store) == 0
+
+
+def test_process_stream_skips_notification_of_unchanged_product():
+    # GIVEN a DynamoDB stream event that rewrites a product without changing it, as the recency bucket backfill does
+    product_id = '8c18c85a-0f10-4b73-b54a-07ab0d381018'
+    dynamodb_stream_events = generate_dynamodb_modify_stream_event(product_id=product_id, old_price=1, new_price=1)
+    event_store = FakeEventHandler()
+    catalog_store = FakeCatalogHandler()
+
+    # WHEN process_stream is called with custom handlers
+    process_stream(event=dynamodb_stream_events, context=generate_context(), event_handler=event_store, catalog_handler=catalog_store)
+
+    # THEN no notification should be emitted
+    assert not event_store.published_payloads
+
+    # AND the product should still be written to the snapshot, without changing the statistics counters
+    assert catalog_store.catalog[product_id].price == 1
+    assert catalog_store.applied_stats == [CatalogStatsDelta()]
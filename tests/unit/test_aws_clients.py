@@ -0,0 +1,77 @@
+import pytest
+from botocore.stub import Stubber
+
+from product.aws_clients import get_dynamodb_resource, get_events_client, new_dynamodb_resource, prime_clients
+from product.constants import AWS_CLIENT_CONNECT_TIMEOUT_SECONDS, AWS_CLIENT_MAX_POOL_CONNECTIONS, AWS_LAMBDA_FUNCTION_NAME_ENV
+
+DESCRIBE_ENDPOINTS_RESPONSE = {'Endpoints': [{'Address': 'dynamodb.us-east-1.amazonaws.com', 'CachePeriodInMinutes': 1440}]}
+
+
+def test_clients_are_created_once_with_tuned_config():
+    # GIVEN the container wide clients
+
+    # WHEN getting them more than once
+    dynamodb = get_dynamodb_resource()
+    events = get_events_client()
+
+    # THEN the same clients should be returned, with the tuned botocore configuration
+    assert get_dynamodb_resource() is dynamodb
+    assert get_events_client() is events
+    config = dynamodb.meta.client.meta.config
+    assert config.connect_timeout == AWS_CLIENT_CONNECT_TIMEOUT_SECONDS
+    assert config.max_pool_connections == AWS_CLIENT_MAX_POOL_CONNECTIONS
+    assert config.tcp_keepalive
+
+
+def test_thread_resources_are_not_shared():
+    # GIVEN the container wide DynamoDB resource
+    dynamodb = get_dynamodb_resource()
+
+    # WHEN creating a resource for a worker thread
+    thread_dynamodb = new_dynamodb_resource()
+
+    # THEN it should be a new resource with the same configuration
+    assert thread_dynamodb is not dynamodb
+    assert thread_dynamodb.meta.client.meta.config.connect_timeout == AWS_CLIENT_CONNECT_TIMEOUT_SECONDS
+
+
+def test_prime_clients_in_lambda(monkeypatch: pytest.MonkeyPatch):
+    # GIVEN a Lambda environment
+    monkeypatch.setenv(AWS_LAMBDA_FUNCTION_NAME_ENV, 'test')
+
+    with Stubber(get_dynamodb_resource().meta.client) as stubber:
+        stubber.add_response(method='describe_endpoints', service_response=DESCRIBE_ENDPOINTS_RESPONSE)
+
+        # WHEN priming the DynamoDB client
+        prime_clients('dynamodb')
+
+        # THEN a priming request should be sent
+        stubber.assert_no_pending_responses()
+
+
+def test_prime_clients_ignores_errors(monkeypatch: pytest.MonkeyPatch):
+    # GIVEN a Lambda environment whose role can't call the priming API
+    monkeypatch.setenv(AWS_LAMBDA_FUNCTION_NAME_ENV, 'test')
+
+    with Stubber(get_events_client()) as stubber:
+        stubber.add_client_error(method='list_event_buses', service_error_code='AccessDeniedException')
+
+        # WHEN priming the EventBridge client
+        # THEN the error should not be raised, the connection is opened either way
+        prime_clients('events')
+        stubber.assert_no_pending_responses()
+
+
+def test_prime_clients_outside_lambda(monkeypatch: pytest.MonkeyPatch):
+    # GIVEN a non Lambda environment, e.g. tests
+    monkeypatch.delenv(AWS_LAMBDA_FUNCTION_NAME_ENV, raising=False)
+
+    with Stubber(get_dynamodb_resource().meta.client) as stubber:
+        stubber.add_response(method='describe_endpoints', service_response=DESCRIBE_ENDPOINTS_RESPONSE)
+
+        # WHEN priming the DynamoDB client
+        prime_clients('dynamodb')
+
+        # THEN no request should be sent
+        with pytest.raises(AssertionError):
+            stubber.assert_no_pending_responses()
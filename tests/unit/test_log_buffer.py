@@ -0,0 +1,95 @@
+import io
+import json
+import logging
+from uuid import uuid4
+
+import pytest
+from aws_lambda_powertools.logging.logger import Logger
+
+from product.log_buffer import BufferedLogHandler, lazy, log_json_default
+
+
+def build_logger(handler: BufferedLogHandler, level: str = 'INFO') -> Logger:
+    # a new service name per logger, Powertools configures a logger name only once
+    logger = Logger(service=f'log-buffer-{uuid4()}', level=level, logger_handler=handler, json_default=log_json_default)
+    if handler.buffer_enabled:
+        handler.emit_level = logger.log_level
+        logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def emitted(stream: io.StringIO) -> list[dict]:
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_debug_logs_are_dropped_by_successful_invocations():
+    # GIVEN a buffering logger, and a debug log with an expensive payload
+    stream = io.StringIO()
+    handler = BufferedLogHandler(buffer_enabled=True, stream=stream)
+    logger = build_logger(handler)
+    evaluated: list[bool] = []
+
+    @handler.buffer_invocation
+    def lambda_handler(event: dict, context: object) -> str:
+        logger.debug('payload', payload=lazy(lambda: evaluated.append(True)))
+        logger.info('handled')
+        return 'ok'
+
+    # WHEN the invocation succeeds
+    assert lambda_handler({}, None) == 'ok'
+
+    # THEN only the info log should be emitted, the debug payload is never computed
+    assert [record['message'] for record in emitted(stream)] == ['handled']
+    assert not evaluated
+
+
+def test_debug_logs_are_emitted_by_failing_invocations():
+    # GIVEN a buffering logger, and an invocation logging debug records with changing keys before it fails
+    stream = io.StringIO()
+    handler = BufferedLogHandler(buffer_enabled=True, stream=stream)
+    logger = build_logger(handler)
+
+    @handler.buffer_invocation
+    def lambda_handler(event: dict, context: object) -> None:
+        logger.append_keys(product_id='first')
+        logger.debug('payload', payload=lazy(lambda: {'id': 'first'}))
+        logger.append_keys(product_id='second')
+        raise ValueError('failed')
+
+    # WHEN the invocation fails
+    with pytest.raises(ValueError):
+        lambda_handler({}, None)
+
+    # THEN the debug record should be emitted with its lazy payload and the keys it was logged with
+    [record] = emitted(stream)
+    assert (record['message'], record['payload'], record['product_id']) == ('payload', {'id': 'first'}, 'first')
+
+
+def test_error_log_flushes_buffer_first():
+    # GIVEN a buffering logger holding a debug record
+    stream = io.StringIO()
+    handler = BufferedLogHandler(buffer_enabled=True, stream=stream)
+    logger = build_logger(handler)
+    handler.start_invocation()
+    logger.debug('context')
+
+    # WHEN logging an error, handled by the invocation
+    logger.error('handled error')
+
+    # THEN the buffered record should be emitted right before the error
+    assert [record['message'] for record in emitted(stream)] == ['context', 'handled error']
+
+
+def test_info_logs_are_sampled_by_invocation():
+    # GIVEN a logger emitting the info logs of no invocation, without a buffer
+    stream = io.StringIO()
+    handler = BufferedLogHandler(info_sample_rate=0.0, stream=stream)
+    logger = build_logger(handler)
+
+    # WHEN an invocation logs info and warning records
+    handler.start_invocation()
+    logger.info('sampled out')
+    logger.warning('always emitted')
+
+    # THEN only the warning should be emitted
+    assert [record['message'] for record in emitted(stream)] == ['always emitted']